@@ -185,8 +185,8 @@ class GUICore(Core, QtCore.QObject):
 
         return new_project
 
-    def load_project(self, load_path):
-        core_project = super().load_project(load_path)
+    def load_project(self, load_path, lazy=False):
+        core_project = super().load_project(load_path, lazy=lazy)
 
         gui_project = GUIProject("temp")
         gui_project._load(core_project)
@@ -167,8 +167,13 @@ class ThreadOpen(QtCore.QThread):
                 )
                 raise ValueError(errStr)
 
-            # Load up the project
-            load_project = self._core.load_project(prj_file_path)
+            # Load up the project. Data in a .dtox file is read from a
+            # temporary directory that is removed below, so it can not be
+            # loaded lazily.
+            load_project = self._core.load_project(
+                prj_file_path,
+                lazy=dto_dir_path is None,
+            )
             self._project = load_project
 
             # Load up the scope and activated interfaces if found
@@ -18,11 +18,14 @@ import logging
 import os
 import shutil
 import tempfile
-from copy import deepcopy
+import uuid
+import weakref
+from copy import copy, deepcopy
 from pathlib import Path
 from typing import Optional, Union
 
 import matplotlib.pyplot as plt
+from mdo_engine.boundary.data import SerialBox
 from mdo_engine.boundary.interface import (
     AutoInterface,
     Interface,
@@ -49,7 +52,12 @@ from dtocean_plugins.plots.base import PlotInterface
 
 from . import data as core_data
 from .utils.database import MIN_DB_VERSION, get_database
-from .utils.files import package_dir, unpack_archive
+from .utils.files import (
+    is_random_access,
+    list_archive,
+    package_dir,
+    unpack_archive,
+)
 
 StrOrPath = Union[str, Path]
 
@@ -437,10 +445,14 @@ class Project:
 
         return result
 
-    def to_project(self):
+    def to_project(self, shallow_pool=False):
         new_project = Project(self.title)
 
-        new_project._pool = deepcopy(self._pool)  # pylint: disable=protected-access
+        if shallow_pool:
+            new_project._pool = copy(self._pool)  # pylint: disable=protected-access
+        else:
+            new_project._pool = deepcopy(self._pool)  # pylint: disable=protected-access
+
         new_project._simulations = deepcopy(self._simulations)  # pylint: disable=protected-access
         new_project._active_index = self._active_index  # pylint: disable=protected-access
         new_project._db_cred = deepcopy(self._db_cred)  # pylint: disable=protected-access
@@ -615,29 +627,74 @@ class Core:
 
         return new_project
 
-    def dump_project(self, project, dump_path: StrOrPath):
+    def dump_project(
+        self,
+        project,
+        dump_path: StrOrPath,
+        incremental=False,
+        codec="gz",
+        level=6,
+        binary=False,
+    ):
+        """Save a project to a .dtop file or an existing directory.
+
+        If incremental is True, dump_path must be a directory. Data files
+        are named by the hash of their contents and only data that has
+        changed since the project was last saved to the directory is
+        written. The project file is replaced once all new files are
+        written, after which data files and simulation directories that
+        are no longer used are removed.
+
+        If binary is True, array data is saved in binary .npz or netCDF
+        files rather than JSON. Projects saved this way can not be opened
+        by versions of DTOcean that only read JSON data files.
+
+        The codec and level arguments set the .dtop archive type and
+        compression level (see dtocean_core.utils.files.package_dir). Only
+        "zip" archives can be loaded without extracting every data file
+        (see load_project).
+        """
+
         dump_path = Path(dump_path)
 
+        if incremental and not dump_path.is_dir():
+            errStr = (
+                "Argument dump_path must be an existing directory for "
+                "incremental saving"
+            )
+            raise ValueError(errStr)
+
         # A data store is required
         data_store = DataStorage(core_data)
 
-        dtop_dir_path = tempfile.mkdtemp()
+        if incremental:
+            dtop_dir_path = str(dump_path)
+        else:
+            dtop_dir_path = tempfile.mkdtemp()
+
+            # Deferred data may be read from the archive or directory that
+            # is about to be replaced, so load it first
+            project.get_pool().load_deferred()
 
-        # Copy the project before editing and ensure type Project
-        project_copy = project.to_project()
+        # Copy the project before editing and ensure type Project. The data
+        # objects are not altered when serialising, so they can be shared
+        # when saving incrementally.
+        project_copy = project.to_project(shallow_pool=incremental)
 
         # Serialise the pool
         pool_dir = os.path.join(dtop_dir_path, "pool")
 
-        if os.path.exists(pool_dir):
+        if os.path.exists(pool_dir) and not incremental:
             shutil.rmtree(pool_dir)
-        os.makedirs(pool_dir)
+        os.makedirs(pool_dir, exist_ok=True)
 
         pool = project_copy.get_pool()
         serial_pool = data_store.serialise_pool(
             pool,
             pool_dir,
             root_dir=dtop_dir_path,
+            incremental=incremental,
+            binary=binary,
         )
 
         # Now iterate through the simulations
@@ -645,13 +702,20 @@ class Core:
 
         for i, simulation in enumerate(project_copy._simulations):
             sim_dir_name = "simulation_{}".format(i)
+
+            # When saving incrementally, write each simulation to a new
+            # directory so that the previous save stays complete until the
+            # project file is replaced
+            if incremental:
+                sim_dir_name = "{}_{}".format(sim_dir_name, uuid.uuid4().hex)
+
             sim_dir = os.path.join(dtop_dir_path, sim_dir_name)
 
             if os.path.exists(sim_dir):
                 shutil.rmtree(sim_dir)
             os.makedirs(sim_dir)
 
-            sim_file_name = "{}.json".format(sim_dir_name)
+            sim_file_name = "simulation_{}.json".format(i)
             sim_file_path = os.path.join(sim_dir, sim_file_name)
 
             serial_sim = self.control.serialise_simulation(
@@ -685,10 +749,20 @@ class Core:
             "active_index": project._active_index,
         }
         project_file_path = os.path.join(dtop_dir_path, "project.json")
+        temp_file_path = project_file_path + ".tmp"
 
-        with open(project_file_path, "w") as fstream:
+        # Replace the project file in one step, so an interrupted save
+        # leaves the previous one intact
+        with open(temp_file_path, "w") as fstream:
             json.dump(serial_project, fstream)
 
+        os.replace(temp_file_path, project_file_path)
+
+        if incremental:
+            _record_saved_pool(project.get_pool(), pool)
+            _remove_unused_files(dtop_dir_path, serial_pool, sim_dicts)
+            return
+
         # OK need to consider if we want a dtop file or a directory first.
         if dump_path.suffix == ".dtop":
             archive = True
@@ -702,21 +776,47 @@ class Core:
             raise ValueError(errStr)
 
         # Package the directory
-        package_dir(dtop_dir_path, dump_path, archive)
+        package_dir(dtop_dir_path, dump_path, archive, codec, level)
+
+    def load_project(self, load_path, lazy=False):
+        """Load a project from a .dtop file or a directory. If lazy is True,
+        each data object is only deserialised when it is first retrieved
+        from the project pool.
+
+        Data files are also extracted on first retrieval for .dtop files
+        that support random access (zip archives). Tar archives, which
+        dump_project writes by default, must be read in full, so they are
+        always extracted when loaded.
+        """
 
-    def load_project(self, load_path):
         # A data store is required
         data_store = DataStorage(core_data)
 
         # Flag to remove project directory
         remove_dtop_dir = False
 
+        # Flag to extract data files from the archive on first use
+        extract_on_load = False
+
         # OK need to consider if we have a dtop file or a directory first.
         # If its a dtop file them unzip it.
         if os.path.isfile(load_path) and ".dtop" in load_path:
-            # Unzip the file to a temporary directory
+            # Unzip the file to a temporary directory. For lazy loading of
+            # archives with random access only the project structure is
+            # extracted now.
             dtop_dir_path = tempfile.mkdtemp()
-            unpack_archive(load_path, dtop_dir_path)
+            extract_on_load = lazy and is_random_access(load_path)
+
+            if extract_on_load:
+                members = [
+                    name
+                    for name in list_archive(load_path)
+                    if not name.startswith("pool/")
+                ]
+                unpack_archive(load_path, dtop_dir_path, members)
+            else:
+                unpack_archive(load_path, dtop_dir_path)
+
             remove_dtop_dir = True
 
         elif os.path.isdir(load_path):
@@ -773,15 +873,46 @@ class Core:
             root_dir=dtop_dir_path,
             warn_missing=True,
             warn_load=True,
+            lazy=lazy,
         )
 
+        # Record where the data is stored in a project directory, so that
+        # incremental saves to the same directory do not rewrite it
+        if not remove_dtop_dir:
+            pool_dir = os.path.join(dtop_dir_path, "pool")
+
+            for data_index, value in serial_project["pool"]["data"].items():
+                data_box = SerialBox(value["identifier"], value["load_dict"])
+                data_store.set_saved_box(
+                    pool,
+                    data_index,
+                    data_box,
+                    pool_dir,
+                    root_dir=dtop_dir_path,
+                )
+
         load_project = Project(serial_project["title"], pool)
         load_project._simulations = simulations
         load_project._active_index = serial_project["active_index"]
 
-        # Remove the project directory if necessary
+        if extract_on_load and pool.loader is not None:
+            deferred = [index for index in pool if pool.is_deferred(index)]
+            loader = _extract_on_load(pool.loader, load_path, dtop_dir_path)
+            pool.set_loader(loader, deferred)
+
+        # Remove the project directory if necessary. Deferred data is read
+        # from the directory, so keep it until the pool loader (which is
+        # shared by copies of the pool) is released.
         if remove_dtop_dir:
-            shutil.rmtree(dtop_dir_path)
+            if pool.loader is None:
+                shutil.rmtree(dtop_dir_path)
+            else:
+                weakref.finalize(
+                    pool.loader,
+                    shutil.rmtree,
+                    dtop_dir_path,
+                    ignore_errors=True,
+                )
 
         # Reset the input / output statuses
         for simulation in simulations:
@@ -1032,7 +1163,14 @@ class Core:
 
         self.set_interface_status(project)
 
-    def dump_datastate(self, project, dump_path, mask=None):
+    def dump_datastate(
+        self,
+        project,
+        dump_path,
+        mask=None,
+        codec="gz",
+        level=6,
+    ):
         data_store = DataStorage(core_data)
 
         def get_subsets():
@@ -1096,7 +1234,7 @@ class Core:
             raise ValueError(errStr)
 
         # Package the directory
-        package_dir(dtos_dir_path, dump_path, archive)
+        package_dir(dtos_dir_path, dump_path, archive, codec, level)
 
     def load_datastate(self, project, load_path, exclude=None, overwrite=True):
         # A data store is required
@@ -2042,3 +2180,50 @@ class Connector:
                 "Not all inputs of interface {} have been " "satisfied."
             ).format(interface_name)
             raise ValueError(errStr)
+
+
+def _extract_on_load(loader, archive_path, dst_dir_path):
+    """Wrap a pool loader to extract the data file of each SerialBox from
+    the given archive before it is loaded"""
+
+    def extract_and_load(data_index, data_box):
+        member = data_box.load_dict["file_path"]
+        unpack_archive(archive_path, dst_dir_path, [member])
+
+        return loader(data_index, data_box)
+
+    return extract_and_load
+
+
+def _record_saved_pool(pool: DataPool, saved_pool: DataPool):
+    """Copy the saved records from a serialised copy of the pool to the
+    original"""
+
+    for data_index in saved_pool:
+        record = saved_pool.get_saved(data_index)
+
+        if record is not None:
+            pool.set_saved(data_index, record)
+
+
+def _remove_unused_files(dtop_dir_path, serial_pool, sim_dicts):
+    """Remove the pool files and simulation directories of a project
+    directory that are not referenced by its project file"""
+
+    dtop_dir_path = Path(dtop_dir_path)
+    used_paths = {
+        dtop_dir_path / value["load_dict"]["file_path"]
+        for value in serial_pool["data"].values()
+    }
+
+    for file_path in (dtop_dir_path / "pool").iterdir():
+        if file_path not in used_paths:
+            file_path.unlink()
+
+    used_sim_dirs = {
+        (dtop_dir_path / sim_dict["file_path"]).parent for sim_dict in sim_dicts
+    }
+
+    for sim_dir in dtop_dir_path.glob("simulation_*"):
+        if sim_dir.is_dir() and sim_dir not in used_sim_dirs:
+            shutil.rmtree(sim_dir)
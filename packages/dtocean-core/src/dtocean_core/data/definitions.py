@@ -58,6 +58,9 @@ Structure.immutables.extend([Point, Polygon])
 
 BLUE = "#6699cc"
 
+# Attribute storing the structure version in binary netCDF files
+_NETCDF_VERSION_ATTR = "structure_version"
+
 
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -861,7 +864,11 @@ class TriStateIndexTable(IndexTable):
 class NumpyND(Structure):
     """Numpy array. This structure is too general for most applications and so
     the get_value method deliberately raises an error. Subclasses of this class
-    should be used instead."""
+    should be used instead.
+
+    Arrays without object types are saved in binary .npz format."""
+
+    binary_suffix = ".npz"
 
     @property
     def version(self):
@@ -898,6 +905,24 @@ class NumpyND(Structure):
 
         return np.array(value)
 
+    def can_save_binary(self, value: Any) -> bool:
+        return isinstance(value, np.ndarray) and value.dtype.kind != "O"
+
+    @staticmethod
+    def toBinary(value: np.ndarray, file_path: Path, version: int) -> None:
+        with open(file_path, "wb") as fstream:
+            np.savez(fstream, version=version, value=value)
+
+    @staticmethod
+    def fromBinary(file_path: Path) -> np.ndarray:
+        with np.load(file_path) as npz:
+            version = int(npz["version"])
+
+            if version != 1:
+                raise RuntimeError("Data version not recognised")
+
+            return npz["value"]
+
 
 class Numpy2D(NumpyND):
     """Numpy2D array."""
@@ -4394,7 +4419,10 @@ class XGridND(Structure):
     """xrarray DataArray object. See xarray.pydata.org
 
     Note: This class should not be used directly, subclass and set get_n_dims
-    to an integer value."""
+    to an integer value. Objects with only numeric and datetime variables are
+    saved in binary netCDF format."""
+
+    binary_suffix = ".nc"
 
     @property
     def version(self):
@@ -4526,6 +4554,21 @@ class XGridND(Structure):
 
         return xr.DataArray.from_dict(json.loads(data, cls=DateTimeDecoder))
 
+    def can_save_binary(self, value: Any) -> bool:
+        return value is not None and _is_netcdf_compatible(value)
+
+    @staticmethod
+    def toBinary(value: xr.DataArray, file_path: Path, version: int) -> None:
+        value = value.assign_attrs({_NETCDF_VERSION_ATTR: version})
+        value.to_netcdf(file_path, format="NETCDF4")
+
+    @staticmethod
+    def fromBinary(file_path: Path) -> xr.DataArray:
+        value = xr.load_dataarray(file_path)
+        _check_netcdf_version(value)
+
+        return value
+
     @staticmethod
     def auto_file_input(auto: FileMixin):
         auto.check_path(True)
@@ -4764,6 +4807,18 @@ class XSetND(XGridND):
 
         return xr.Dataset.from_dict(json.loads(data, cls=DateTimeDecoder))
 
+    @staticmethod
+    def toBinary(value: xr.Dataset, file_path: Path, version: int) -> None:
+        value = value.assign_attrs({_NETCDF_VERSION_ATTR: version})
+        value.to_netcdf(file_path, format="NETCDF4")
+
+    @staticmethod
+    def fromBinary(file_path: Path) -> xr.Dataset:
+        value = xr.load_dataset(file_path)
+        _check_netcdf_version(value)
+
+        return value
+
     @staticmethod
     def auto_file_input(auto: FileMixin):
         auto.check_path(True)
@@ -4975,6 +5030,39 @@ class Network(Structure):
         return [".yaml"]
 
 
+def _is_netcdf_compatible(value: xr.DataArray | xr.Dataset) -> bool:
+    """Check that the variables of the given xarray object are numeric or
+    datetimes and that all attributes are strings or numbers, so that it can
+    be written to netCDF without changing its types"""
+
+    variables = list(value.coords.values())
+
+    if isinstance(value, xr.DataArray):
+        variables.append(value)
+    else:
+        variables.extend(value.data_vars.values())
+
+    for variable in variables:
+        if variable.dtype.kind not in "iufcmM":
+            return False
+
+    for variable in variables + [value]:
+        for attr in variable.attrs.values():
+            if isinstance(attr, bool) or not isinstance(
+                attr, (str, int, float)
+            ):
+                return False
+
+    return True
+
+
+def _check_netcdf_version(value: xr.DataArray | xr.Dataset):
+    version = value.attrs.pop(_NETCDF_VERSION_ATTR, None)
+
+    if version != 1:
+        raise RuntimeError("Data version not recognised")
+
+
 def _quantity_to_counter(d):
     for key, value in d.items():
         if key == "quantity":
@@ -35,7 +35,7 @@ from packaging.version import Version
 from pandas.api.types import is_integer_dtype
 from polite_config.configuration import ReadYAML
 from polite_config.paths import ModPath, UserDataPath
-from shapely import Point, get_srid, set_srid, wkt
+from shapely import get_coordinates, get_srid, get_type_id, set_srid, wkt
 from sqlalchemy.dialects import postgresql
 
 from .files import onerror
@@ -45,6 +45,28 @@ module_logger = logging.getLogger(__name__)
 
 MIN_DB_VERSION = "2025.04.0"
 
+# Column types of the bathymetry and tidal time series queries, with the
+# point geometries extracted as x and y coordinates
+BATHY_COLUMNS = {
+    "x": float,
+    "y": float,
+    "depth": float,
+    "layer_order": int,
+    "initial_depth": float,
+    "sediment_type": object,
+}
+
+TIDAL_SERIES_COLUMNS = {
+    "x": float,
+    "y": float,
+    "measure_date": object,
+    "measure_time": object,
+    "u": float,
+    "v": float,
+    "turbulence_intensity": float,
+    "ssh": float,
+}
+
 
 def bathy_records_to_strata(bathy_records=None, pre_bathy=None):
     """Convert the bathymetry layers table returned by the database into
@@ -75,23 +97,25 @@ def bathy_records_to_strata(bathy_records=None, pre_bathy=None):
     msg = "Building layers..."
     module_logger.debug(msg)
 
-    layers = list(set(bathy_table["layer_order"]))
-    layers.sort()
-
-    bathy_layer_groups = bathy_table.groupby("layer_order")
-
-    layer_depths = []
-    layer_sediments = []
+    layers, layer_idxs = np.unique(
+        bathy_table["layer_order"].to_numpy(),
+        return_inverse=True,
+    )
+    layers = layers.tolist()
 
-    for layer in layers:
-        layer_table = bathy_layer_groups.get_group(layer)
-        layer_depth, layer_sediment = build_bathy_layer(layer_table, xi, yj)
+    xidxs = get_grid_indices(bathy_table["x"], xi)
+    yidxs = get_grid_indices(bathy_table["y"], yj)
+    shape = [len(xi), len(yj), len(layers)]
 
-        layer_depths.append(layer_depth)
-        layer_sediments.append(layer_sediment)
+    depth_array = np.full(shape, np.nan)
+    sediment_array = np.full(shape, None, dtype="object")
 
-    depth_array = np.dstack(layer_depths)
-    sediment_array = np.dstack(layer_sediments)
+    depth_array[xidxs, yidxs, layer_idxs] = (
+        bathy_table["depth"] - bathy_table["initial_depth"]
+    ).to_numpy()
+    sediment_array[xidxs, yidxs, layer_idxs] = bathy_table[
+        "sediment_type"
+    ].to_numpy()
 
     layer_names = ["layer {}".format(x) for x in layers]
 
@@ -111,6 +135,28 @@ def bathy_records_to_strata(bathy_records=None, pre_bathy=None):
     return raw_strata
 
 
+def bathy_arrays_to_strata(bathy_arrays, decimals=2):
+    """Convert the bathymetry layer columns returned by read_query_arrays,
+    with the point coordinates given in columns x and y, into Strata
+    structure raw input"""
+
+    bathy_table = pd.DataFrame(bathy_arrays)
+
+    if bathy_table.empty:
+        module_logger.warning("No bathymetric points found")
+        return None
+
+    bathy_table["x"] = bathy_table["x"].round(decimals)
+    bathy_table["y"] = bathy_table["y"].round(decimals)
+
+    msg = "Getting grid extents..."
+    module_logger.debug(msg)
+
+    xi, yj = get_grid_coords(bathy_table)
+
+    return bathy_records_to_strata(pre_bathy=(bathy_table, xi, yj))
+
+
 def tidal_series_records_to_xset(tidal_records):
     """Convert the bathymetry layers table returned by the database into
     tidal time series structure raw input"""
@@ -141,6 +187,28 @@ def tidal_series_records_to_xset(tidal_records):
 
     tidal_table = point_to_xy(tidal_table)
 
+    return _tidal_table_to_xset(tidal_table, loop_start_time)
+
+
+def tidal_series_arrays_to_xset(tidal_arrays, decimals=2):
+    """Convert the tidal time series columns returned by read_query_arrays,
+    with the point coordinates given in columns x and y, into tidal time
+    series structure raw input"""
+
+    loop_start_time = time.process_time()
+
+    tidal_table = pd.DataFrame(tidal_arrays)
+
+    if tidal_table.empty:
+        return None
+
+    tidal_table["x"] = tidal_table["x"].round(decimals)
+    tidal_table["y"] = tidal_table["y"].round(decimals)
+
+    return _tidal_table_to_xset(tidal_table, loop_start_time)
+
+
+def _tidal_table_to_xset(tidal_table, loop_start_time):
     msg = "Getting grid extents..."
     module_logger.debug(msg)
 
@@ -164,31 +232,24 @@ def tidal_series_records_to_xset(tidal_records):
     msg = "Building time steps..."
     module_logger.debug(msg)
 
-    steps = list(set(tidal_table["datetime"]))
-    steps.sort()
-
-    tidal_table_groups = tidal_table.groupby("datetime")
+    step_idxs, steps = pd.factorize(tidal_table["datetime"], sort=True)
+    steps = list(steps)
 
-    u_steps = []
-    v_steps = []
-    ssh_steps = []
-    ti_steps = []
-
-    for step in steps:
-        step_table = tidal_table_groups.get_group(step)
-        (u_step, v_step, ssh_step, ti_step) = build_tidal_series_step(
-            step_table, xi, yj
-        )
+    xidxs = get_grid_indices(tidal_table["x"], xi)
+    yidxs = get_grid_indices(tidal_table["y"], yj)
+    shape = [len(xi), len(yj), len(steps)]
 
-        u_steps.append(u_step)
-        v_steps.append(v_step)
-        ssh_steps.append(ssh_step)
-        ti_steps.append(ti_step)
+    u_array = np.full(shape, np.nan)
+    v_array = np.full(shape, np.nan)
+    ssh_array = np.full(shape, np.nan)
+    ti_array = np.full(shape, np.nan)
 
-    u_array = np.dstack(u_steps)
-    v_array = np.dstack(v_steps)
-    ssh_array = np.dstack(ssh_steps)
-    ti_array = np.dstack(ti_steps)
+    u_array[xidxs, yidxs, step_idxs] = tidal_table["u"].to_numpy()
+    v_array[xidxs, yidxs, step_idxs] = tidal_table["v"].to_numpy()
+    ssh_array[xidxs, yidxs, step_idxs] = tidal_table["ssh"].to_numpy()
+    ti_array[xidxs, yidxs, step_idxs] = tidal_table[
+        "turbulence_intensity"
+    ].to_numpy()
 
     raw = {
         "values": {
@@ -241,20 +302,12 @@ def point_to_xy(
     decimals=2,
     drop_point_column=True,
 ):
-    x = []
-    y = []
+    points = df[point_column].to_numpy()
+    assert (get_type_id(points) == 0).all()
 
-    for point in df[point_column]:
-        assert isinstance(point, Point)
-        coords = list(point.coords)[0]
-        x.append(coords[0])
-        y.append(coords[1])
-
-    x = np.array(x)
-    x = x.round(decimals)
-
-    y = np.array(y)
-    y = y.round(decimals)
+    coords = get_coordinates(points)
+    x = coords[:, 0].round(decimals)
+    y = coords[:, 1].round(decimals)
 
     df["x"] = x
     df["y"] = y
@@ -309,47 +362,78 @@ def get_grid_coords(df: pd.DataFrame, xlabel="x", ylabel="y"):
     return xi, yj
 
 
-def build_bathy_layer(layer_table, xi, yj):
-    depth_array = np.zeros([len(xi), len(yj)]) * np.nan
-    sediment_array = np.full([len(xi), len(yj)], None, dtype="object")
+def get_grid_indices(values, grid, tol=1e-6):
+    """Return the indices of the given coordinates in the sorted vector of
+    grid coordinates. Coordinates may differ from the grid by up to the given
+    tolerance, to allow for floating point noise.
 
-    for record in layer_table.itertuples():
-        xidxs = np.where(xi == record.x)[0]
-        assert len(xidxs) == 1
-        xidx = xidxs[0]
+    Args:
+        values (array-like): coordinates to locate
+        grid (numpy.ndarray): sorted grid coordinates
+        tol (float, optional): maximum allowed distance between a coordinate
+            and its grid point. Defaults to 1e-6.
 
-        yidxs = np.where(yj == record.y)[0]
-        assert len(yidxs) == 1
-        yidx = yidxs[0]
+    Returns:
+        numpy.ndarray: integer indices into grid
 
-        depth = record.depth - record.initial_depth
-        sediment = record.sediment_type
+    Raises:
+        ValueError: if any coordinate does not lie on the grid
+    """
 
-        depth_array[xidx, yidx] = depth
-        sediment_array[xidx, yidx] = sediment
+    values = np.asarray(values, dtype=float)
+    grid = np.asarray(grid, dtype=float)
+
+    if len(grid) == 0:
+        if len(values) == 0:
+            return np.zeros(0, dtype=int)
+        raise ValueError("Grid coordinates are empty")
+
+    right = np.searchsorted(grid, values).clip(0, len(grid) - 1)
+    left = (right - 1).clip(0, None)
+
+    use_left = np.abs(values - grid[left]) < np.abs(values - grid[right])
+    idxs = np.where(use_left, left, right)
+
+    off_grid = ~(np.abs(values - grid[idxs]) <= tol)
+
+    if off_grid.any():
+        errStr = (
+            "{} coordinate(s) do not lie on the grid. First bad coordinate "
+            "is {}"
+        ).format(off_grid.sum(), values[off_grid][0])
+        raise ValueError(errStr)
+
+    return idxs
+
+
+def build_bathy_layer(layer_table, xi, yj):
+    xidxs = get_grid_indices(layer_table["x"], xi)
+    yidxs = get_grid_indices(layer_table["y"], yj)
+
+    depth_array = np.full([len(xi), len(yj)], np.nan)
+    sediment_array = np.full([len(xi), len(yj)], None, dtype="object")
+
+    depth_array[xidxs, yidxs] = (
+        layer_table["depth"] - layer_table["initial_depth"]
+    ).to_numpy()
+    sediment_array[xidxs, yidxs] = layer_table["sediment_type"].to_numpy()
 
     return depth_array, sediment_array
 
 
 def build_tidal_series_step(step_table, xi, yj):
-    u_array = np.zeros([len(xi), len(yj)]) * np.nan
-    v_array = np.zeros([len(xi), len(yj)]) * np.nan
-    ssh_array = np.zeros([len(xi), len(yj)]) * np.nan
-    ti_array = np.zeros([len(xi), len(yj)]) * np.nan
+    xidxs = get_grid_indices(step_table["x"], xi)
+    yidxs = get_grid_indices(step_table["y"], yj)
 
-    for record in step_table.itertuples():
-        xidxs = np.where(xi == record.x)[0]
-        assert len(xidxs) == 1
-        xidx = xidxs[0]
+    u_array = np.full([len(xi), len(yj)], np.nan)
+    v_array = np.full([len(xi), len(yj)], np.nan)
+    ssh_array = np.full([len(xi), len(yj)], np.nan)
+    ti_array = np.full([len(xi), len(yj)], np.nan)
 
-        yidxs = np.where(yj == record.y)[0]
-        assert len(yidxs) == 1
-        yidx = yidxs[0]
-
-        u_array[xidx, yidx] = record.u
-        v_array[xidx, yidx] = record.v
-        ssh_array[xidx, yidx] = record.ssh
-        ti_array[xidx, yidx] = record.turbulence_intensity
+    u_array[xidxs, yidxs] = step_table["u"].to_numpy()
+    v_array[xidxs, yidxs] = step_table["v"].to_numpy()
+    ssh_array[xidxs, yidxs] = step_table["ssh"].to_numpy()
+    ti_array[xidxs, yidxs] = step_table["turbulence_intensity"].to_numpy()
 
     return u_array, v_array, ssh_array, ti_array
 
@@ -392,6 +476,111 @@ def get_all_from_columns(db, schema, table, columns):
     return col_lists
 
 
+def read_query_arrays(database, query, columns, chunk_size=100000):
+    """Read the results of a query into a dictionary of numpy arrays, one per
+    column. Rows are streamed from the database in chunks, using a
+    server-side cursor where supported, and copied into preallocated arrays
+    that grow geometrically if required, so the full result set is never
+    held as Python objects.
+
+    Geometry columns should be extracted as numeric columns in the query,
+    e.g. "ST_X(utm_point) AS x, ST_Y(utm_point) AS y".
+
+    Args:
+        database (mdo_engine.utilities.database.Database): connected database
+        query (str): SQL query returning the given columns, in order
+        columns (dict): mapping of column names to numpy data types. Use
+            object for non-numeric columns.
+        chunk_size (int, optional): number of rows fetched per chunk.
+            Defaults to 100000.
+
+    Returns:
+        dict: mapping of column names to numpy arrays
+    """
+
+    if database._engine is None:
+        errStr = "No connection has been made."
+        raise IOError(errStr)
+
+    names = list(columns)
+    capacity = chunk_size
+    n_rows = 0
+
+    arrays = {
+        name: np.empty(capacity, dtype=dtype) for name, dtype in columns.items()
+    }
+
+    with database._engine.connect() as conn:
+        conn = conn.execution_options(
+            stream_results=True,
+            yield_per=chunk_size,
+        )
+
+        with conn.execute(sqlalchemy.text(query)) as result:
+            if len(result.keys()) != len(names):
+                errStr = (
+                    "Query returned {} columns but {} were expected"
+                ).format(len(result.keys()), len(names))
+                raise ValueError(errStr)
+
+            for partition in result.partitions():
+                n_chunk = len(partition)
+
+                if n_rows + n_chunk > capacity:
+                    capacity = max(2 * capacity, n_rows + n_chunk)
+                    arrays = {
+                        name: _resize_array(array, capacity)
+                        for name, array in arrays.items()
+                    }
+
+                for name, values in zip(names, zip(*partition)):
+                    arrays[name][n_rows : n_rows + n_chunk] = values
+
+                n_rows += n_chunk
+
+    arrays = {
+        name: _resize_array(array, n_rows) for name, array in arrays.items()
+    }
+
+    msg = "Read {} rows from query".format(n_rows)
+    module_logger.debug(msg)
+
+    return arrays
+
+
+def read_sql_chunks(database, query, chunk_size=100000):
+    """Yield the results of a query as DataFrames of up to chunk_size rows,
+    streamed from the database using a server-side cursor where supported"""
+
+    if database._engine is None:
+        errStr = "No connection has been made."
+        raise IOError(errStr)
+
+    with database._engine.connect() as conn:
+        conn = conn.execution_options(stream_results=True)
+
+        for chunk in pd.read_sql(
+            sqlalchemy.text(query),
+            conn,
+            chunksize=chunk_size,
+        ):
+            yield chunk
+
+
+def _resize_array(array, size):
+    # Object arrays are copied, as resizing in place does not fill new
+    # elements with None
+    if array.dtype.hasobject:
+        resized = np.empty(size, dtype=array.dtype)
+        n_copy = min(size, len(array))
+        resized[:n_copy] = array[:n_copy]
+        return resized
+
+    array.resize(size, refcheck=False)
+
+    return array
+
+
 def database_to_files(
     root_path,
     table_list,
@@ -404,6 +593,7 @@ def database_to_files(
     auto_child=False,
     prefer_csv=False,
     print_function=None,
+    chunk_size=100000,
 ):
     def _dump_child(
         root_path,
@@ -442,8 +632,64 @@ def database_to_files(
             auto_child,
             prefer_csv,
             print_function,
+            chunk_size,
         )
 
+    def _convert_table(table_df, full_dict, print_function):
+        if full_dict["stripf"] and auto_child:
+            msg_str = "Stripping column: {}".format(full_dict["join"])
+            print_function(msg_str)
+
+            table_df = table_df.drop(full_dict["join"], axis=1)
+            assert table_df is not None
+
+        if full_dict["array"] is not None:
+            array_str = ", ".join(full_dict["array"])
+            msg_str = "Coverting array columns: {}".format(array_str)
+            print_function(msg_str)
+
+            table_df = convert_array(table_df, full_dict["array"])
+
+        if full_dict["bool"] is not None:
+            bool_str = ", ".join(full_dict["bool"])
+            msg_str = "Coverting boolean columns: {}".format(bool_str)
+            print_function(msg_str)
+
+            table_df = convert_bool(table_df, full_dict["bool"])
+
+        if full_dict["geo"] is not None:
+            geo_str = ", ".join(full_dict["geo"])
+            msg_str = "Coverting Geometry columns: {}".format(geo_str)
+            print_function(msg_str)
+
+            table_df = convert_geo(table_df, full_dict["geo"])
+
+        if full_dict["time"] is not None:
+            time_str = ", ".join(full_dict["time"])
+            msg_str = "Coverting Time columns: {}".format(time_str)
+            print_function(msg_str)
+
+            table_df = convert_time(table_df, full_dict["time"])
+
+        return table_df
+
+    def _write_excel(table_df, tab_path, print_function):
+        # Create a Pandas Excel writer using XlsxWriter as the engine.
+        writer = pd.ExcelWriter(tab_path, engine="openpyxl")
+
+        # Convert the dataframe to an XlsxWriter Excel object.
+        table_df.to_excel(writer, index=False)
+
+        # Close the Pandas Excel writer and output the Excel file.
+        writer.close()
+
+        # Fit the column widths (don't let failure be catastrophic)
+        try:
+            _autofit_columns(tab_path)
+        except Exception:
+            print_function("*** Column adjust failed. Skipping. ***")
+            pass
+
     def _autofit_columns(xlpath):
         if platform.system() != "Windows":
             return
@@ -459,12 +705,11 @@ def database_to_files(
         wb.Save()
         wb.Close()
 
-    if print_function is None:
-
-        def _print_function(x: str):
-            pass
+    def _no_print_function(x: str):
+        pass
 
-        print_function = _print_function
+    if print_function is None:
+        print_function = _no_print_function
 
     # Clean and setup dump directory
     if os.path.exists(root_path):
@@ -473,7 +718,7 @@ def database_to_files(
     os.makedirs(root_path)
 
     for table_dict in table_list:
-        table_df = None
+        pkids = []
         new_name_list = None
         new_pid_list = None
         new_join_list = None
@@ -515,82 +760,73 @@ def database_to_files(
                 new_join_list,
                 where_list,
                 var_schema,
+                order_by=full_dict["pkey"],
             )
 
             msg_str = "Executing query: {}".format(query_str)
             print_function(msg_str)
 
-            # Read the table first
-            table_df = pd.read_sql(query_str, database._engine)
-
-            if full_dict["stripf"] and auto_child:
-                msg_str = "Stripping column: {}".format(full_dict["join"])
-                print_function(msg_str)
+            # Stream the table in chunks, writing to csv unless the table is
+            # small enough to be written to Excel
+            use_excel = os.name == "nt" and not prefer_csv
+            excel_chunks = []
+            n_rows = 0
+            csv_path = None
+
+            for i, chunk_df in enumerate(
+                read_sql_chunks(database, query_str, chunk_size)
+            ):
+                if i == 0:
+                    chunk_print_function = print_function
+                else:
+                    chunk_print_function = _no_print_function
 
-                table_df = table_df.drop(full_dict["join"], axis=1)
-                assert table_df is not None
+                chunk_df = _convert_table(
+                    chunk_df,
+                    full_dict,
+                    chunk_print_function,
+                )
 
-            if full_dict["array"] is not None:
-                array_str = ", ".join(full_dict["array"])
-                msg_str = "Coverting array columns: {}".format(array_str)
-                print_function(msg_str)
+                if full_dict["autokey"]:
+                    pkids.extend(chunk_df[full_dict["pkey"]])
 
-                table_df = convert_array(table_df, full_dict["array"])
+                n_rows += len(chunk_df)
 
-            if full_dict["bool"] is not None:
-                bool_str = ", ".join(full_dict["bool"])
-                msg_str = "Coverting boolean columns: {}".format(bool_str)
-                print_function(msg_str)
+                if use_excel:
+                    excel_chunks.append(chunk_df)
 
-                table_df = convert_bool(table_df, full_dict["bool"])
+                    if n_rows < 1e6:
+                        continue
 
-            if full_dict["geo"] is not None:
-                geo_str = ", ".join(full_dict["geo"])
-                msg_str = "Coverting Geometry columns: {}".format(geo_str)
-                print_function(msg_str)
+                    use_excel = False
+                    chunk_df = pd.concat(excel_chunks)
+                    excel_chunks = []
 
-                table_df = convert_geo(table_df, full_dict["geo"])
+                if csv_path is None:
+                    table_fname = full_dict["table"] + ".csv"
+                    csv_path = os.path.join(root_path, table_fname)
 
-            if full_dict["time"] is not None:
-                time_str = ", ".join(full_dict["time"])
-                msg_str = "Coverting Time columns: {}".format(time_str)
-                print_function(msg_str)
+                    msg_str = "Writing to: {}".format(csv_path)
+                    print_function(msg_str)
 
-                table_df = convert_time(table_df, full_dict["time"])
+                    chunk_df.to_csv(csv_path, index=False)
 
-            table_df.sort_values(by=[full_dict["pkey"]], inplace=True)
+                else:
+                    chunk_df.to_csv(
+                        csv_path,
+                        mode="a",
+                        header=False,
+                        index=False,
+                    )
 
-            if len(table_df) < 1e6 and os.name == "nt" and not prefer_csv:
+            if use_excel:
                 table_fname = full_dict["table"] + ".xlsx"
                 tab_path = os.path.join(root_path, table_fname)
 
                 msg_str = "Writing to: {}".format(tab_path)
                 print_function(msg_str)
 
-                # Create a Pandas Excel writer using XlsxWriter as the engine.
-                writer = pd.ExcelWriter(tab_path, engine="openpyxl")
-
-                # Convert the dataframe to an XlsxWriter Excel object.
-                table_df.to_excel(writer, index=False)
-
-                # Close the Pandas Excel writer and output the Excel file.
-                writer.close()
-
-                # Fit the column widths (don't let failure be catastrophic)
-                try:
-                    _autofit_columns(tab_path)
-                except Exception:
-                    print_function("*** Column adjust failed. Skipping. ***")
-                    pass
-
-            else:
-                table_fname = full_dict["table"] + ".csv"
-                tab_path = os.path.join(root_path, table_fname)
-
-                msg_str = "Writing to: {}".format(tab_path)
-                print_function(msg_str)
-
-                table_df.to_csv(tab_path, index=False)
+                _write_excel(pd.concat(excel_chunks), tab_path, print_function)
 
         if full_dict["children"] is not None:
             # Include pid in iteration
@@ -604,10 +840,6 @@ def database_to_files(
 
             # Check autokey
             if full_dict["autokey"]:
-                assert table_df is not None
-                pkids = table_df[full_dict["pkey"]]
-                del table_df
-
                 for pkid in pkids:
                     # Add a where
                     new_where = {"table#": table_idx, "value": pkid}
@@ -630,8 +862,6 @@ def database_to_files(
                     )
 
             else:
-                del table_df
-
                 if where_list is None:
                     new_where_list = None
                 else:
@@ -932,6 +1162,7 @@ def query_builder(
     join_list=None,
     where_list=None,
     schema=None,
+    order_by=None,
 ):
     def _add_schema(table_name, schema=None):
         if schema is None:
@@ -944,9 +1175,14 @@ def query_builder(
     consume_list = table_list[:]
     table_name = _add_schema(consume_list.pop(), schema)
 
+    if order_by is None:
+        order_str = ""
+    else:
+        order_str = "\nORDER BY {}".format(order_by)
+
     # No joins or wheres
     if pid_list is None:
-        query_str = "SELECT * FROM {};".format(table_name)
+        query_str = "SELECT * FROM {}{};".format(table_name, order_str)
         return query_str
 
     table_shorts = ["t{}".format(i) for i in range(len(table_list))]
@@ -995,7 +1231,7 @@ def query_builder(
         if where_str is not None:
             query_str += where_str
 
-    query_str += ";"
+    query_str += order_str + ";"
 
     return query_str
 
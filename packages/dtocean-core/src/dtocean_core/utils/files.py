@@ -21,15 +21,18 @@ Created on Tue Feb 23 15:38:18 2016
 .. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
 """
 
+import gzip
+import io
 import logging
 import os
 import pickle
 import shutil
 import tarfile
-import tempfile
 import time
 import zipfile
+from collections import deque
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Protocol, Union
 
@@ -53,7 +56,114 @@ def pickle_test_data(file_path, test_data_dict):
     return dst_path
 
 
-def package_dir(src_dir_path, dst_path: StrOrPath, archive=False):
+ARCHIVE_CODECS = ("gz", "zip", "tar")
+
+
+class ParallelGzipWriter(io.BufferedIOBase):
+    """Write-only file object which compresses blocks of data in parallel
+    threads and writes each block as a separate gzip member. A concatenation
+    of gzip members is a valid gzip file, so the output can be read by any
+    gzip reader. Closing the writer does not close the underlying file
+    object.
+
+    Args:
+        fileobj: binary file object to write to
+        level (int): compression level
+        n_workers (int, optional): number of compression threads. Defaults
+            to the number of CPUs.
+        block_size (int): size of the uncompressed blocks in bytes
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        level=6,
+        n_workers=None,
+        block_size=4 * 1024 * 1024,
+    ):
+        super().__init__()
+
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+
+        self._fileobj = fileobj
+        self._level = level
+        self._block_size = block_size
+        self._max_pending = 2 * n_workers
+        self._buffer = bytearray()
+        self._pending: deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(n_workers)
+        self._written = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("I/O operation on closed file")
+
+        self._buffer += data
+
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._buffer or not self._written:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            super().close()
+
+    def _submit(self, block):
+        future = self._executor.submit(
+            gzip.compress,
+            block,
+            compresslevel=self._level,
+            mtime=0,
+        )
+        self._pending.append(future)
+        self._written = True
+
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def package_dir(
+    src_dir_path,
+    dst_path: StrOrPath,
+    archive=False,
+    codec="gz",
+    level=6,
+    n_workers=None,
+):
+    """Move the contents of a directory to the destination directory or, if
+    archive is True, stream them into an archive file.
+
+    Args:
+        src_dir_path (str): directory to package, which is removed
+        dst_path (str): destination directory or archive file path
+        archive (bool): create an archive file
+        codec (str): archive type. One of "gz" (gzip compressed tar,
+            compressed in parallel), "zip" (deflate compressed zip, which
+            supports random member access) or "tar" (uncompressed tar)
+        level (int): compression level
+        n_workers (int, optional): number of threads used for gzip
+            compression. Defaults to the number of CPUs.
+    """
+
     dst_path = Path(dst_path)
 
     if not os.path.splitext(dst_path)[1]:
@@ -77,35 +187,109 @@ def package_dir(src_dir_path, dst_path: StrOrPath, archive=False):
 
         return
 
-    tgz_dir_path = tempfile.mkdtemp()
+    if codec not in ARCHIVE_CODECS:
+        err_msg = "Archive codec must be one of: {}".format(
+            ", ".join(ARCHIVE_CODECS)
+        )
+        raise ValueError(err_msg)
 
-    project_file_name = os.path.split(dst_path)[1]
-    tgz_file_name = "{}.tar.gz".format(project_file_name)
-    tgz_file_path = os.path.join(tgz_dir_path, tgz_file_name)
+    # Write next to the destination and replace it once complete
+    part_path = dst_path.with_name(dst_path.name + ".part")
 
-    with tarfile.open(tgz_file_path, "w:gz") as tar:
-        for root, dirs, files in os.walk(src_dir_path):
-            for name in files:
-                file_path = os.path.join(root, name)
-                short_path = file_path.replace(src_dir_path, "")
-                tar.add(file_path, arcname=short_path)
+    try:
+        if codec == "zip":
+            _write_zip(src_dir_path, part_path, level)
+        else:
+            _write_tar(src_dir_path, part_path, codec, level, n_workers)
 
-    shutil.copyfile(tgz_file_path, dst_path)
+        os.replace(part_path, dst_path)
+
+    finally:
+        if part_path.exists():
+            part_path.unlink()
 
     rmtree_retry(src_dir_path, fail_silent=True)
-    rmtree_retry(tgz_dir_path, fail_silent=True)
 
 
-def unpack_archive(src_path, dst_path):
+def _iter_dir_files(src_dir_path):
+    for root, _, files in os.walk(src_dir_path):
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            arcname = Path(os.path.relpath(file_path, src_dir_path))
+            yield file_path, arcname.as_posix()
+
+
+def _write_zip(src_dir_path, dst_path, level):
+    with zipfile.ZipFile(
+        dst_path,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=level,
+    ) as zf:
+        for file_path, arcname in _iter_dir_files(src_dir_path):
+            zf.write(file_path, arcname)
+
+
+def _write_tar(src_dir_path, dst_path, codec, level, n_workers):
+    with open(dst_path, "wb") as fstream:
+        if codec == "gz":
+            writer = ParallelGzipWriter(fstream, level, n_workers)
+        else:
+            writer = fstream
+
+        try:
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+                for file_path, arcname in _iter_dir_files(src_dir_path):
+                    tar.add(file_path, arcname=arcname)
+
+        finally:
+            if codec == "gz":
+                writer.close()
+
+
+def is_random_access(src_path) -> bool:
+    """Return True if the members of the given archive can be extracted
+    individually without reading the whole archive"""
+    return not tarfile.is_tarfile(src_path) and zipfile.is_zipfile(src_path)
+
+
+def list_archive(src_path) -> list[str]:
+    if tarfile.is_tarfile(src_path):
+        with tarfile.open(src_path, "r:*") as tar:
+            return [member.name.lstrip("/") for member in tar.getmembers()]
+
+    with zipfile.ZipFile(src_path, "r") as zf:
+        return zf.namelist()
+
+
+def unpack_archive(src_path, dst_path, members=None):
+    """Extract an archive to the given directory. If members is given, only
+    the archive members with those (posix style) names are extracted."""
+
     # Determine if archive is new tar style or legacy zip
     if tarfile.is_tarfile(src_path):
-        tar = tarfile.open(src_path, "r:gz")
-        tar.extractall(dst_path, filter="data")
-        tar.close()
+        with tarfile.open(src_path, "r:*") as tar:
+            if members is None:
+                tar.extractall(dst_path, filter="data")
+                return
+
+            names = set(members)
+            tar.extractall(
+                dst_path,
+                members=[
+                    member for member in tar if member.name.lstrip("/") in names
+                ],
+                filter="data",
+            )
+
     else:
-        zf = zipfile.ZipFile(src_path, "r")
-        zf.extractall(dst_path)
-        zf.close()
+        with zipfile.ZipFile(src_path, "r") as zf:
+            if members is None:
+                zf.extractall(dst_path)
+                return
+
+            for name in members:
+                zf.extract(name, dst_path)
 
 
 def onerror(func, path, exc_info):
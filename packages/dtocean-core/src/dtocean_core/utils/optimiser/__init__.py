@@ -21,6 +21,8 @@
 
 import abc
 import logging
+import multiprocessing
+import numbers
 import os
 import pickle
 import queue
@@ -29,17 +31,20 @@ import threading
 import time
 import traceback
 from collections import OrderedDict
-from copy import deepcopy
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from logging import handlers
 from math import ceil
 from subprocess import Popen
-from typing import Any, Sequence
+from typing import Any, Callable, Optional, Sequence
 
 import cma
 import numpy as np
 from numpy.linalg import norm
 
-from ..files import init_dir
+from ..files import init_dir, remove_retry
 
 # Convenience import
 from .noisehandler import NoiseHandler  # noqa: F401
@@ -77,26 +82,69 @@ class NormScaler:
         return value / self._scale_factor
 
 
+class SearchDictView(Mapping):
+    """Read-only view of the evaluations recorded by a Counter at the time
+    the view was created. As records are never modified or removed, the
+    view shares the counter's storage rather than copying it. Pickling the
+    view produces a plain dictionary."""
+
+    def __init__(self, search_dict, order, n_records):
+        self._search_dict = search_dict
+        self._order = order
+        self._n_records = n_records
+
+    def __getitem__(self, key):
+        if key not in self._search_dict:
+            raise KeyError(key)
+
+        if self._search_dict[key][0] >= self._n_records:
+            raise KeyError(key)
+
+        return self._search_dict[key][1]
+
+    def __iter__(self):
+        for i in range(self._n_records):
+            yield self._order[i]
+
+    def __len__(self):
+        return self._n_records
+
+    def __reduce__(self):
+        return (dict, (dict(self.items()),))
+
+
 class Counter:
+    """Records the parameters of each evaluation. By default, get_cost
+    checks every recorded evaluation using _get_cost. If index_params is
+    True, recorded evaluations are indexed on the rounded arguments given by
+    _get_args, and get_cost only checks the matching evaluation."""
+
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, search_dict=None):
+    def __init__(self, search_dict=None, index_params=False):
+        self._evaluation = 0
+        self._search_dict = {}
+        self._order = []
+        self._index = {}
+        self._index_params = index_params
+        self._lock = threading.Lock()
+
         if search_dict is None or not search_dict:
-            evaluation = 0
-            search_dict = {}
-        else:
-            evaluation = max(search_dict) + 1
+            return
 
-        self._evaluation = evaluation
-        self._search_dict = search_dict
-        self._lock = threading.Lock()
+        for evaluation in sorted(search_dict):
+            self._add_record(evaluation, search_dict[evaluation])
+
+        self._evaluation = max(search_dict) + 1
 
     @property
     def search_dict(self):
         self._lock.acquire()
 
         try:
-            result = deepcopy(self._search_dict)
+            result = SearchDictView(
+                self._search_dict, self._order, len(self._order)
+            )
         finally:
             self._lock.release()
 
@@ -114,22 +162,51 @@ class Counter:
                 )
                 raise ValueError(err_str)
 
-            self._search_dict[evaluation] = params
+            self._add_record(evaluation, params)
 
         finally:
             self._lock.release()
 
+    def _add_record(self, evaluation, params):
+        self._search_dict[evaluation] = (len(self._order), params)
+        self._order.append(evaluation)
+
+        if not self._index_params:
+            return
+
+        args = self._get_args(params)
+
+        if args is None:
+            return
+
+        key = _get_param_key(args)
+
+        if key not in self._index:
+            self._index[key] = params
+
     @abc.abstractmethod
     def _set_params(self, *args):
         """Build a params (probably namedtuple) object to record evaluation."""
         pass
 
     def get_cost(self, *args):
-        self._lock.acquire()
+        if self._index_params:
+            cost = self._get_indexed_cost(*args)
+        else:
+            cost = self._get_scanned_cost(*args)
+
+        if cost is None:
+            cost = False
+
+        return cost
+
+    def _get_scanned_cost(self, *args):
         cost = None
 
+        self._lock.acquire()
+
         try:
-            for params in self._search_dict.values():
+            for _, params in self._search_dict.values():
                 cost = self._get_cost(params, *args)
                 if cost is not None:
                     break
@@ -137,11 +214,30 @@ class Counter:
         finally:
             self._lock.release()
 
-        if cost is None:
-            cost = False
-
         return cost
 
+    def _get_indexed_cost(self, *args):
+        key = _get_param_key(args)
+
+        self._lock.acquire()
+
+        try:
+            params = self._index.get(key)
+        finally:
+            self._lock.release()
+
+        if params is None:
+            return None
+
+        return self._get_cost(params, *args)
+
+    def _get_args(self, params):  # pylint: disable=no-self-use,unused-argument
+        """Return the arguments, as passed to get_cost, which the params
+        object records, or None if the params object should never be
+        matched. Recorded params are indexed on these arguments if
+        index_params is True."""
+        return None
+
     @abc.abstractmethod
     def _get_cost(self, params, *args):  # pylint: disable=unused-argument
         """Return cost if parameters in params object match input args, else
@@ -172,12 +268,26 @@ class Evaluator:
         worker_directory,
         restart=False,
         clean_existing_dir=False,
+        n_workers=None,
+        worker_timeout=None,
     ):
+        if n_workers is not None and not self._has_pool_hooks():
+            errStr = (
+                "Argument n_workers can not be set as {} does not support "
+                "process pools"
+            ).format(type(self).__name__)
+            raise ValueError(errStr)
+
         self._core = core
         self._base_project = base_project
         self._root_project_base_name = root_project_base_name
         self._worker_directory = worker_directory
         self._counter: Counter = self._init_counter()
+        self._n_workers = n_workers
+        self._worker_timeout = worker_timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_project_path: Optional[str] = None
+        self._pool_lock = threading.Lock()
 
         if not restart:
             init_dir(worker_directory, clean_existing_dir)
@@ -211,6 +321,38 @@ class Evaluator:
         """Update the counter object with new data."""
         pass
 
+    def _get_pool_initializer(
+        self, pool_project_path
+    ) -> tuple[Callable, tuple]:  # pylint: disable=unused-argument
+        """Return a function and its arguments, used to initialise each
+        worker process of the pool with the base project stored at
+        pool_project_path. Required if n_workers is set."""
+        raise NotImplementedError("Evaluator does not support process pools")
+
+    def _get_pool_task(
+        self, worker_project_path, n_evals, *args
+    ) -> tuple[Callable, tuple]:  # pylint: disable=unused-argument
+        """Return a function and its arguments, used to evaluate a solution
+        in a worker process of the pool. Required if n_workers is set."""
+        raise NotImplementedError("Evaluator does not support process pools")
+
+    def _get_pool_results(self, evaluation, worker_output) -> dict[str, Any]:  # pylint: disable=unused-argument
+        """Return the results for the given evaluation from the value
+        returned by the pool task, as for _get_worker_results. Required if
+        n_workers is set."""
+        raise NotImplementedError("Evaluator does not support process pools")
+
+    @classmethod
+    def _has_pool_hooks(cls):
+        """Return True if the class overrides all of the process pool
+        hooks"""
+        hooks = (
+            "_get_pool_initializer",
+            "_get_pool_task",
+            "_get_pool_results",
+        )
+        return all(getattr(cls, x) is not getattr(Evaluator, x) for x in hooks)
+
     def pre_constraints_hook(self, *args):  # pylint: disable=no-self-use,unused-argument
         """Allows checking of constraints prior to execution. Should return
         True if violated otherwise False"""
@@ -230,7 +372,6 @@ class Evaluator:
             results_queue.put((previous_cost,) + extra)
             return
 
-        flag = ""
         evaluation = self._counter.next_evaluation()
 
         worker_file_root_path = "{}_{}".format(
@@ -242,8 +383,39 @@ class Evaluator:
         )
 
         results = None
+        worker_output = None
         cost = np.nan
 
+        if self._n_workers is None:
+            flag = self._execute_process(worker_project_path, n_evals, *x)
+        else:
+            flag, worker_output = self._execute_pool(
+                worker_project_path, n_evals, *x
+            )
+
+        if "Fail" not in flag:
+            try:
+                if self._n_workers is None:
+                    results = self._get_worker_results(evaluation)
+                else:
+                    results = self._get_pool_results(evaluation, worker_output)
+
+                cost = results["cost"]
+
+            except Exception as e:  # pylint: disable=broad-except
+                flag = "Fail Receive"
+                _log_exception(e, flag)
+
+        self._set_counter_params(
+            evaluation, worker_project_path, results, flag, n_evals, *x
+        )
+        self._cleanup_hook(worker_project_path, flag, results)
+
+        results_queue.put((cost,) + extra)
+
+    def _execute_process(self, worker_project_path, n_evals, *x):
+        flag = ""
+
         try:
             self._core.dump_project(self._base_project, worker_project_path)
 
@@ -268,21 +440,106 @@ class Evaluator:
             flag = "Fail Execute"
             _log_exception(e, flag)
 
-        if "Fail" not in flag:
-            try:
-                results = self._get_worker_results(evaluation)
-                cost = results["cost"]
+        return flag
 
-            except Exception as e:  # pylint: disable=broad-except
-                flag = "Fail Receive"
-                _log_exception(e, flag)
+    def _execute_pool(self, worker_project_path, n_evals, *x):
+        flag = ""
+        worker_output = None
 
-        self._set_counter_params(
-            evaluation, worker_project_path, results, flag, n_evals, *x
-        )
-        self._cleanup_hook(worker_project_path, flag, results)
+        try:
+            pool = self._get_pool()
 
-        results_queue.put((cost,) + extra)
+        except Exception as e:  # pylint: disable=broad-except
+            flag = "Fail Send"
+            _log_exception(e, flag)
+            return flag, worker_output
+
+        try:
+            task, task_args = self._get_pool_task(
+                worker_project_path, n_evals, *x
+            )
+            future = pool.submit(task, *task_args)
+            worker_output = future.result(timeout=self._worker_timeout)
+
+        except BrokenProcessPool as e:
+            # A worker died, so replace the pool for later evaluations
+            flag = "Fail Execute"
+            _log_exception(e, flag)
+            self._reset_pool(pool)
+
+        except FutureTimeoutError as e:
+            # The worker is stuck, so stop it along with its pool
+            flag = "Fail Execute"
+            _log_exception(e, flag)
+            self._reset_pool(pool, terminate=True)
+
+        except Exception as e:  # pylint: disable=broad-except
+            flag = "Fail Execute"
+            _log_exception(e, flag)
+
+        return flag, worker_output
+
+    def _get_pool(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                return self._pool
+
+            # Serialise the base project once for all workers
+            if self._pool_project_path is None:
+                pool_project_name = "{}_pool.dtop".format(
+                    self._root_project_base_name
+                )
+                pool_project_path = os.path.join(
+                    self._worker_directory, pool_project_name
+                )
+                self._core.dump_project(self._base_project, pool_project_path)
+                self._pool_project_path = pool_project_path
+
+            initializer, initargs = self._get_pool_initializer(
+                self._pool_project_path
+            )
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initializer,
+                initargs=initargs,
+            )
+
+            return self._pool
+
+    def _reset_pool(self, pool, terminate=False):
+        """Discard a broken or stuck pool so that the next evaluation starts
+        a new one. Evaluations sharing the pool when its workers are
+        terminated will fail."""
+
+        with self._pool_lock:
+            if self._pool is not pool:
+                return
+
+            self._pool = None
+
+        if terminate:
+            # ProcessPoolExecutor has no public means of stopping a running
+            # task, so end the worker processes directly
+            processes = getattr(pool, "_processes", None) or {}
+            for process in list(processes.values()):
+                process.terminate()
+
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Shut down the process pool, if started, and remove the stored
+        base project."""
+
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+            if self._pool_project_path is not None:
+                remove_retry(self._pool_project_path)
+                self._pool_project_path = None
 
     def __call__(self, q, stop_empty=False):
         """Call the evaluator with a queue.Queue() where index 0 is another
@@ -908,6 +1165,24 @@ def _get_scale_factor(range_min, range_max, x0, sigma, n_sigmas):
     return half_scaled_range / max_half_range
 
 
+def _get_param_key(values, decimals=8):
+    """Return a hashable key for the given sequence of parameter values, with
+    real values rounded to the given number of decimals. Nested sequences
+    are converted to nested keys."""
+
+    key = []
+
+    for value in values:
+        if isinstance(value, numbers.Real):
+            value = round(float(value), decimals)
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            value = _get_param_key(value, decimals)
+
+        key.append(value)
+
+    return tuple(key)
+
+
 def _get_match_process(values, *args):
     def expand_args(x, args):
         if not args:
@@ -920,32 +1195,26 @@ def _get_match_process(values, *args):
 
         return tuple(result)
 
+    first_index = {}
+    process_list = []
     match_dict = {}
-    all_matches = []
 
-    for i in range(len(values) - 1):
-        if i in all_matches:
-            continue
-
-        key = i
-        base = values[i]
-        match_list = []
+    for i, value in enumerate(values):
+        key = _get_param_key(value)
 
-        for j in range(i + 1, len(values)):
-            test = values[j]
-
-            if all([x == y for x, y in zip(base, test)]):
-                match_list.append(j)
+        if key not in first_index:
+            first_index[key] = i
+            process_list.append(i)
+            continue
 
-        all_matches.extend(match_list)
+        base = first_index[key]
 
-        if match_list:
-            match_list = [expand_args(k, args) for k in match_list]
-            match_dict[key] = match_list
+        if base not in match_dict:
+            match_dict[base] = []
 
-    process_set = set(range(len(values))) - set(all_matches)
+        match_dict[base].append(expand_args(i, args))
 
-    return list(process_set), match_dict
+    return process_list, match_dict
 
 
 def _log_exception(e, flag):
@@ -25,8 +25,11 @@ from mdo_engine.boundary.interface import QueryInterface
 from shapely import Polygon, to_wkt
 
 from dtocean_core.utils.database import (
-    bathy_records_to_strata,
-    tidal_series_records_to_xset,
+    BATHY_COLUMNS,
+    TIDAL_SERIES_COLUMNS,
+    bathy_arrays_to_strata,
+    read_query_arrays,
+    tidal_series_arrays_to_xset,
 )
 
 
@@ -160,7 +163,8 @@ class LeaseBathyInterface(QueryInterface):
 
         query_str = (
             "SELECT "
-            "utm_point, "
+            "ST_X(utm_point) AS x, "
+            "ST_Y(utm_point) AS y, "
             "depth, "
             "layer_order, "
             "initial_depth, "
@@ -170,8 +174,8 @@ class LeaseBathyInterface(QueryInterface):
             "('{}')"
         ).format(func_poly_str)
 
-        result = self._db.server_execute_query(query_str)
-        raw_strata = bathy_records_to_strata(result)
+        result = read_query_arrays(self._db, query_str, BATHY_COLUMNS)
+        raw_strata = bathy_arrays_to_strata(result)
 
         self.data.bathymetry = raw_strata
 
@@ -305,7 +309,8 @@ class CorridorBathyInterface(QueryInterface):
 
         query_str = (
             "SELECT "
-            "utm_point, "
+            "ST_X(utm_point) AS x, "
+            "ST_Y(utm_point) AS y, "
             "depth, "
             "layer_order, "
             "initial_depth, "
@@ -315,8 +320,8 @@ class CorridorBathyInterface(QueryInterface):
             "('{}')"
         ).format(func_poly_str)
 
-        result = self._db.server_execute_query(query_str)
-        raw_strata = bathy_records_to_strata(result)
+        result = read_query_arrays(self._db, query_str, BATHY_COLUMNS)
+        raw_strata = bathy_arrays_to_strata(result)
 
         self.data.corridor = raw_strata
 
@@ -450,7 +455,8 @@ class TidalEnergyInterface(QueryInterface):
 
         query_str = (
             "SELECT "
-            "utm_point, "
+            "ST_X(utm_point) AS x, "
+            "ST_Y(utm_point) AS y, "
             "measure_date, "
             "measure_time, "
             "u, "
@@ -462,7 +468,7 @@ class TidalEnergyInterface(QueryInterface):
             "('{}')"
         ).format(func_poly_str)
 
-        result = self._db.server_execute_query(query_str)
-        raw_strata = tidal_series_records_to_xset(result)
+        result = read_query_arrays(self._db, query_str, TIDAL_SERIES_COLUMNS)
+        raw_strata = tidal_series_arrays_to_xset(result)
 
         self.data.tidal_series = raw_strata
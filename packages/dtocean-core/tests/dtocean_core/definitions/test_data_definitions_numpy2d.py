@@ -182,3 +182,22 @@ def test_toText_fromText_none():
     c = structure.toText(None)
 
     assert structure.fromText(c, structure.version) is None
+
+
+def test_save_value_load_binary(tmp_path):
+    structure = Numpy2D()
+
+    a = np.random.rand(10, 8)
+    file_path = structure.save_value(a, tmp_path / "test", binary=True)
+    test = structure.load_binary(file_path)
+
+    assert file_path.suffix == ".npz"
+    assert np.equal(a, test).all()
+
+
+def test_save_value_load_data_none(tmp_path):
+    structure = Numpy2D()
+    file_path = structure.save_value(None, tmp_path / "test", binary=True)
+
+    assert file_path.suffix == ".json"
+    assert structure.load_data(file_path) is None
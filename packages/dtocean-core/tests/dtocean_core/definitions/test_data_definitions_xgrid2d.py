@@ -175,3 +175,45 @@ def test_toText_fromText_none():
     c = structure.toText(None)
 
     assert structure.fromText(c, structure.version) is None
+
+
+def test_save_value_load_binary(tmp_path):
+    meta = CoreMetaData(
+        {
+            "identifier": "test",
+            "structure": "test",
+            "title": "test",
+            "labels": ["x", "y"],
+            "units": [None, "m", "POWER!"],
+        }
+    )
+    structure = XGrid2D()
+
+    raw = {"values": np.random.randn(2, 3), "coords": [[0, 1], [-2, 0, 2]]}
+    a = structure.get_data(raw, meta)
+    file_path = structure.save_value(a, tmp_path / "test", binary=True)
+    test = structure.load_binary(file_path)
+
+    assert file_path.suffix == ".nc"
+    assert test.identical(a)
+
+
+def test_save_value_load_data_strings(tmp_path):
+    meta = CoreMetaData(
+        {
+            "identifier": "test",
+            "structure": "test",
+            "title": "test",
+            "labels": ["x", "y"],
+            "units": [None, "m", "POWER!"],
+        }
+    )
+    structure = XGrid2D()
+
+    raw = {"values": np.random.randn(2, 3), "coords": [["a", "b"], [-2, 0, 2]]}
+    a = structure.get_data(raw, meta)
+    file_path = structure.save_value(a, tmp_path / "test", binary=True)
+    test = structure.load_data(file_path)
+
+    assert file_path.suffix == ".json"
+    assert test.equals(a)
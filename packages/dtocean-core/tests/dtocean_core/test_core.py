@@ -12,6 +12,7 @@ from dtocean_core.menu import ModuleMenu, ProjectMenu, ThemeMenu
 from dtocean_core.pipeline import Tree
 from dtocean_plugins.modules.base import ModuleInterface
 from dtocean_plugins.themes.base import ThemeInterface
+from mdo_engine.control.data import DataStorage
 
 DIR_PATH = os.path.dirname(__file__)
 
@@ -230,6 +231,46 @@ def test_dump_project(
     assert os.path.isfile(project_file_path)
 
 
+@pytest.mark.parametrize("binary", [False, True])
+def test_dump_project_binary(
+    mocker,
+    core,
+    project,
+    var_tree,
+    tmpdir,
+    inputs_wp2_tidal,
+    binary,
+):
+    project = deepcopy(project)
+
+    project_menu = ProjectMenu()
+    module_menu = ModuleMenu()
+
+    module_menu.activate(core, project, "Mock Module")
+    project_menu.initiate_dataflow(core, project)
+
+    hydro_branch = var_tree.get_branch(core, project, "Mock Module")
+    hydro_branch.read_test_data(core, project, inputs_wp2_tidal)
+
+    serialise_pool = mocker.spy(DataStorage, "serialise_pool")
+
+    if binary:
+        core.dump_project(project, str(tmpdir), binary=True)
+    else:
+        core.dump_project(project, str(tmpdir))
+
+    assert serialise_pool.call_args.kwargs["binary"] is binary
+
+    pool_dir = os.path.join(str(tmpdir), "pool")
+
+    if not binary:
+        assert all(name.endswith(".json") for name in os.listdir(pool_dir))
+
+    loaded_project = core.load_project(str(tmpdir))
+
+    assert loaded_project.check_integrity()
+
+
 def test_dump_project_archive(
     core,
     project,
@@ -263,6 +304,138 @@ def test_dump_project_archive(
     assert os.path.isfile(project_file_path)
 
 
+def test_dump_project_incremental(
+    core,
+    project,
+    var_tree,
+    tmpdir,
+    inputs_wp2_tidal,
+    inputs_economics,
+):
+    project = deepcopy(project)
+
+    project_menu = ProjectMenu()
+    module_menu = ModuleMenu()
+    theme_menu = ThemeMenu()
+
+    module_menu.activate(core, project, "Mock Module")
+    theme_menu.activate(core, project, "Mock Theme")
+
+    project_menu.initiate_dataflow(core, project)
+
+    hydro_branch = var_tree.get_branch(core, project, "Mock Module")
+    hydro_branch.read_test_data(core, project, inputs_wp2_tidal)
+
+    core.dump_project(project, str(tmpdir), incremental=True)
+
+    pool_dir = os.path.join(str(tmpdir), "pool")
+    first_files = {
+        name: os.path.getmtime(os.path.join(pool_dir, name))
+        for name in os.listdir(pool_dir)
+    }
+
+    eco_branch = var_tree.get_branch(core, project, "Mock Theme")
+    eco_branch.read_test_data(core, project, inputs_economics)
+
+    core.dump_project(project, str(tmpdir), incremental=True)
+
+    second_files = {
+        name: os.path.getmtime(os.path.join(pool_dir, name))
+        for name in os.listdir(pool_dir)
+    }
+
+    for name, mtime in first_files.items():
+        if name in second_files:
+            assert second_files[name] == mtime
+
+    assert len(second_files) > len(first_files)
+
+    loaded_project = core.load_project(str(tmpdir))
+
+    assert loaded_project.check_integrity()
+    assert "Mock Module" in module_menu.get_scheduled(core, loaded_project)
+
+
+@pytest.mark.parametrize("first_incremental", [True, False])
+def test_dump_project_incremental_interrupted(
+    mocker,
+    core,
+    project,
+    var_tree,
+    tmpdir,
+    inputs_wp2_tidal,
+    inputs_economics,
+    first_incremental,
+):
+    project = deepcopy(project)
+
+    project_menu = ProjectMenu()
+    module_menu = ModuleMenu()
+    theme_menu = ThemeMenu()
+
+    module_menu.activate(core, project, "Mock Module")
+    theme_menu.activate(core, project, "Mock Theme")
+
+    project_menu.initiate_dataflow(core, project)
+
+    hydro_branch = var_tree.get_branch(core, project, "Mock Module")
+    hydro_branch.read_test_data(core, project, inputs_wp2_tidal)
+
+    core.dump_project(project, str(tmpdir), incremental=first_incremental)
+
+    project_file_path = os.path.join(str(tmpdir), "project.json")
+    pool_dir = os.path.join(str(tmpdir), "pool")
+
+    with open(project_file_path) as fstream:
+        first_project = fstream.read()
+
+    first_files = set(os.listdir(pool_dir))
+
+    # Replace the pool entries of the previously saved project
+    if not first_incremental:
+        project = core.load_project(str(tmpdir))
+        pool = project.get_pool()
+
+        for data_index in list(pool):
+            pool.replace(data_index, deepcopy(pool.get(data_index)))
+
+    eco_branch = var_tree.get_branch(core, project, "Mock Theme")
+    eco_branch.read_test_data(core, project, inputs_economics)
+
+    mocker.patch.object(
+        core.control,
+        "serialise_simulation",
+        side_effect=RuntimeError("interrupted"),
+    )
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        core.dump_project(project, str(tmpdir), incremental=True)
+
+    with open(project_file_path) as fstream:
+        assert fstream.read() == first_project
+
+    assert first_files <= set(os.listdir(pool_dir))
+
+    loaded_project = core.load_project(str(tmpdir))
+
+    assert loaded_project.check_integrity()
+
+    mocker.stopall()
+    core.dump_project(project, str(tmpdir), incremental=True)
+
+    sim_dirs = [
+        name for name in os.listdir(str(tmpdir)) if name.startswith("sim")
+    ]
+
+    assert len(sim_dirs) == len(project._simulations)
+    assert core.load_project(str(tmpdir)).check_integrity()
+
+
+def test_dump_project_incremental_archive(core, project):
+    with pytest.raises(ValueError, match="incremental saving"):
+        core.dump_project(project, "my_project.dtop", incremental=True)
+
+
 def test_dump_project_nodir(core, project, var_tree):
     project = deepcopy(project)
 
@@ -328,6 +501,94 @@ def test_load_project_archive(
     assert "Mock Module" in module_menu.get_scheduled(core, loaded_project)
 
 
+@pytest.mark.parametrize("codec", ["gz", "zip"])
+def test_load_project_archive_lazy(
+    core,
+    project,
+    var_tree,
+    tmpdir,
+    inputs_wp2_tidal,
+    inputs_economics,
+    codec,
+):
+    project = deepcopy(project)
+
+    project_menu = ProjectMenu()
+    module_menu = ModuleMenu()
+    theme_menu = ThemeMenu()
+
+    module_menu.activate(core, project, "Mock Module")
+    theme_menu.activate(core, project, "Mock Theme")
+
+    project_menu.initiate_dataflow(core, project)
+
+    hydro_branch = var_tree.get_branch(core, project, "Mock Module")
+    hydro_branch.read_test_data(core, project, inputs_wp2_tidal)
+
+    eco_branch = var_tree.get_branch(core, project, "Mock Theme")
+    eco_branch.read_test_data(core, project, inputs_economics)
+
+    project_file_path = os.path.join(str(tmpdir), "my_project.dtop")
+    core.dump_project(project, project_file_path, codec=codec)
+
+    loaded_project = core.load_project(project_file_path, lazy=True)
+    pool = loaded_project.get_pool()
+
+    assert any(pool.is_deferred(index) for index in pool)
+
+    project_copy = loaded_project.to_project()
+    del loaded_project
+
+    pool = project_copy.get_pool()
+    pool.load_deferred()
+
+    assert not any(pool.is_deferred(index) for index in pool)
+    assert project_copy.check_integrity()
+
+
+@pytest.mark.parametrize("codec", ["gz", "zip"])
+def test_dump_project_lazy_same_path(
+    core,
+    project,
+    var_tree,
+    tmpdir,
+    inputs_wp2_tidal,
+    inputs_economics,
+    codec,
+):
+    project = deepcopy(project)
+
+    project_menu = ProjectMenu()
+    module_menu = ModuleMenu()
+    theme_menu = ThemeMenu()
+
+    module_menu.activate(core, project, "Mock Module")
+    theme_menu.activate(core, project, "Mock Theme")
+
+    project_menu.initiate_dataflow(core, project)
+
+    hydro_branch = var_tree.get_branch(core, project, "Mock Module")
+    hydro_branch.read_test_data(core, project, inputs_wp2_tidal)
+
+    eco_branch = var_tree.get_branch(core, project, "Mock Theme")
+    eco_branch.read_test_data(core, project, inputs_economics)
+
+    project_file_path = os.path.join(str(tmpdir), "my_project.dtop")
+    core.dump_project(project, project_file_path, codec=codec)
+
+    loaded_project = core.load_project(project_file_path, lazy=True)
+    core.dump_project(loaded_project, project_file_path, codec="gz")
+
+    pool = loaded_project.get_pool()
+
+    assert not any(pool.is_deferred(index) for index in pool)
+    assert loaded_project.check_integrity()
+
+    reloaded_project = core.load_project(project_file_path)
+
+    assert reloaded_project.check_integrity()
+
+
 def test_load_project_bad_ext(core):
     with pytest.raises(ValueError):
         core.load_project("bad_ext.bad")
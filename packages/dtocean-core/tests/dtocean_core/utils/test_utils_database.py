@@ -4,26 +4,37 @@ import os
 import numpy as np
 import pandas as pd
 import pytest
-from shapely import Polygon, get_srid, set_srid
+from mdo_engine.utilities.database import SQLite
+from shapely import Polygon, get_srid, set_srid, wkt
 from shapely.geometry import Point
+from sqlalchemy import event
 
 from dtocean_core.utils.config import init_config
 from dtocean_core.utils.database import (
+    BATHY_COLUMNS,
+    bathy_arrays_to_strata,
     bathy_records_to_strata,
+    build_bathy_layer,
     check_dict,
     convert_array,
     convert_bool,
     convert_geo,
     convert_time,
+    database_to_files,
     draw_map,
     filter_map,
     get_database_config,
+    get_grid_indices,
     get_offset_map,
     get_table_map,
     query_builder,
+    read_query_arrays,
+    read_sql_chunks,
     revert_array,
     revert_bool,
     revert_geo,
+    tidal_series_arrays_to_xset,
+    tidal_series_records_to_xset,
 )
 
 this_dir = os.path.dirname(os.path.realpath(__file__))
@@ -48,6 +59,126 @@ def test_bathy_records_to_strata(test_data_path):
     assert set(raw["values"].keys()) == set(["depth", "sediment"])
 
 
+def test_bathy_records_to_strata_values():
+    records = [
+        (Point(0, 10), 5.0, 2, 1.0, "sand"),
+        (Point(1, 10), 6.0, 1, 1.0, "rock"),
+        (Point(0, 11), 7.0, 1, 2.0, "clay"),
+        (Point(0, 10), 8.0, 1, 1.0, "gravel"),
+    ]
+
+    raw = bathy_records_to_strata(records)
+
+    assert raw is not None
+
+    depth = raw["values"]["depth"]
+    sediment = raw["values"]["sediment"]
+    xi, yj, layer_names = raw["coords"]
+
+    assert (xi == [0, 1]).all()
+    assert (yj == [10, 11]).all()
+    assert layer_names == ["layer 1", "layer 2"]
+    assert depth.shape == (2, 2, 2)
+    assert depth[0, 0, 0] == 7.0
+    assert depth[1, 0, 0] == 5.0
+    assert depth[0, 1, 0] == 5.0
+    assert depth[0, 0, 1] == 4.0
+    assert np.isnan(depth[1, 1, 0])
+    assert np.isnan(depth[1, 0, 1])
+    assert sediment[0, 0, 1] == "sand"
+    assert sediment[1, 0, 1] is None
+
+
+def test_build_bathy_layer():
+    layer_table = pd.DataFrame(
+        {
+            "x": [0.0, 1.0, 1.0],
+            "y": [10.0, 10.0, 11.0],
+            "depth": [5.0, 6.0, 7.0],
+            "initial_depth": [1.0, 1.0, 1.0],
+            "sediment_type": ["sand", "rock", "clay"],
+        }
+    )
+    xi = np.array([0.0, 1.0])
+    yj = np.array([10.0, 11.0])
+
+    depth, sediment = build_bathy_layer(layer_table, xi, yj)
+
+    assert np.array_equal(
+        depth,
+        np.array([[4.0, np.nan], [5.0, 6.0]]),
+        equal_nan=True,
+    )
+    assert sediment.tolist() == [["sand", None], ["rock", "clay"]]
+
+
+def test_tidal_series_records_to_xset():
+    date = datetime.date(2020, 1, 1)
+    early = datetime.time(0, 0)
+    late = datetime.time(1, 0)
+
+    records = [
+        (Point(1, 10), date, late, 1.0, 2.0, 0.1, 3.0),
+        (Point(0, 10), date, early, 4.0, 5.0, 0.2, 6.0),
+        (Point(0, 11), date, late, 7.0, 8.0, 0.3, 9.0),
+    ]
+
+    raw = tidal_series_records_to_xset(records)
+
+    assert raw is not None
+
+    xi, yj, steps = raw["coords"]
+
+    assert (xi == [0, 1]).all()
+    assert (yj == [10, 11]).all()
+    assert steps == [
+        datetime.datetime.combine(date, early),
+        datetime.datetime.combine(date, late),
+    ]
+
+    u = raw["values"]["U"]
+
+    assert u.shape == (2, 2, 2)
+    assert u[0, 0, 0] == 4.0
+    assert u[1, 0, 1] == 1.0
+    assert u[0, 1, 1] == 7.0
+    assert np.isnan(u).sum() == 5
+    assert raw["values"]["V"][1, 0, 1] == 2.0
+    assert raw["values"]["TI"][0, 1, 1] == 0.3
+    assert raw["values"]["SSH"][0, 0, 0] == 6.0
+
+
+def test_tidal_series_records_to_xset_empty():
+    assert tidal_series_records_to_xset([]) is None
+
+
+def test_get_grid_indices():
+    grid = np.array([500000.0, 500010.0, 500020.0])
+    values = np.array([500020.0, 500000.0 + 1e-9, 500010.0 - 1e-9, 500000.0])
+
+    result = get_grid_indices(values, grid)
+
+    assert result.tolist() == [2, 0, 1, 0]
+
+
+@pytest.mark.parametrize("value", [499999.0, 500005.0, 500021.0])
+def test_get_grid_indices_off_grid(value):
+    grid = np.array([500000.0, 500010.0, 500020.0])
+
+    with pytest.raises(ValueError) as excinfo:
+        get_grid_indices([500000.0, value], grid)
+
+    assert "do not lie on the grid" in str(excinfo.value)
+
+
+def test_get_grid_indices_empty():
+    result = get_grid_indices([], np.array([]))
+    assert len(result) == 0
+
+    with pytest.raises(ValueError):
+        get_grid_indices([1.0], np.array([]))
+
+
 # def test_bathy_records_to_strata_fail(test_data_path):
 #     df = pd.read_csv(test_data_path / "bathy_test_bad.csv")
 #     points = []
@@ -65,6 +196,218 @@ def test_bathy_records_to_strata(test_data_path):
 #         bathy_records_to_strata(records)
 
 
+@pytest.fixture
+def bathy_records():
+    return [
+        (Point(0.001, 10), 5.0, 2, 1.0, "sand"),
+        (Point(1, 10), 6.0, 1, 1.0, "rock"),
+        (Point(0, 11.004), 7.0, 1, 2.0, "clay"),
+        (Point(0, 10), 8.0, 1, 1.0, "gravel"),
+        (Point(1, 11), None, 1, 1.0, None),
+    ]
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, bathy_records):
+    # SQLite stand-in for a spatial database, with points stored as WKT
+    database = SQLite()
+    database.set_dbname(str(tmp_path / "test.db"))
+    database.configure()
+
+    @event.listens_for(database._engine, "connect")
+    def _add_spatial_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "ST_X", 1, lambda x: wkt.loads(x).x, deterministic=True
+        )
+        dbapi_connection.create_function(
+            "ST_Y", 1, lambda x: wkt.loads(x).y, deterministic=True
+        )
+
+    database.execute_transaction(
+        "CREATE TABLE bathymetry ("
+        "id INTEGER PRIMARY KEY, "
+        "utm_point TEXT, "
+        "depth REAL, "
+        "layer_order INTEGER, "
+        "initial_depth REAL, "
+        "sediment_type TEXT)"
+    )
+
+    values = []
+
+    for i, record in enumerate(bathy_records):
+        point, depth, layer_order, initial_depth, sediment_type = record
+        depth_str = "NULL" if depth is None else str(depth)
+        sediment_str = "NULL" if sediment_type is None else f"'{sediment_type}'"
+        values.append(
+            f"({10 - i}, '{point.wkt}', {depth_str}, {layer_order}, "
+            f"{initial_depth}, {sediment_str})"
+        )
+
+    database.execute_transaction(
+        "INSERT INTO bathymetry VALUES {}".format(", ".join(values))
+    )
+
+    yield database
+
+    database.close()
+
+
+BATHY_QUERY = (
+    "SELECT "
+    "ST_X(utm_point) AS x, "
+    "ST_Y(utm_point) AS y, "
+    "depth, "
+    "layer_order, "
+    "initial_depth, "
+    "sediment_type "
+    "FROM bathymetry "
+    "ORDER BY id DESC"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_read_query_arrays(sqlite_db, bathy_records, chunk_size):
+    result = read_query_arrays(
+        sqlite_db,
+        BATHY_QUERY,
+        BATHY_COLUMNS,
+        chunk_size=chunk_size,
+    )
+
+    assert list(result.keys()) == list(BATHY_COLUMNS.keys())
+    assert result["x"].dtype == float
+    assert result["layer_order"].dtype == int
+    assert result["sediment_type"].dtype == object
+    assert all(len(array) == len(bathy_records) for array in result.values())
+
+    assert result["x"].tolist() == [point.x for point, *_ in bathy_records]
+    assert result["y"].tolist() == [point.y for point, *_ in bathy_records]
+    assert np.isnan(result["depth"][-1])
+    assert result["layer_order"].tolist() == [2, 1, 1, 1, 1]
+    assert result["sediment_type"].tolist() == [
+        "sand",
+        "rock",
+        "clay",
+        "gravel",
+        None,
+    ]
+
+
+def test_read_query_arrays_empty(sqlite_db):
+    result = read_query_arrays(
+        sqlite_db,
+        BATHY_QUERY.replace("ORDER BY", "WHERE depth > 100 ORDER BY"),
+        BATHY_COLUMNS,
+    )
+
+    assert all(len(array) == 0 for array in result.values())
+    assert bathy_arrays_to_strata(result) is None
+
+
+def test_read_query_arrays_bad_columns(sqlite_db):
+    with pytest.raises(ValueError) as excinfo:
+        read_query_arrays(sqlite_db, BATHY_QUERY, {"x": float, "y": float})
+
+    assert "returned 6 columns" in str(excinfo.value)
+
+
+def test_read_sql_chunks(sqlite_db):
+    chunks = list(read_sql_chunks(sqlite_db, BATHY_QUERY, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert list(chunks[0].columns) == list(BATHY_COLUMNS.keys())
+
+
+def test_bathy_arrays_to_strata(sqlite_db, bathy_records):
+    arrays = read_query_arrays(sqlite_db, BATHY_QUERY, BATHY_COLUMNS)
+    raw = bathy_arrays_to_strata(arrays)
+    expected = bathy_records_to_strata(bathy_records)
+
+    assert raw is not None
+    assert expected is not None
+
+    for test, check in zip(raw["coords"], expected["coords"]):
+        assert np.array_equal(test, check)
+
+    assert np.array_equal(
+        raw["values"]["depth"],
+        expected["values"]["depth"],
+        equal_nan=True,
+    )
+    sediment = raw["values"]["sediment"]
+    expected_sediment = expected["values"]["sediment"]
+    missing = pd.isna(expected_sediment)
+
+    assert (pd.isna(sediment) == missing).all()
+    assert (sediment[~missing] == expected_sediment[~missing]).all()
+
+
+def test_tidal_series_arrays_to_xset():
+    date = datetime.date(2020, 1, 1)
+    early = datetime.time(0, 0)
+    late = datetime.time(1, 0)
+
+    records = [
+        (Point(1, 10), date, late, 1.0, 2.0, 0.1, 3.0),
+        (Point(0, 10.001), date, early, 4.0, 5.0, 0.2, 6.0),
+        (Point(0, 11), date, late, 7.0, 8.0, 0.3, 9.0),
+    ]
+
+    columns = list(zip(*records))
+    arrays = {
+        "x": np.array([point.x for point in columns[0]]),
+        "y": np.array([point.y for point in columns[0]]),
+        "measure_date": np.array(columns[1], dtype=object),
+        "measure_time": np.array(columns[2], dtype=object),
+        "u": np.array(columns[3]),
+        "v": np.array(columns[4]),
+        "turbulence_intensity": np.array(columns[5]),
+        "ssh": np.array(columns[6]),
+    }
+
+    raw = tidal_series_arrays_to_xset(arrays)
+    expected = tidal_series_records_to_xset(records)
+
+    assert raw is not None
+    assert expected is not None
+
+    for test, check in zip(raw["coords"], expected["coords"]):
+        assert np.array_equal(test, check)
+
+    for key, value in expected["values"].items():
+        assert np.array_equal(raw["values"][key], value, equal_nan=True)
+
+
+def test_database_to_files(tmp_path, sqlite_db):
+    root_path = tmp_path / "dump"
+    table_list = [{"table": "bathymetry", "geo": None}]
+
+    database_to_files(
+        str(root_path),
+        table_list,
+        sqlite_db,
+        prefer_csv=True,
+        chunk_size=2,
+    )
+
+    result = pd.read_csv(root_path / "bathymetry.csv")
+
+    assert result["id"].tolist() == [6, 7, 8, 9, 10]
+    assert result["sediment_type"].tolist()[1:] == [
+        "gravel",
+        "clay",
+        "rock",
+        "sand",
+    ]
+    assert np.isnan(result["depth"][0])
+
+
+def test_query_builder_order_by():
+    result = query_builder(["test"], order_by="id")
+    assert result == "SELECT * FROM test\nORDER BY id;"
+
+
 def test_query_builder():
     result = query_builder(
         ["device", "device_shared"],
@@ -1,15 +1,23 @@
+import gzip
+import io
 import os
 import shutil
 import sys
+import tarfile
 import zipfile
 from stat import S_IREAD, S_IRGRP, S_IROTH
 
 import pytest
 
 from dtocean_core.utils.files import (
+    ARCHIVE_CODECS,
+    ParallelGzipWriter,
     init_dir,
+    is_random_access,
+    list_archive,
     onerror,
     os_retry,
+    package_dir,
     remove_retry,
     rmtree_retry,
     unpack_archive,
@@ -35,6 +43,130 @@ def test_unpack_archive_zip(tmpdir):
     assert len(os.listdir(dst_path)) == 1
 
 
+def test_unpack_archive_legacy_tar(tmpdir):
+    src_path = os.path.join(str(tmpdir), "legacy.dtop")
+    dst_path = os.path.join(str(tmpdir), "test")
+
+    readme = tmpdir.join("README.txt")
+    readme.write("test")
+
+    with tarfile.open(src_path, "w:gz") as tar:
+        tar.add(str(readme), arcname="/README.txt")
+
+    unpack_archive(src_path, dst_path)
+
+    assert os.listdir(dst_path) == ["README.txt"]
+
+
+def _make_project_dir(tmpdir):
+    src_dir = tmpdir.mkdir("src")
+    src_dir.join("project.json").write("{}")
+    pool_dir = src_dir.mkdir("pool")
+    pool_dir.join("a.json").write("a" * 1000)
+    pool_dir.join("b.json").write("b" * 1000)
+
+    return str(src_dir)
+
+
+@pytest.mark.parametrize("codec", ARCHIVE_CODECS)
+def test_package_dir_archive(tmpdir, codec):
+    src_dir = _make_project_dir(tmpdir)
+    dst_path = os.path.join(str(tmpdir), "test.dtop")
+
+    package_dir(src_dir, dst_path, archive=True, codec=codec, n_workers=2)
+
+    assert not os.path.exists(src_dir)
+    assert os.path.isfile(dst_path)
+    assert not os.path.exists(dst_path + ".part")
+    assert is_random_access(dst_path) == (codec == "zip")
+    assert sorted(list_archive(dst_path)) == [
+        "pool/a.json",
+        "pool/b.json",
+        "project.json",
+    ]
+
+    dst_dir = os.path.join(str(tmpdir), "out")
+    unpack_archive(dst_path, dst_dir)
+
+    assert sorted(os.listdir(dst_dir)) == ["pool", "project.json"]
+    assert sorted(os.listdir(os.path.join(dst_dir, "pool"))) == [
+        "a.json",
+        "b.json",
+    ]
+
+
+@pytest.mark.parametrize("codec", ARCHIVE_CODECS)
+def test_unpack_archive_members(tmpdir, codec):
+    src_dir = _make_project_dir(tmpdir)
+    dst_path = os.path.join(str(tmpdir), "test.dtop")
+
+    package_dir(src_dir, dst_path, archive=True, codec=codec)
+
+    dst_dir = os.path.join(str(tmpdir), "out")
+    unpack_archive(dst_path, dst_dir, ["pool/b.json"])
+
+    assert os.listdir(dst_dir) == ["pool"]
+    assert os.listdir(os.path.join(dst_dir, "pool")) == ["b.json"]
+
+
+def test_package_dir_bad_codec(tmpdir):
+    src_dir = _make_project_dir(tmpdir)
+    dst_path = os.path.join(str(tmpdir), "test.dtop")
+
+    with pytest.raises(ValueError, match="codec must be one of"):
+        package_dir(src_dir, dst_path, archive=True, codec="mock")
+
+
+def test_ParallelGzipWriter():
+    data = os.urandom(1000) * 50
+    fstream = io.BytesIO()
+
+    writer = ParallelGzipWriter(fstream, n_workers=3, block_size=1024)
+    writer.write(data[:10000])
+    writer.write(data[10000:])
+    writer.close()
+
+    assert gzip.decompress(fstream.getvalue()) == data
+
+
+def test_ParallelGzipWriter_empty():
+    fstream = io.BytesIO()
+
+    writer = ParallelGzipWriter(fstream)
+    writer.close()
+
+    assert gzip.decompress(fstream.getvalue()) == b""
+
+
+def test_ParallelGzipWriter_closed():
+    fstream = io.BytesIO()
+
+    writer = ParallelGzipWriter(fstream)
+    writer.write(b"mock")
+    writer.close()
+    writer.close()
+
+    assert writer.closed
+    assert gzip.decompress(fstream.getvalue()) == b"mock"
+
+    with pytest.raises(ValueError):
+        writer.write(b"mock")
+
+
+def test_package_dir_archive_error(mocker, tmpdir):
+    src_dir = _make_project_dir(tmpdir)
+    dst_path = os.path.join(str(tmpdir), "test.dtop")
+
+    mocker.patch.object(tarfile.TarFile, "add", side_effect=OSError("bang"))
+    close = mocker.spy(ParallelGzipWriter, "close")
+
+    with pytest.raises(OSError, match="bang"):
+        package_dir(src_dir, dst_path, archive=True, codec="gz")
+
+    assert close.call_count >= 1
+    assert close.call_args.args[0].closed
+
+
 @pytest.mark.skipif(not sys.platform.startswith("win"), reason="Windows only")
 def test_onerror(tmpdir):
     config_tmpdir = tmpdir.mkdir("config")
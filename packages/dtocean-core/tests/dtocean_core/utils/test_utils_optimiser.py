@@ -4,9 +4,12 @@
 
 import contextlib
 import logging
+import os
+import pickle
 import queue
 import sys
 import threading
+import time
 from collections import namedtuple
 from typing import Any, Optional
 
@@ -21,6 +24,7 @@ from dtocean_core.utils.optimiser import (
     NormScaler,
     SafeCMAEvolutionStrategy,
     _get_match_process,
+    _get_param_key,
     _get_scale_factor,
     dump_outputs,
     init_evolution_strategy,
@@ -81,6 +85,14 @@ class MockCounter(Counter):
         return None
 
 
+class IndexedMockCounter(MockCounter):
+    def __init__(self, search_dict=None):
+        super().__init__(search_dict, index_params=True)
+
+    def _get_args(self, params):
+        return params.x
+
+
 def test_Counter_set_params():
     counter = MockCounter()
     evaluation = counter.next_evaluation()
@@ -116,6 +128,77 @@ def test_Counter_get_cost(value, expected):
     assert counter.get_cost(value) == expected
 
 
+@pytest.mark.parametrize("value, expected", [(1, 11), (2, 12), (3, False)])
+def test_Counter_get_cost_indexed(value, expected):
+    counter = IndexedMockCounter()
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 11, 1)
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 12, 2)
+
+    assert counter.get_cost(value) == expected
+
+
+def test_Counter_get_cost_indexed_rounded():
+    counter = IndexedMockCounter()
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 11, 0.1 + 0.2)
+
+    assert counter.get_cost(0.3) == 11
+
+
+def test_Counter_get_cost_indexed_no_args():
+    class NoArgsCounter(MockCounter):
+        def __init__(self):
+            super().__init__(index_params=True)
+
+    counter = NoArgsCounter()
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 11, 1)
+
+    assert counter.get_cost(1) is False
+
+
+@pytest.mark.parametrize("counter_class", [MockCounter, IndexedMockCounter])
+def test_Counter_init_search_dict(counter_class):
+    search_dict = {0: MockParams(11, (1,)), 3: MockParams(12, (2,))}
+    counter = counter_class(search_dict)
+
+    assert counter.next_evaluation() == 4
+    assert counter.get_cost(2) == 12
+    assert dict(counter.search_dict) == search_dict
+
+
+def test_Counter_search_dict_snapshot():
+    counter = MockCounter()
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 11, 1)
+
+    search_dict = counter.search_dict
+
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 12, 2)
+
+    assert len(search_dict) == 1
+    assert list(search_dict) == [0]
+    assert 1 not in search_dict
+    assert len(counter.search_dict) == 2
+
+    with pytest.raises(TypeError):
+        search_dict[1] = MockParams(13, (3,))  # type: ignore
+
+
+def test_Counter_search_dict_pickle():
+    counter = MockCounter()
+    evaluation = counter.next_evaluation()
+    counter.set_params(evaluation, 11, 1)
+
+    test = pickle.loads(pickle.dumps(counter.search_dict))
+
+    assert isinstance(test, dict)
+    assert test == {0: MockParams(11, (1,))}
+
+
 def sphere_cost(x, c=0.0):
     #    The BSD 3-Clause License
     #    Copyright (c) 2014 Inria
@@ -389,6 +472,167 @@ def test_evaluator_fail_receive(caplog, mocker):
     assert exc_msg in caplog.text
 
 
+_mock_worker_state = {}
+
+
+def _init_mock_worker(pool_project_path):
+    _mock_worker_state["path"] = pool_project_path
+
+
+def _mock_worker(*args):
+    if args[0] < 0:
+        raise ValueError("Bang!")
+
+    if args[0] == 99:
+        os._exit(1)
+
+    if args[0] == 42:
+        time.sleep(60)
+
+    x = np.array(args)
+    return {"cost": sphere_cost(x), "path": _mock_worker_state["path"]}
+
+
+class MockPoolEvaluator(MockEvaluator):
+    def _get_pool_initializer(self, pool_project_path):
+        return _init_mock_worker, (pool_project_path,)
+
+    def _get_pool_task(self, worker_project_path, n_evals, *args):
+        return _mock_worker, args
+
+    def _get_pool_results(self, evaluation, worker_output):
+        return worker_output
+
+
+def test_evaluator_pool(mocker, tmpdir):
+    mocker.patch("dtocean_core.utils.optimiser.init_dir", autospec=True)
+    remove_retry = mocker.patch(
+        "dtocean_core.utils.optimiser.remove_retry", autospec=True
+    )
+    mock_core = mocker.MagicMock()
+
+    test = MockPoolEvaluator(mock_core, None, "mock", str(tmpdir), n_workers=2)
+
+    thread_queue = queue.Queue()
+    result_queue = queue.Queue()
+
+    item: list[Any] = [result_queue]
+    item.append(None)
+    item.append([1])
+    item.append(["mock1"])
+
+    thread_queue.put(item)
+
+    item: list[Any] = [result_queue]
+    item.append(None)
+    item.append([10])
+    item.append(["mock2"])
+
+    thread_queue.put(item)
+
+    try:
+        test(thread_queue, stop_empty=True)
+    finally:
+        test.close()
+
+    pool_project_path = str(tmpdir.join("mock_pool.dtop"))
+
+    assert result_queue.get() == (1.0, ["mock1"])
+    assert result_queue.get() == (100.0, ["mock2"])
+    mock_core.dump_project.assert_called_once_with(None, pool_project_path)
+    remove_retry.assert_called_once_with(pool_project_path)
+    assert test._pool is None
+
+
+def test_evaluator_pool_fail_execute(caplog, mocker, tmpdir):
+    mocker.patch("dtocean_core.utils.optimiser.init_dir", autospec=True)
+    mocker.patch("dtocean_core.utils.optimiser.remove_retry", autospec=True)
+    mock_core = mocker.MagicMock()
+
+    test = MockPoolEvaluator(mock_core, None, "mock", str(tmpdir), n_workers=1)
+
+    thread_queue = queue.Queue()
+    result_queue = queue.Queue()
+
+    item: list[Any] = [result_queue]
+    item.append(None)
+    item.append([-1])
+    item.append(["mock1"])
+
+    thread_queue.put(item)
+
+    try:
+        with caplog_for_logger(caplog, "dtocean_core"):
+            test(thread_queue, stop_empty=True)
+    finally:
+        test.close()
+
+    assert result_queue.get() == (np.nan, ["mock1"])
+    assert "Fail Execute" in caplog.text
+    assert "Bang!" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "x, worker_timeout, exc_msg",
+    [(99, None, "BrokenProcessPool"), (42, 10, "TimeoutError")],
+)
+def test_evaluator_pool_fail_worker(
+    caplog, mocker, tmpdir, x, worker_timeout, exc_msg
+):
+    mocker.patch("dtocean_core.utils.optimiser.init_dir", autospec=True)
+    mocker.patch("dtocean_core.utils.optimiser.remove_retry", autospec=True)
+    mock_core = mocker.MagicMock()
+
+    test = MockPoolEvaluator(
+        mock_core,
+        None,
+        "mock",
+        str(tmpdir),
+        n_workers=1,
+        worker_timeout=worker_timeout,
+    )
+
+    thread_queue = queue.Queue()
+    result_queue = queue.Queue()
+
+    item: list[Any] = [result_queue]
+    item.append(None)
+    item.append([x])
+    item.append(["mock1"])
+
+    thread_queue.put(item)
+
+    item: list[Any] = [result_queue]
+    item.append(None)
+    item.append([10])
+    item.append(["mock2"])
+
+    thread_queue.put(item)
+
+    try:
+        with caplog_for_logger(caplog, "dtocean_core"):
+            test(thread_queue, stop_empty=True)
+    finally:
+        test.close()
+
+    # The failed evaluation is recorded and a new pool serves the next
+    assert result_queue.get() == (np.nan, ["mock1"])
+    assert result_queue.get() == (100.0, ["mock2"])
+    assert "Fail Execute" in caplog.text
+    assert exc_msg in caplog.text
+    mock_core.dump_project.assert_called_once()
+
+
+def test_evaluator_pool_not_supported(mocker):
+    mocker.patch("dtocean_core.utils.optimiser.init_dir", autospec=True)
+    mock_core = mocker.MagicMock()
+
+    with pytest.raises(ValueError) as excinfo:
+        MockEvaluator(mock_core, None, "mock", "mock", n_workers=1)
+
+    assert "does not support process pools" in str(excinfo.value)
+
+
 def test_init_evolution_strategy(tmpdir):
     x0 = 5
     x_range = (-1, 10)
@@ -798,6 +1042,11 @@ def test_get_scale_factor_bad_n_sigmas(n_sigmas):
     assert "must be a positive whole number" in str(excinfo)
 
 
+def test_get_param_key():
+    test = _get_param_key([1.000000001, np.float64(2), [3, (4.0,)], "a"])
+    assert test == (1.0, 2.0, (3.0, (4.0,)), "a")
+
+
 def test_get_match_process():
     a = [[1, 1], [2, 2], [2, 2], [2, 2], [3, 3]]
     b = ["a", "b", "b", "b", "c"]
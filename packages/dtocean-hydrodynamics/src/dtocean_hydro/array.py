@@ -31,11 +31,15 @@ import logging
 import matplotlib.patches as patches
 import matplotlib.pyplot as plt
 import numpy as np
-from shapely.geometry import MultiPoint, MultiPolygon, Polygon
+from shapely.geometry import Polygon
 
 from dtocean_wave.utils.WatWaves import len2
 
-from .utils.ellipse import get_grid_inside_ellipse_percent
+from .utils.ellipse import (
+    get_grid_inside_ellipse_percent,
+    get_nearest_distances,
+)
+from .utils.geometry import points_intersect, points_intersect_any
 from .utils.visualise_polygons import plotCompositePolygon
 
 # Start logging
@@ -207,13 +211,6 @@ class Array_pkg(object):
         constraints
         """
 
-        def distances(xy1, xy2):
-            n = len(xy1)
-            d0 = np.subtract.outer(xy1[:, 0], xy2[:, 0])
-            d1 = np.subtract.outer(xy1[:, 1], xy2[:, 1])
-            distance = np.hypot(d0, d1)
-            return np.min(distance[distance > 0].reshape((n, n - 1)), axis=1)
-
         if self.coord is None:
             raise RuntimeError("No coordinates provided")
         elif len(self.coord) == 1:
@@ -221,7 +218,7 @@ class Array_pkg(object):
             self._mindist_percent_max = None
             return
 
-        dist = distances(self.coord, self.coord)
+        dist = get_nearest_distances(self.coord)
         self._actual_mindist = np.min(dist)
 
         angle = np.pi / 2 - self.mainAngle % np.pi
@@ -270,27 +267,18 @@ class Array_pkg(object):
             machine_mask = np.zeros(self.coord.shape[0], dtype=bool)
 
         else:
-            original_el = MultiPoint(self.coord)
-            lease_mask = np.array(
-                [self._lease_P.intersects(el) for el in original_el.geoms],
-                "bool",
-            )
+            lease_mask = points_intersect(self._lease_P, self.coord)
 
             # identify the points inside the lease
             if np.any(lease_mask):
+                reduced_el_array = self.coord[lease_mask]
+
                 # bathymetry related nogo zones
                 if self.Nogo_bathymetry is not None:
                     # In this case the NoGo zones can have feasible zones
                     # inside
-                    reduced_el_array = self.coord[lease_mask]
-                    reduced_mask = np.zeros(reduced_el_array.shape[0], "bool")
-                    reduced_el = MultiPoint(reduced_el_array)
-                    reduced_mask = np.array(
-                        [
-                            self.Nogo_bathymetry.intersects(el)
-                            for el in reduced_el.geoms
-                        ],
-                        "bool",
+                    reduced_mask = points_intersect(
+                        self.Nogo_bathymetry, reduced_el_array
                     )
                     nogo_bath_mask = lease_mask.copy()
                     nogo_bath_mask[nogo_bath_mask] = np.logical_not(
@@ -303,25 +291,14 @@ class Array_pkg(object):
                 # other nogo zones (external)
                 if nogo_list is not None:
                     self.nogo = nogo_list
-                    nogo_polygons = []
 
                     # Instantiates a list of Polygons for each nogo zone
-                    for el in nogo_list:
-                        nogo_polygons.append(Polygon(el))
-
-                    nogo = MultiPolygon(nogo_polygons)
+                    nogo_polygons = [Polygon(el) for el in nogo_list]
                     self._nogo_P = nogo_polygons
-                    reduced_el_array = self.coord[lease_mask]
-                    reduced_mask = np.zeros(reduced_el_array.shape[0], "bool")
-                    reduced_el = MultiPoint(reduced_el_array)
-
-                    for ng in nogo.geoms:
-                        ng_intersect = [
-                            ng.intersects(el) for el in reduced_el.geoms
-                        ]
-                        ng_intersect_array = np.array(ng_intersect, "bool")
-                        reduced_mask = ng_intersect_array + reduced_mask
 
+                    reduced_mask = points_intersect_any(
+                        nogo_polygons, reduced_el_array
+                    )
                     nogo_mask = lease_mask.copy()
                     nogo_mask[nogo_mask] = np.logical_not(reduced_mask)
 
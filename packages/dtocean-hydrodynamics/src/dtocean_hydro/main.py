@@ -43,6 +43,7 @@ from .configure import get_install_paths
 from .hydro import Hydro_pkg
 from .output import WP2output
 from .utils import optimiser
+from .utils.layout_cache import get_folder_stamp, get_hydro_key
 
 # Start logging
 module_logger = logging.getLogger(__name__)
@@ -60,6 +61,16 @@ class WP2:
         WP2input (WP2input class): WP2 input class.
         debug (boolean): if set to True, plots and additional command line
                          outputs are issued.
+        n_workers (int): number of threads used by the wave array model to
+                         solve the wave frequencies in parallel. If None,
+                         the frequencies are solved serially.
+        n_search_workers (int): number of processes used by the layout
+                         optimiser to evaluate candidate layouts in
+                         parallel. If None, the layouts are evaluated
+                         serially.
+        layout_cache_path (str): path of a file used to store the results of
+                         evaluated layouts between optimisation runs. If
+                         None, results are only cached in memory.
 
     Attributes:
             iInput (WP2input class): copy of the input argument.
@@ -90,6 +101,9 @@ class WP2:
         debug=False,
         search_class=None,
         optim_method=1,
+        n_workers=None,
+        n_search_workers=None,
+        layout_cache_path=None,
     ):
         # The input object is passed for use in the optimisation loop method
         self.iInput = WP2input
@@ -110,6 +124,9 @@ class WP2:
             self._search_class = search_class
 
         self._optim_method = optim_method
+        self._n_workers = n_workers
+        self._n_search_workers = n_search_workers
+        self._layout_cache_path = layout_cache_path
 
         if not WP2input.internalOptim:
             module_logger.info(
@@ -487,7 +504,12 @@ class WP2:
             )
 
         else:
-            hyd_obj = MultiBody(self.iHydroMB, self.iWEC, cylamplitude=True)
+            hyd_obj = MultiBody(
+                self.iHydroMB,
+                self.iWEC,
+                cylamplitude=True,
+                n_workers=self._n_workers,
+            )
 
         return hyd_obj
 
@@ -503,6 +525,11 @@ class WP2:
                 "The specified optimisation method ID is out of " "range."
             )
 
+        cache_key = None
+
+        if self._layout_cache_path is not None:
+            cache_key = self._get_layout_cache_key()
+
         opt_obj = self._search_class(
             opt_func,
             hyd_obj,
@@ -513,10 +540,32 @@ class WP2:
             self.iInput.M_data.OptThreshold,
             self.iInput.S_data.NogoAreas,
             debug=False,
+            n_workers=self._n_search_workers,
+            cache_path=self._layout_cache_path,
+            cache_key=cache_key,
         )
 
         return opt_obj
 
+    def _get_layout_cache_key(self):
+        # Identify the hydrodynamic model by its inputs and data files
+        M_data = self.iInput.M_data
+
+        if M_data.tidalFlag:
+            data_folder = M_data.tidal_data_folder
+
+            if data_folder is None:
+                data_folder = get_install_paths()["tidal_share_path"]
+
+        else:
+            data_folder = M_data.wave_data_folder
+
+        return get_hydro_key(
+            M_data,
+            self.iInput.S_data,
+            get_folder_stamp(data_folder),
+        )
+
 
 def get_device_depths(bathymetry, layout):
     if len(layout.shape) != 2:
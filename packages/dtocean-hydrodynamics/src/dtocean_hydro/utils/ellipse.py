@@ -16,6 +16,7 @@
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 
 def distance(x1, x2):
@@ -56,6 +57,17 @@ def inside_ellipse_percent(x, a, b):
     return percent
 
 
+def get_nearest_distances(grid):
+    """Return the distance from each point in the grid to its nearest
+    neighbour, found using a KD-tree."""
+
+    grid = np.asarray(grid, dtype=float)
+    tree = cKDTree(grid)
+    distances, _ = tree.query(grid, k=2)
+
+    return distances[:, 1]
+
+
 def get_grid_inside_ellipse_percent(
     grid,
     angle,
@@ -66,7 +78,19 @@ def get_grid_inside_ellipse_percent(
     """Determine whether any points in the grid lie within an ellipse placed
     around each point with semi-major axis max_tran and semi-minor axis
     max_long, rotated by angle. For each point the percentage distance along
-    the transect of the closest point and the ellipse is returned."""
+    the transect of the closest point and the ellipse is returned.
+
+    Only pairs of points closer than the ellipse's bounding radius are
+    compared, using a KD-tree."""
+
+    grid = np.asarray(grid, dtype=float)
+    max_dist = max(max_long, max_tran)
+
+    tree = cKDTree(grid)
+    pairs = tree.query_pairs(max_dist, output_type="ndarray")
+
+    if len(pairs) == 0:
+        return np.array([])
 
     rotator = np.array(
         [
@@ -75,37 +99,30 @@ def get_grid_inside_ellipse_percent(
         ]
     )
 
-    def f(x):
-        return np.dot(rotator, x)
-
-    def g(x):
-        return in_ellipse(x, max_tran, max_long)
-
-    def h(x):
-        return inside_ellipse_percent(x, max_tran, max_long)
-
-    result = []
-    max_dist = max(max_long, max_tran)
-
-    for p0 in grid:
-        centred = grid - p0
-        rotated = np.apply_along_axis(f, 1, centred)
-        all_dist = np.hypot(rotated[:, 0], rotated[:, 1])
-
-        logic = np.less_equal(all_dist, max_dist) & np.greater(all_dist, 0)
-        suspect = rotated[logic, :]
-        if suspect.shape[0] < 1:
-            continue
-
-        inside = suspect[np.apply_along_axis(g, 1, suspect), :]
-        if inside.shape[0] < 1:
-            continue
-
-        percents = np.apply_along_axis(h, 1, inside)
-        max_percents = max(percents)
-        if max_percents < atol:
-            continue
+    # The ellipse test and transect percentage are symmetric in the sign of
+    # the separation, so each pair is only evaluated once
+    rotated = np.dot(grid[pairs[:, 1]] - grid[pairs[:, 0]], rotator.T)
+    all_dist = np.hypot(rotated[:, 0], rotated[:, 1])
+
+    logic = np.greater(all_dist, 0) & in_ellipse(rotated.T, max_tran, max_long)
+    pairs = pairs[logic]
+    rotated = rotated[logic]
+
+    if len(pairs) == 0:
+        return np.array([])
+
+    # Distance to the ellipse along the transect relative to its radius
+    multiplier = (
+        max_tran
+        * max_long
+        / np.sqrt(
+            max_tran**2 * rotated[:, 1] ** 2 + max_long**2 * rotated[:, 0] ** 2
+        )
+    )
+    percents = np.abs(multiplier - 1) / multiplier
 
-        result.append(max_percents)
+    max_percents = np.zeros(len(grid))
+    np.maximum.at(max_percents, pairs[:, 0], percents)
+    np.maximum.at(max_percents, pairs[:, 1], percents)
 
-    return np.array(result)
+    return max_percents[max_percents >= atol]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2025 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+This module contains bulk geometric predicates for arrays of points.
+
+.. module:: geometry
+     :synopsis: Bulk point-in-polygon masking
+
+.. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
+"""
+
+import numpy as np
+import shapely
+
+
+def points_intersect(geometry, points):
+    """Return a boolean mask of the points which intersect the given
+    geometry, i.e. which lie inside it or on its boundary.
+
+    Args:
+        geometry (shapely.Geometry): the (multi)polygon to test against
+        points (numpy.ndarray): (n, 2) array of point coordinates
+
+    Returns:
+        numpy.ndarray: boolean mask of length n
+    """
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+
+    if geometry is None or geometry.is_empty or len(points) == 0:
+        return np.zeros(len(points), dtype=bool)
+
+    shapely.prepare(geometry)
+
+    return shapely.intersects_xy(geometry, points[:, 0], points[:, 1])
+
+
+def points_intersect_any(geometries, points):
+    """Return a boolean mask of the points which intersect any of the given
+    geometries.
+
+    Args:
+        geometries (list): list of shapely (multi)polygons
+        points (numpy.ndarray): (n, 2) array of point coordinates
+
+    Returns:
+        numpy.ndarray: boolean mask of length n
+    """
+
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    mask = np.zeros(len(points), dtype=bool)
+
+    for geometry in geometries:
+        remaining = ~mask
+        if not remaining.any():
+            break
+        mask[remaining] = points_intersect(geometry, points[remaining])
+
+    return mask
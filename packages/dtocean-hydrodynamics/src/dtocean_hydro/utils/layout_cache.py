@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2025 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+This module contains a cache of the array performance for evaluated layouts,
+used to avoid repeating the array interaction calculation during the
+optimisation.
+
+.. module:: layout_cache
+     :synopsis: Layout evaluation cache
+
+.. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
+"""
+
+import hashlib
+import logging
+import os
+import zipfile
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Start logging
+module_logger = logging.getLogger(__name__)
+
+
+class LayoutCache(object):
+    """
+    LayoutCache: least recently used cache of the annual energy production
+        and q-factor of evaluated array layouts. Layouts are identified by
+        their set of device coordinates, quantised to the given resolution,
+        so the order of the devices is not significant.
+
+    Args:
+        maxsize (int): maximum number of layouts stored
+        resolution (float)[m]: coordinate quantisation step
+        hydro_key (str, optional): identifier of the hydrodynamic
+            configuration, used to separate results in a persistent cache
+        path (str, optional): path of a numpy .npz file used to store the
+            cache between runs. Existing entries are loaded on
+            initialisation.
+
+    Attributes:
+        hits (int): number of successful lookups
+        misses (int): number of failed lookups
+    """
+
+    def __init__(
+        self,
+        maxsize=1024,
+        resolution=0.01,
+        hydro_key=None,
+        path=None,
+    ):
+        if maxsize < 1:
+            raise ValueError("Argument maxsize must be greater than zero")
+
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hydro_key = hydro_key
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+        if path is not None and os.path.isfile(path):
+            self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, coords):
+        """
+        get: return the stored (AEP, q-factor) tuple for the given device
+            coordinates, or None if the layout has not been evaluated.
+        """
+
+        key = self._make_key(coords)
+
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return self._entries[key]
+
+    def put(self, coords, aep, q_factor):
+        """
+        put: store the AEP and q-factor for the given device coordinates,
+            evicting the least recently used layout if the cache is full.
+        """
+
+        key = self._make_key(coords)
+        self._store(self._entries, key, (aep, q_factor))
+
+    def get_key(self, coords):
+        """
+        get_key: return the key identifying the given device coordinates in
+            the cache. Layouts with equal keys share a cache entry.
+        """
+
+        return self._make_key(coords)
+
+    def save(self):
+        """save: write the cache to the file given by the path attribute"""
+
+        if self.path is None:
+            raise RuntimeError("No cache file path provided")
+
+        hydro_keys = []
+        has_hydro_key = []
+        layouts = []
+        values = []
+
+        for (hydro_key, layout), value in self._entries.items():
+            hydro_keys.append("" if hydro_key is None else hydro_key)
+            has_hydro_key.append(hydro_key is not None)
+            layouts.append(np.frombuffer(layout, dtype=np.int64))
+            values.append(value)
+
+        sizes = [len(layout) for layout in layouts]
+        values = np.array(values, dtype=float).reshape(-1, 2)
+
+        with open(self.path, "wb") as f:
+            np.savez(
+                f,
+                hydro_keys=np.array(hydro_keys, dtype=str),
+                has_hydro_key=np.array(has_hydro_key, dtype=bool),
+                offsets=np.cumsum([0] + sizes, dtype=np.int64),
+                layouts=np.concatenate(layouts + [np.empty(0, np.int64)]),
+                aep=values[:, 0],
+                q_factor=values[:, 1],
+            )
+
+    def log_stats(self):
+        module_logger.info(
+            "Layout cache hits: {} misses: {} size: {}".format(
+                self.hits, self.misses, len(self._entries)
+            )
+        )
+
+    def _make_key(self, coords):
+        quantised = np.round(
+            np.asarray(coords, dtype=float).reshape(-1, 2) / self.resolution
+        ).astype(np.int64)
+        order = np.lexsort((quantised[:, 1], quantised[:, 0]))
+
+        return (self.hydro_key, quantised[order].tobytes())
+
+    def _load(self):
+        assert self.path is not None
+
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                hydro_keys = data["hydro_keys"].tolist()
+                has_hydro_key = data["has_hydro_key"]
+                offsets = data["offsets"]
+                layouts = data["layouts"].astype(np.int64)
+                aep = data["aep"]
+                q_factor = data["q_factor"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            module_logger.warning(
+                "Could not load layout cache file {}: {}".format(self.path, e)
+            )
+            return
+
+        for i, hydro_key in enumerate(hydro_keys):
+            if not has_hydro_key[i]:
+                hydro_key = None
+
+            layout = layouts[offsets[i] : offsets[i + 1]].tobytes()
+            value = (float(aep[i]), float(q_factor[i]))
+            self._entries[(hydro_key, layout)] = value
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _store(self, entries, key, value):
+        entries[key] = value
+        entries.move_to_end(key)
+
+        while len(entries) > self.maxsize:
+            entries.popitem(last=False)
+
+
+def get_hydro_key(*inputs):
+    """Return a hash identifying the given inputs of a hydrodynamic model,
+    for use as a LayoutCache hydro_key. Arrays, tables, geometries, scalars,
+    strings, containers and the attributes of other objects are encoded
+    explicitly, so the key does not depend on the pickle format or the order
+    in which attributes were set."""
+
+    digest = hashlib.sha1()
+    _update_digest(digest, inputs)
+
+    return digest.hexdigest()
+
+
+def get_folder_stamp(path):
+    """Return the names, sizes and modification times of the files in the
+    given folder, or None if the path is not a folder. Used to identify data
+    files that are read by a hydrodynamic model with get_hydro_key."""
+
+    if path is None or not os.path.isdir(path):
+        return None
+
+    stamp = []
+
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            stat = os.stat(file_path)
+            rel_path = os.path.relpath(file_path, path).replace(os.sep, "/")
+            stamp.append((rel_path, stat.st_size, stat.st_mtime_ns))
+
+    return stamp
+
+
+def _update_digest(digest, value):
+    def update(tag, data=b""):
+        digest.update(tag.encode())
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        update(type(value).__name__, repr(value).encode())
+    elif isinstance(value, bytes):
+        update("bytes", value)
+    elif isinstance(value, (np.ndarray, np.generic)):
+        array = np.asarray(value)
+
+        if array.dtype.hasobject:
+            update("object_array", repr(array.shape).encode())
+            _update_digest(digest, array.ravel().tolist())
+        else:
+            array = np.ascontiguousarray(array)
+            update(
+                "array", "{}{}".format(array.dtype.str, array.shape).encode()
+            )
+            update("data", array.tobytes())
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        update(type(value).__name__)
+        _update_digest(digest, value.index.tolist())
+
+        if isinstance(value, pd.DataFrame):
+            _update_digest(digest, value.columns.tolist())
+
+        _update_digest(digest, value.to_numpy())
+    elif isinstance(value, dict):
+        update("dict", str(len(value)).encode())
+
+        for key in sorted(value, key=repr):
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+
+        if isinstance(value, (set, frozenset)):
+            items = sorted(value, key=repr)
+
+        update(type(value).__name__, str(len(value)).encode())
+
+        for item in items:
+            _update_digest(digest, item)
+    elif hasattr(value, "wkb"):
+        update("geometry", value.wkb)
+    elif hasattr(value, "__dict__"):
+        update(type(value).__qualname__)
+        _update_digest(digest, vars(value))
+    else:
+        update(type(value).__qualname__, repr(value).encode())
@@ -29,15 +29,24 @@ constraints.
 """
 
 import logging
+import multiprocessing
 import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import copy
 from math import sqrt
 
 import cma
 import numpy as np
 
+from .layout_cache import LayoutCache
+
 # Start logging
 module_logger = logging.getLogger(__name__)
 
+# SearchOptimum copy used by each worker process of an evaluation pool
+_worker_searcher = None
+
 
 class SearchOptimum(object):
     """
@@ -61,6 +70,17 @@ class SearchOptimum(object):
 
         debug (boolean): if set to True, plots and additional command line
             outputs are issued.
+        n_workers (int, optional): number of processes used to evaluate
+            each population of candidate layouts in parallel. If None, the
+            candidates are evaluated serially.
+        cache_size (int, optional): maximum number of evaluated layouts
+            stored to avoid repeating the array interaction calculation. If
+            None, no cache is used.
+        cache_path (str, optional): path of a file used to store the layout
+            cache between runs.
+        cache_key (str, optional): identifier of the inputs of the
+            hydrodynamic model, as given by layout_cache.get_hydro_key, used
+            to separate the results stored in a persistent layout cache.
 
     Attributes:
         main (WP2 class): same as args
@@ -87,7 +107,14 @@ class SearchOptimum(object):
         min_q_factor,
         nogo_areas,
         debug=False,
+        n_workers=None,
+        cache_size=1024,
+        cache_path=None,
+        cache_key=None,
     ):
+        if n_workers is not None and n_workers < 1:
+            raise ValueError("Argument n_workers must be greater than zero")
+
         self.nogo_areas = nogo_areas
         self._optim_func = optim_func
         self._array = array_obj
@@ -107,8 +134,25 @@ class SearchOptimum(object):
         self._max_num_dev = max_num_dev
         self._min_dist = min(array_obj.Dmin)
 
+        # set parallel evaluation
+        self._n_workers = n_workers
+        self._pool = None
+
+        # set layout evaluation cache
+        self._cache = None
+
+        if cache_size is not None:
+            self._cache = LayoutCache(
+                cache_size, hydro_key=cache_key, path=cache_path
+            )
+
         self.__set_problem_parameters()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
     def __set_problem_parameters(self):
         """
         __set_problem_parameters: method used to set up the problem order based
@@ -166,6 +210,12 @@ class SearchOptimum(object):
         # call the optimisation method
         xopt = self._optim_func(self)
 
+        if self._cache is not None:
+            self._cache.log_stats()
+
+            if self._cache.path is not None:
+                self._cache.save()
+
         # rescale the optimal solution, if any.
         if xopt == -1:
             errStr = (
@@ -363,6 +413,112 @@ class SearchOptimum(object):
         fval = self.optimCostFun(xNorm)
         return fval[0], fval[1]
 
+    @contextmanager
+    def evaluation_pool(self):
+        """
+        evaluation_pool: context manager which, if n_workers is set, starts a
+            pool of worker processes used by optimCostFunNormBatch. Each
+            worker is initialised once with a copy of this object, without
+            the layout cache, so the pool must be started after any changes
+            to the search state.
+        """
+
+        if self._n_workers is None or self._pool is not None:
+            yield
+            return
+
+        # The layout cache is only used by this process
+        searcher = copy(self)
+        searcher._cache = None
+
+        pool = ProcessPoolExecutor(
+            max_workers=self._n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(searcher,),
+        )
+        self._pool = pool
+
+        try:
+            yield
+        finally:
+            self._pool = None
+            pool.shutdown()
+
+    def optimCostFunNormBatch(self, xs):
+        """
+        optimCostFunNormBatch: evaluate optimCostFunNorm for a collection of
+            normalised parameters, in parallel if an evaluation pool is
+            running. The results are returned in the order of xs.
+
+            When running in parallel, the layouts are generated and looked
+            up in the layout cache by this process, in the order of xs, and
+            only the uncached layouts are solved by the workers, so the
+            results are the same as for serial evaluation.
+
+        Args:
+            xs (list): list of lists of normalised parameters
+
+        Returns:
+            fvals (list): list of (AEP, q factor) tuples
+        """
+
+        if self._pool is None:
+            return [self.optimCostFunNorm(x) for x in xs]
+
+        fvals = [None] * len(xs)
+        solve_coords = []
+        pending = []
+        pending_keys = set()
+
+        for i, x in enumerate(xs):
+            xNorm = self.scale_param(np.array(x))
+            coords, fval = self._get_layout(xNorm)
+
+            if coords is None:
+                fvals[i] = fval
+                continue
+
+            if self._cache is None:
+                pending.append((i, coords, len(solve_coords)))
+                solve_coords.append(coords)
+                continue
+
+            # Layouts matching an earlier layout in the batch are read from
+            # the cache once the earlier layout is solved
+            key = self._cache.get_key(coords)
+
+            if key in pending_keys:
+                pending.append((i, coords, None))
+                continue
+
+            cached = self._cache.get(coords)
+
+            if cached is not None:
+                fvals[i] = self._get_cost(coords, *cached)
+                continue
+
+            pending.append((i, coords, len(solve_coords)))
+            pending_keys.add(key)
+            solve_coords.append(coords)
+
+        energies = list(self._pool.map(_worker_get_energy, solve_coords))
+
+        for i, coords, solve_idx in pending:
+            if solve_idx is None:
+                assert self._cache is not None
+                energy = self._cache.get(coords)
+                assert energy is not None
+            else:
+                energy = energies[solve_idx]
+
+                if self._cache is not None:
+                    self._cache.put(coords, *energy)
+
+            fvals[i] = self._get_cost(coords, *energy)
+
+        return [(fval[0], fval[1]) for fval in fvals]
+
     def optimCostFun(self, x):
         """
         optimCostFun: the method calculate the AEP and q-factor for the given
@@ -376,6 +532,33 @@ class SearchOptimum(object):
             q (float): q factor for the given array
         """
 
+        coords, fval = self._get_layout(x)
+
+        if coords is None:
+            return fval
+
+        # solve the array interaction, unless the layout has already
+        # been evaluated
+        aep_array, q_array = self._get_energy(coords)
+
+        return self._get_cost(coords, aep_array, q_array)
+
+    def _get_layout(self, x):
+        """
+        _get_layout: generate the array layout for the given configuration
+            and check the constraints that do not require the array
+            interaction to be solved.
+
+        Args:
+            x (list): list of 4 parameters used to build the array layout
+
+        Return:
+            coords (numpy.ndarray): coordinates of the devices inside the
+                active area, or None if the layout is not valid
+            fval (tuple): penalty (AEP, q factor) tuple if the layout is not
+                valid, otherwise None
+        """
+
         NR, NC, IR, IC, beta, psi = self.param_conditioning(x)
 
         if beta < 0.05 and self._Opt != 3:
@@ -416,54 +599,14 @@ class SearchOptimum(object):
                 # return the squared error from actual value and bound
                 # due to the computational constraints this penality term is
                 # magnified by a factor 2
-                maxdev_error = -(
-                    (
-                        (
-                            self._array.coord[inside].shape[0]
-                            / self._max_num_dev
-                            - 1
-                        )
-                        * 200
-                    )
-                    ** 2
-                )
+                maxdev_error = -(((n_devs / self._max_num_dev - 1) * 200) ** 2)
 
-                return maxdev_error, -1
+                return None, (maxdev_error, -1)
 
             if self._debug:
                 module_logger.info("OK constr")
 
-            # solve the array interaction
-            res = self._hyd_obj.energy(self._array.coord[inside])
-
-            module_logger.info(
-                "Number of devices: {} AEP: {} q-factor: " "{}".format(
-                    self._array.coord[inside].shape[0],
-                    res.AEP_array,
-                    res.q_array,
-                )
-            )
-
-            if res.q_array >= self._min_q_factor:
-                if self._debug:
-                    module_logger.info(
-                        "Valid config: actual q-factor {} --> "
-                        "min q-factor {}".format(
-                            res.q_array, self._min_q_factor
-                        )
-                    )
-
-                return res.AEP_array, res.q_array
-
-            if self._debug:
-                module_logger.info("Not valid: q < q_min")
-
-            # return the squared error from actual value and bound
-            qfactor_error = -(
-                ((res.q_array / self._min_q_factor - 1) * 100.0) ** 2
-            )
-
-            return qfactor_error, res.q_array
+            return self._array.coord[inside], None
 
         if self._debug:
             module_logger.warning(
@@ -476,19 +619,81 @@ class SearchOptimum(object):
             ((self._array._actual_mindist / self._min_dist - 1) * 100.0) ** 2
         )
 
-        return mindist_error, -1
+        return None, (mindist_error, -1)
+
+    def _get_cost(self, coords, aep_array, q_array):
+        """
+        _get_cost: return the (AEP, q factor) tuple of a solved array layout,
+            replacing the AEP with a penalty if the q-factor constraint is
+            not met.
+        """
+
+        module_logger.info(
+            "Number of devices: {} AEP: {} q-factor: " "{}".format(
+                coords.shape[0],
+                aep_array,
+                q_array,
+            )
+        )
+
+        if q_array >= self._min_q_factor:
+            if self._debug:
+                module_logger.info(
+                    "Valid config: actual q-factor {} --> "
+                    "min q-factor {}".format(q_array, self._min_q_factor)
+                )
+
+            return aep_array, q_array
+
+        if self._debug:
+            module_logger.info("Not valid: q < q_min")
+
+        # return the squared error from actual value and bound
+        qfactor_error = -(((q_array / self._min_q_factor - 1) * 100.0) ** 2)
+
+        return qfactor_error, q_array
+
+    def _get_energy(self, coords):
+        """
+        _get_energy: return the AEP and q-factor of the array with the given
+            device coordinates, using the layout cache if available.
+        """
+
+        if self._cache is not None:
+            cached = self._cache.get(coords)
+
+            if cached is not None:
+                return cached
+
+        res = self._hyd_obj.energy(coords)
+
+        if self._cache is not None:
+            self._cache.put(coords, res.AEP_array, res.q_array)
+
+        return res.AEP_array, res.q_array
+
+
+def _init_worker(searcher):
+    global _worker_searcher
+    _worker_searcher = searcher
+
+
+def _worker_get_energy(coords):
+    assert _worker_searcher is not None
+    return _worker_searcher._get_energy(coords)
 
 
 def method_brutal_force(searcher, N=5):
     x = np.linspace(searcher._min_bound, searcher._max_bound, N)
     y = np.linspace(searcher._min_bound, searcher._max_bound, N)
-    fit = np.zeros((N * N))
-    ind = -1
-    for ii, inter_col in enumerate(x):
-        for jj, beta in enumerate(y):
-            ind += 1
-            print("iteration {} over {}".format(ind + 1, len(x) * len(y)))
-            fit[ind] = -searcher.optimCostFunNorm((inter_col, beta))[0]
+    candidates = [(inter_col, beta) for inter_col in x for beta in y]
+
+    module_logger.info("Evaluating {} configurations".format(len(candidates)))
+
+    with searcher.evaluation_pool():
+        temp = searcher.optimCostFunNormBatch(candidates)
+
+    fit = np.array([(-el[0]) for el in temp])
     # index = np.unravel_index(fit.argmin(), fit.shape)
     index = fit.argmin()
     pickle.dump(
@@ -542,18 +747,19 @@ def method_cma_es(searcher, tolfun=1e1, tolx=1e-3, maxiter=200, maxfevals=2000):
     es.opts.set("maxiter", maxiter)
     es.opts.set("maxfevals", maxfevals)
 
-    while not es.stop():
-        solutions = es.ask()
+    with searcher.evaluation_pool():
+        while not es.stop():
+            solutions = es.ask()
 
-        # reduce the significant digits of the search space
-        # solutions = [np.around(s, decimals=1) for s in solutions]
-        temp = [searcher.optimCostFunNorm(s) for s in solutions]
-        fitness = [(-el[0]) for el in temp]
-        es.tell(solutions, fitness)
+            # reduce the significant digits of the search space
+            # solutions = [np.around(s, decimals=1) for s in solutions]
+            temp = searcher.optimCostFunNormBatch(solutions)
+            fitness = [(-el[0]) for el in temp]
+            es.tell(solutions, fitness)
 
-        if searcher._debug:
-            es.logger.add()
-            es.disp(10)
+            if searcher._debug:
+                es.logger.add()
+                es.disp(10)
 
     if searcher._debug:
         es.result_pretty()
@@ -583,13 +789,12 @@ def method_monte_carlo(searcher, maxiter=5):
     xx *= searcher._max_bound - searcher._min_bound
     xx += searcher._min_bound
 
-    fit = np.zeros(maxiter)
+    module_logger.info("Evaluating {} configurations".format(maxiter))
 
-    for i in range(maxiter):
-        module_logger.info("iteration #: {}".format(i))
+    with searcher.evaluation_pool():
+        temp = searcher.optimCostFunNormBatch(list(xx.T))
 
-        x = xx[:, i]
-        fit[i] = -searcher.optimCostFunNorm(x)[0]
+    fit = np.array([(-el[0]) for el in temp])
     # find max average energy for arrays with q-factor larger than q_min
     index = fit.argmin()
     pickle.dump([fit, xx], open("optimisation_results_brutal_force.pkl", "wb"))
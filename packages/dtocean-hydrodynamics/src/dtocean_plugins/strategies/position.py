@@ -163,6 +163,7 @@ class OptimiserThread(threading.Thread):
                 continue_event_state = self._continue_event.is_set()
 
             if self._stop_event.is_set():
+                self._optimiser.close()
                 self._set_stopped()
                 return
 
@@ -39,8 +39,14 @@ from dtocean_core.menu import ModuleMenu
 from dtocean_core.utils import optimiser as opt
 from dtocean_core.utils.files import remove_retry
 from dtocean_core.utils.maths import bearing_to_radians
+from dtocean_hydro.utils.ellipse import get_nearest_distances
 
-from .iterator import get_positioner
+from .iterator import (
+    get_positioner,
+    get_spacing_radius,
+    init_worker,
+    main_worker,
+)
 
 # Set up logging
 module_logger = logging.getLogger(__name__)
@@ -69,6 +75,14 @@ PositionParams = namedtuple(
 
 
 class PositionCounter(opt.Counter):
+    """Records the parameters of each position evaluation. The cost of a
+    position depends on the number of evaluations, which is not given to
+    get_cost, so recorded evaluations are never reused. They are not added
+    to the parameter index, so get_cost does not check them."""
+
+    def __init__(self, search_dict=None):
+        super().__init__(search_dict, index_params=True)
+
     def _set_params(
         self,
         worker_project_path,  # pylint: disable=arguments-differ
@@ -103,6 +117,11 @@ class PositionCounter(opt.Counter):
 
         return params
 
+    def _get_args(self, params):  # pylint: disable=unused-argument
+        """Return None, so that recorded evaluations are never matched."""
+
+        return None
+
     def _get_cost(self, *args):  # pylint: disable=arguments-differ
         """Return cost if parameters in params object match input args, else
         return None."""
@@ -121,6 +140,8 @@ class PositionEvaluator(opt.Evaluator):
         restart=False,
         clean_existing_dir=False,
         violation_log_name="violations.txt",
+        n_workers=None,
+        worker_timeout=None,
     ):
         super(PositionEvaluator, self).__init__(
             core,
@@ -129,10 +150,15 @@ class PositionEvaluator(opt.Evaluator):
             worker_directory,
             restart,
             clean_existing_dir,
+            n_workers,
+            worker_timeout,
         )
 
         self._tool_man = ToolManager()
         self._positioner = get_positioner(self._core, self._base_project)
+        self._spacing_radius = get_spacing_radius(
+            self._core, self._base_project
+        )
         self._violation_log_path = os.path.join(
             self._worker_directory, violation_log_name
         )
@@ -174,6 +200,36 @@ class PositionEvaluator(opt.Evaluator):
         must include the key "cost". For constraint violation the cost key
         should be set to np.nan"""
 
+        worker_results_path = self._get_worker_results_path(evaluation)
+
+        with open(worker_results_path, "r") as stream:
+            results = yaml.load(stream, Loader=yaml.FullLoader)
+
+        return self._read_results(results, worker_results_path)
+
+    def _get_pool_initializer(self, pool_project_path):
+        """Return a function and its arguments, used to initialise each
+        worker process of the pool with the base project stored at
+        pool_project_path."""
+        return init_worker, (pool_project_path,)
+
+    def _get_pool_task(self, worker_project_path, n_evals, *args):
+        """Return a function and its arguments, used to evaluate a solution
+        in a worker process of the pool."""
+
+        prj_base_path, _ = os.path.splitext(worker_project_path)
+        task_args = (prj_base_path,) + tuple(args[:7]) + (n_evals,)
+
+        return main_worker, task_args
+
+    def _get_pool_results(self, evaluation, worker_output):
+        """Return the results for the given evaluation from the value
+        returned by the pool task, as for _get_worker_results."""
+
+        worker_results_path = self._get_worker_results_path(evaluation)
+        return self._read_results(worker_output, worker_results_path)
+
+    def _get_worker_results_path(self, evaluation):
         worker_file_root_path = "{}_{}".format(
             self._root_project_base_name, evaluation
         )
@@ -182,9 +238,9 @@ class PositionEvaluator(opt.Evaluator):
             self._worker_directory, worker_results_name
         )
 
-        with open(worker_results_path, "r") as stream:
-            results = yaml.load(stream, Loader=yaml.FullLoader)
+        return worker_results_path
 
+    def _read_results(self, results, worker_results_path):
         flag = results["status"]
         cost = np.nan
 
@@ -264,6 +320,13 @@ class PositionEvaluator(opt.Evaluator):
 
             raise RuntimeError(e)
 
+        # No device can lie inside another's minimum spacing ellipse if all
+        # the nearest neighbours are further away than its bounding radius
+        if self._spacing_radius is not None and len(positions) > 1:
+            nearest = get_nearest_distances(positions)
+            if nearest.min() > self._spacing_radius:
+                return False
+
         spacing_tool = self._tool_man.get_tool("Device Minimum Spacing Check")
         spacing_tool.configure(positions)
 
@@ -285,6 +348,11 @@ class PositionEvaluator(opt.Evaluator):
 
     def _cleanup_hook(self, worker_project_path, flag, lines):  # pylint: disable=arguments-differ,unused-argument
         """Hook to clean up simulation files as required"""
+
+        # Project files are not written when using a process pool
+        if self._n_workers is not None:
+            return
+
         remove_retry(worker_project_path)
 
     def _log_violation(self, details, *args):
@@ -337,10 +405,19 @@ class PositionOptimiser:
         max_resample_factor = "auto2"
         max_resample_loop_factor = None
         auto_resample_iterations = None
+        n_workers = None
+        worker_timeout = None
 
         if _is_option_set(config, "clean_existing_dir"):
             clean_existing_dir = config["clean_existing_dir"]
 
+        if _is_option_set(config, "use_process_pool"):
+            if config["use_process_pool"]:
+                n_workers = n_threads
+
+        if _is_option_set(config, "worker_timeout"):
+            worker_timeout = config["worker_timeout"]
+
         if _is_option_set(config, "maximise"):
             maximise = config["maximise"]
 
@@ -456,6 +533,8 @@ class PositionOptimiser:
             self._worker_directory,
             objective,
             clean_existing_dir=clean_existing_dir,
+            n_workers=n_workers,
+            worker_timeout=worker_timeout,
         )
 
         # Store the base project for potential restart (if necessary)
@@ -547,10 +626,19 @@ class PositionOptimiser:
         timeout = None
         max_resample_loop_factor = None
         auto_resample_iterations = None
+        n_workers = None
+        worker_timeout = None
 
         if _is_option_set(config, "maximise"):
             maximise = config["maximise"]
 
+        if _is_option_set(config, "use_process_pool"):
+            if config["use_process_pool"]:
+                n_workers = n_threads
+
+        if _is_option_set(config, "worker_timeout"):
+            worker_timeout = config["worker_timeout"]
+
         if _is_option_set(config, "timeout"):
             timeout = config["timeout"]
 
@@ -610,6 +698,8 @@ class PositionOptimiser:
             self._worker_directory,
             objective,
             restart=True,
+            n_workers=n_workers,
+            worker_timeout=worker_timeout,
         )
 
         self._cma_main = opt.Main(
@@ -639,6 +729,7 @@ class PositionOptimiser:
 
         if self._cma_main.stop:
             module_logger.info("Position optimisation complete")
+            self._cma_main.evaluator.close()
             self.stop = True
             return
 
@@ -664,6 +755,11 @@ class PositionOptimiser:
         if "auto" not in str(max_resample_factor):
             self._dump_config = False
 
+    def close(self):
+        if self._cma_main is None:
+            return
+        self._cma_main.evaluator.close()
+
     def get_es(self):
         if self._cma_main is None:
             return None
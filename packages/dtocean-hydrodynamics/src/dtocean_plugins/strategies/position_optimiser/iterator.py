@@ -31,6 +31,11 @@ from dtocean_core.pipeline import Tree
 
 from .positioner import ParaPositioner
 
+# State of process pool workers, set by init_worker
+_worker_core = None
+_worker_project = None
+_worker_positioner = None
+
 
 def main(
     core,
@@ -47,29 +52,16 @@ def main(
     save_project=False,
     write_results=True,
 ):
-    grid_orientation = float(grid_orientation)
-    delta_row = float(delta_row)
-    delta_col = float(delta_col)
-    n_nodes = int(float(n_nodes))
-    t1 = float(t1)
-    t2 = float(t2)
-
-    params_dict = {
-        "theta": grid_orientation,
-        "dr": delta_row,
-        "dc": delta_col,
-        "n_nodes": n_nodes,
-        "t1": t1,
-        "t2": t2,
-    }
-
-    if dev_per_string is not None:
-        dev_per_string = int(float(dev_per_string))
-        params_dict["dev_per_string"] = dev_per_string
-
-    if n_evals is not None:
-        n_evals = int(float(n_evals))
-        params_dict["n_evals"] = n_evals
+    params, params_dict = _convert_params(
+        grid_orientation,
+        delta_row,
+        delta_col,
+        n_nodes,
+        t1,
+        t2,
+        dev_per_string,
+        n_evals,
+    )
 
     error_message = None
     project = None
@@ -77,19 +69,7 @@ def main(
     try:
         project = core.load_project(prj_file_path)
         positioner = get_positioner(core, project)
-        iterate(
-            core,
-            project,
-            positioner,
-            grid_orientation,
-            delta_row,
-            delta_col,
-            n_nodes,
-            t1,
-            t2,
-            dev_per_string,
-            n_evals,
-        )
+        iterate(core, project, positioner, *params)
 
         flag = "Success"
 
@@ -118,6 +98,118 @@ def main(
     )
 
 
+def init_worker(prj_file_path):
+    """Initialise a process pool worker, keeping a Core and the base project
+    loaded from prj_file_path for the lifetime of the process."""
+
+    global _worker_core, _worker_project, _worker_positioner  # pylint: disable=global-statement
+
+    _worker_core = Core()
+    _worker_project = _worker_core.load_project(prj_file_path)
+    _worker_positioner = get_positioner(_worker_core, _worker_project)
+
+
+def main_worker(
+    prj_base_path,
+    grid_orientation,
+    delta_row,
+    delta_col,
+    n_nodes,
+    t1,
+    t2,
+    dev_per_string=None,
+    n_evals=None,
+):
+    """Evaluate the given parameters on a copy of the base project held by a
+    process pool worker (see init_worker). The results are written to
+    <prj_base_path>.yaml and returned."""
+
+    if _worker_core is None or _worker_project is None:
+        raise RuntimeError("Process pool worker is not initialised")
+
+    params, params_dict = _convert_params(
+        grid_orientation,
+        delta_row,
+        delta_col,
+        n_nodes,
+        t1,
+        t2,
+        dev_per_string,
+        n_evals,
+    )
+
+    error_message = None
+    project = None
+
+    try:
+        project = _worker_project.to_project()
+        iterate(_worker_core, project, _worker_positioner, *params)
+        flag = "Success"
+
+    except Exception as e:  # pylint: disable=broad-except
+        flag = "Exception"
+        error_message = e
+
+    yaml_dict = write_result_file(
+        _worker_core,
+        project,
+        prj_base_path,
+        params_dict,
+        flag,
+        error_message,
+    )
+
+    return yaml_dict
+
+
+def _convert_params(
+    grid_orientation,
+    delta_row,
+    delta_col,
+    n_nodes,
+    t1,
+    t2,
+    dev_per_string=None,
+    n_evals=None,
+):
+    grid_orientation = float(grid_orientation)
+    delta_row = float(delta_row)
+    delta_col = float(delta_col)
+    n_nodes = int(float(n_nodes))
+    t1 = float(t1)
+    t2 = float(t2)
+
+    params_dict = {
+        "theta": grid_orientation,
+        "dr": delta_row,
+        "dc": delta_col,
+        "n_nodes": n_nodes,
+        "t1": t1,
+        "t2": t2,
+    }
+
+    if dev_per_string is not None:
+        dev_per_string = int(float(dev_per_string))
+        params_dict["dev_per_string"] = dev_per_string
+
+    if n_evals is not None:
+        n_evals = int(float(n_evals))
+        params_dict["n_evals"] = n_evals
+
+    params = (
+        grid_orientation,
+        delta_row,
+        delta_col,
+        n_nodes,
+        t1,
+        t2,
+        dev_per_string,
+        n_evals,
+    )
+
+    return params, params_dict
+
+
 def iterate(
     core,
     project,
@@ -269,6 +361,20 @@ def get_positioner(core, project):
     return positioner
 
 
+def get_spacing_radius(core, project):
+    """Return the bounding radius of the device minimum spacing ellipse, or
+    None if the minimum distances are not available."""
+
+    min_dist_vars = ["device.minimum_distance_x", "device.minimum_distance_y"]
+
+    if not all(core.has_data(project, var) for var in min_dist_vars):
+        return None
+
+    min_dists = [core.get_data_value(project, var) for var in min_dist_vars]
+
+    return float(max(min_dists))
+
+
 def write_result_file(
     core,
     project,
@@ -310,6 +416,8 @@ def write_result_file(
     with open(yaml_path, "w") as stream:
         yaml.dump(yaml_dict, stream, default_flow_style=False)
 
+    return yaml_dict
+
 
 def interface():
     parser = argparse.ArgumentParser()
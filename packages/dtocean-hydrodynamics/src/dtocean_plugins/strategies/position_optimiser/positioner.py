@@ -28,6 +28,7 @@ from shapely.geometry import LineString, MultiPoint, Point, Polygon, box
 from shapely.ops import nearest_points, polylabel
 
 import dtocean_hydro.utils.bathymetry as bathymetry
+from dtocean_hydro.utils.geometry import points_intersect
 
 
 class DevicePositioner:
@@ -106,12 +107,17 @@ class DevicePositioner:
         )
 
     def _get_valid_nodes(self, nodes):
-        new_nodes = [
-            (x, y) for x, y in nodes if Point(x, y).intersects(self._valid_poly)
-        ]
-        nodes_array = np.array(new_nodes)
+        nodes = np.asarray(nodes)
 
-        return nodes_array
+        if nodes.size == 0:
+            return np.array([])
+
+        valid = points_intersect(self._valid_poly, nodes)
+
+        if not valid.any():
+            return np.array([])
+
+        return nodes[valid]
 
     @abc.abstractmethod
     def _adapt_nodes(self, nodes, *args, **kwargs):
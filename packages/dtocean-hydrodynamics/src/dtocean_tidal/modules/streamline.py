@@ -24,9 +24,14 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+import shapely
 from matplotlib.patches import FancyArrowPatch
 from matplotlib.path import Path
-from shapely.geometry import Point
+
+# Classes of the lease raster cells
+_OUTSIDE = 0
+_INSIDE = 1
+_BOUNDARY = 2
 
 
 class Streamlines:
@@ -76,18 +81,17 @@ class Streamlines:
 
         # Don't try to compute streamlines in regions where there is no
         # velocity data
-        for i in range(self.y.size):
-            for j in range(self.x.size):
-                if self.u[i, j] == 0.0 and self.v[i, j] == 0.0:
-                    self.used[i, j] = True
-
-        # Make the streamlines
-        self.streamlines = []
-        for i in range(NbTurb):
-            # Make a streamline starting at the first unrepresented grid point
-            self.streamlines.append(
-                self._makeStreamline(self.driftPos[i, 0], self.driftPos[i, 1])
-            )
+        self.used[(self.u == 0.0) & (self.v == 0.0)] = True
+
+        # Classify the grid cells as outside, inside or on the boundary of
+        # the lease area
+        self._lease_mask = self._rasterise_lease()
+
+        # Make the streamlines, starting at each turbine
+        self.streamlines = self._makeStreamlines(
+            self.driftPos[:NbTurb, 0],
+            self.driftPos[:NbTurb, 1],
+        )
 
     def plot(self, NbTurb=None, lw=1, ax=None, size=16):
         """
@@ -145,62 +149,239 @@ class Streamlines:
         Compute a streamline extending in one direction from the given point.
         """
 
+        return self._makeStreamlines([x0], [y0], sign=sign)[0]
+
+    def _makeStreamlines(self, x0, y0, sign=1):
+        """
+        Compute streamlines extending in one direction from the given points.
+        All the streamlines are advanced together, until each one leaves the
+        domain or the lease area, forms a loop, reaches a velocity node or
+        exceeds the maximum length.
+        """
+
         xmin = self.x[0]
         xmax = self.x[-1]
         ymin = self.y[0]
         ymax = self.y[-1]
 
-        sx = []
-        sy = []
-        slen = 0.0
+        x = np.array(x0, dtype=float)
+        y = np.array(y0, dtype=float)
+        n = len(x)
+
+        # Loops are found by comparing each new point with the earlier
+        # points within this distance. Earlier points are checked directly
+        # over a window long enough to leave the neighbouring cells and
+        # otherwise only if their cells neighbour the new point.
+        loop_distance = 0.9 * self.dr
+        reach = (
+            int(np.ceil(loop_distance / self.dy)),
+            int(np.ceil(loop_distance / self.dx)),
+        )
+        window = int(
+            np.ceil(
+                (2 * reach[0] + 1)
+                * (2 * reach[1] + 1)
+                * np.hypot(self.dx, self.dy)
+                / self.dr
+            )
+        )
+        history = _StreamlineHistory(n, self.u.shape, reach, window)
+        slen = np.zeros(n)
+        active = np.ones(n, dtype=bool)
 
-        x = x0
-        y = y0
+        while True:
+            idx = np.flatnonzero(active)
 
-        while xmin < x < xmax and ymin < y < ymax:
-            if not Point(x, y).within(self.lease):
-                break
+            xa = x[idx]
+            ya = y[idx]
 
-            if self.detectLoops and self._detectLoop(sx, sy):
-                break
+            keep = (xmin < xa) & (xa < xmax) & (ymin < ya) & (ya < ymax)
+            keep[keep] = self._within_lease(xa[keep], ya[keep])
+
+            if self.detectLoops:
+                keep &= ~history.looped[idx]
 
-            u = self.interpU(x, y)[0][0]
-            v = self.interpV(x, y)[0][0]
+            idx = idx[keep]
+            xa = xa[keep]
+            ya = ya[keep]
 
-            if u == 0.0 and v == 0.0:
+            if idx.size == 0:
                 break
 
-            theta = np.arctan2(v, u)
+            u = self.interpU.ev(xa, ya)
+            v = self.interpV.ev(xa, ya)
+
+            keep = ~((u == 0.0) & (v == 0.0))
 
-            xold = x
-            yold = y
+            theta = np.arctan2(v, u)
+            xn = xa + sign * self.dr * np.cos(theta)
+            yn = ya + sign * self.dr * np.sin(theta)
 
-            x += sign * self.dr * np.cos(theta)
-            y += sign * self.dr * np.sin(theta)
+            slen[idx] += np.sqrt((xn - xa) ** 2 + (yn - ya) ** 2)
+            keep &= ~(slen[idx] > self.maxlen)
 
-            slen += np.sqrt((x - xold) ** 2 + (y - yold) ** 2)
+            active[:] = False
+            active[idx[keep]] = True
 
-            if slen > self.maxlen:
+            if not active.any():
                 break
 
-            sx.append(x)
-            sy.append(y)
+            idx = idx[keep]
+            x[idx] = xn[keep]
+            y[idx] = yn[keep]
+
+            cells = self._get_cells(x[idx], y[idx])
+            history.append(idx, x[idx], y[idx], cells)
 
-        return [x0] + sx, [y0] + sy
+            if self.detectLoops:
+                history.detect_loops(idx, cells, loop_distance)
 
-    def _detectLoop(self, x, y):
-        """Detect closed loops and nodes in a streamline."""
+        streamlines = []
 
-        if not x or not y:
-            return False
+        for i in range(n):
+            sx, sy = history.get(i)
+            streamlines.append(([x0[i]] + list(sx), [y0[i]] + list(sy)))
 
-        x0 = x[-1]
-        y0 = y[-1]
+        return streamlines
 
-        xd = x0 - np.array(x[:-1])
-        yd = y0 - np.array(y[:-1])
+    def _get_cells(self, x, y):
+        """Return the (row, column) indices of the grid cells containing the
+        given points"""
 
-        D = np.hypot(xd, yd)
-        result = (D < 0.9 * self.dr).any()
+        col = np.floor((x - self.x[0]) / self.dx).astype(int)
+        row = np.floor((y - self.y[0]) / self.dy).astype(int)
+
+        col = np.clip(col, 0, self.x.size - 2)
+        row = np.clip(row, 0, self.y.size - 2)
+
+        return row, col
+
+    def _rasterise_lease(self):
+        """Classify each grid cell as outside, inside or on the boundary of
+        the lease area"""
+
+        xs, ys = np.meshgrid(self.x[:-1], self.y[:-1])
+        boxes = shapely.box(xs, ys, xs + self.dx, ys + self.dy)
+
+        mask = np.full(xs.shape, _BOUNDARY, dtype=np.int8)
+        mask[shapely.disjoint(self.lease, boxes)] = _OUTSIDE
+        mask[shapely.contains_properly(self.lease, boxes)] = _INSIDE
+
+        return mask
+
+    def _within_lease(self, x, y):
+        """Test if the given points are within the lease area. The exact test
+        is only used for points in cells on the lease boundary"""
+
+        row, col = self._get_cells(x, y)
+        cell_class = self._lease_mask[row, col]
+
+        within = cell_class == _INSIDE
+        boundary = cell_class == _BOUNDARY
+
+        if boundary.any():
+            within[boundary] = shapely.contains_xy(
+                self.lease, x[boundary], y[boundary]
+            )
+
+        return within
+
+
+class _StreamlineHistory:
+    """
+    Points of a set of streamlines, excluding their starting points, used to
+    detect loops or velocity nodes, i.e. a new point within the given
+    distance of an earlier point.
+
+    The last window points of each streamline are always compared with its
+    new point. Older points are marked in per-streamline bitmaps of the
+    visited grid cells and are only compared if one of them lies within
+    reach (in rows and columns) of the new point's cell.
+    """
 
-        return result
+    def __init__(self, n, grid_shape, reach, window, capacity=64):
+        self.looped = np.zeros(n, dtype=bool)
+        self._window = max(int(window), 1)
+
+        self._x = np.empty((n, capacity))
+        self._y = np.empty((n, capacity))
+        self._row = np.empty((n, capacity), dtype=int)
+        self._col = np.empty((n, capacity), dtype=int)
+        self._count = np.zeros(n, dtype=int)
+
+        self._visited = np.zeros((n,) + tuple(grid_shape), dtype=bool)
+
+        row_offsets = np.arange(-reach[0], reach[0] + 1)
+        col_offsets = np.arange(-reach[1], reach[1] + 1)
+        row_offsets, col_offsets = np.meshgrid(row_offsets, col_offsets)
+        self._row_offsets = row_offsets.ravel()
+        self._col_offsets = col_offsets.ravel()
+
+    def append(self, idx, x, y, cells):
+        count = self._count[idx]
+
+        if count.max() >= self._x.shape[1]:
+            self._grow()
+
+        row, col = cells
+
+        self._x[idx, count] = x
+        self._y[idx, count] = y
+        self._row[idx, count] = row
+        self._col[idx, count] = col
+        self._count[idx] += 1
+
+        # Points leaving the window are marked in the bitmaps
+        old = count - self._window
+        marked = old >= 0
+
+        if marked.any():
+            i = idx[marked]
+            j = old[marked]
+            self._visited[i, self._row[i, j], self._col[i, j]] = True
+
+    def detect_loops(self, idx, cells, distance):
+        last = self._count[idx] - 1
+        x = self._x[idx, last]
+        y = self._y[idx, last]
+
+        # Compare with the points in the window, excluding the new point
+        steps = np.arange(1, self._window)
+        recent = last[:, None] - steps[None, :]
+        valid = recent >= 0
+        recent = np.where(valid, recent, 0)
+
+        xd = x[:, None] - self._x[idx[:, None], recent]
+        yd = y[:, None] - self._y[idx[:, None], recent]
+        near = valid & (np.hypot(xd, yd) < distance)
+        self.looped[idx[near.any(axis=1)]] = True
+
+        # Compare with older points if they were in a neighbouring cell
+        row, col = cells
+        n_rows, n_cols = self._visited.shape[1:]
+        rows = np.clip(row[:, None] + self._row_offsets, 0, n_rows - 1)
+        cols = np.clip(col[:, None] + self._col_offsets, 0, n_cols - 1)
+        nearby = self._visited[idx[:, None], rows, cols].any(axis=1)
+        nearby &= ~self.looped[idx]
+
+        for i, j in zip(idx[nearby], last[nearby]):
+            n_old = j - self._window + 1
+            xd = self._x[i, j] - self._x[i, :n_old]
+            yd = self._y[i, j] - self._y[i, :n_old]
+
+            if (np.hypot(xd, yd) < distance).any():
+                self.looped[i] = True
+
+    def get(self, i):
+        count = self._count[i]
+
+        return self._x[i, :count], self._y[i, :count]
+
+    def _grow(self):
+        n, capacity = self._x.shape
+
+        for name in ["_x", "_y", "_row", "_col"]:
+            old = getattr(self, name)
+            new = np.empty((n, 2 * capacity), dtype=old.dtype)
+            new[:, :capacity] = old
+            setattr(self, name, new)
@@ -16,9 +16,10 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from .database import WakeDatabase
 from .reader import read_database
 
 # Local import
 from .wakeClass import Wake, WakeShape
 
-__all__ = ["read_database", "Wake", "WakeShape"]
+__all__ = ["read_database", "Wake", "WakeDatabase", "WakeShape"]
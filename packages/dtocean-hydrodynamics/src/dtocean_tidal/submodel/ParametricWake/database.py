@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2026 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+StrOrPath = Union[str, Path]
+
+
+class WakeDatabase:
+    """
+    Contiguous store of the CFD wake database
+
+    Args:
+      cts (numpy.array): sorted thrust coefficients, float array (nct)
+      tis (numpy.array): sorted turbulence intensities, float array (nti)
+      x (numpy.array): along stream coordinates, float array (nx)
+      y (numpy.array): across stream coordinates, float array (ny)
+      fields (numpy.array): U, V and TKE fields, float array
+                            (nti, nct, ny, nx, 3)
+
+    """
+
+    variables = ("U", "V", "TKE")
+
+    def __init__(self, cts, tis, x, y, fields):
+        expected_shape = (len(tis), len(cts), len(y), len(x), 3)
+
+        if fields.shape != expected_shape:
+            raise ValueError(
+                "Expected fields with shape {}, got {}".format(
+                    expected_shape, fields.shape
+                )
+            )
+
+        self.cts = np.asarray(cts)
+        self.tis = np.asarray(tis)
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.fields = fields
+
+    def get_values(self, ti_idx, ct_idx, rows, cols):
+        """Return the U, V and TKE values at the given grid points for the
+        given TI and Ct indices, as an array with shape
+        (len(ti_idx),) + rows.shape + (3,)"""
+
+        shape = (-1,) + (1,) * np.ndim(rows)
+        ti_idx = np.asarray(ti_idx).reshape(shape)
+        ct_idx = np.asarray(ct_idx).reshape(shape)
+
+        return np.asarray(self.fields[ti_idx, ct_idx, rows, cols])
+
+    def to_dict(self):
+        """Return the database in the dictionary of pandas tables format.
+        The tables contain (x, y) views of the fields."""
+
+        ctsnames = ["ct" + str(i) for i in self.cts]
+        tisnames = ["ti" + str(i) for i in self.tis]
+
+        tables = {}
+
+        for k, var in enumerate(self.variables):
+            df = pd.DataFrame(index=ctsnames, columns=tisnames)
+
+            for ii, tiname in enumerate(tisnames):
+                for cc, ctname in enumerate(ctsnames):
+                    df.loc[ctname, tiname] = self.fields[ii, cc, :, :, k].T
+
+            tables["df" + var] = df
+
+        database = {
+            "dfU": tables["dfU"],
+            "dfV": tables["dfV"],
+            "dfTKE": tables["dfTKE"],
+            "dfX": self.x,
+            "dfY": self.y,
+            "cts": self.cts,
+            "tis": self.tis,
+            "database": self,
+        }
+
+        return database
+
+    def save(self, fields_path: StrOrPath, axes_path: StrOrPath):
+        """Save the fields to a .npy file and the axes to a .npz file. The
+        files are written to temporary paths in the same directory and
+        then moved into place, axes first, so partially written files are
+        never found at the given paths."""
+
+        fields_path = Path(fields_path)
+        axes_path = Path(axes_path)
+        fields_temp_path = _get_temp_path(fields_path)
+        axes_temp_path = _get_temp_path(axes_path)
+
+        try:
+            with open(axes_temp_path, "wb") as f:
+                np.savez(f, cts=self.cts, tis=self.tis, x=self.x, y=self.y)
+
+            with open(fields_temp_path, "wb") as f:
+                np.save(f, self.fields)
+
+            os.replace(axes_temp_path, axes_path)
+            os.replace(fields_temp_path, fields_path)
+
+        finally:
+            fields_temp_path.unlink(missing_ok=True)
+            axes_temp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def load(
+        cls,
+        fields_path: StrOrPath,
+        axes_path: StrOrPath,
+        mmap_mode: Optional[str] = "r",
+    ):
+        """Load a database saved with the save method. By default, the
+        fields are memory-mapped."""
+
+        fields = np.load(fields_path, mmap_mode=mmap_mode)
+
+        with np.load(axes_path) as axes:
+            cts = axes["cts"]
+            tis = axes["tis"]
+            x = axes["x"]
+            y = axes["y"]
+
+        return cls(cts, tis, x, y, fields)
+
+
+def _get_temp_path(file_path: Path) -> Path:
+    return file_path.with_name(
+        "{}.{}.tmp".format(file_path.name, uuid.uuid4().hex)
+    )
@@ -16,76 +16,120 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import logging
 import os
+import zipfile
 from pathlib import Path
 from typing import Union
 
 import numpy as np
-import pandas as pd
+
+from .database import WakeDatabase
 
 # TR: integration of Sandia's model - beta 1.0
 from .read_db_mod import read_db
 
 StrOrPath = Union[str, Path]
 
+CACHE_FIELDS_NAME = "wake_fields.npy"
+CACHE_AXES_NAME = "wake_axes.npz"
+
+# Errors raised when loading a corrupt or partially written cache
+CACHE_ERRORS = (OSError, ValueError, EOFError, zipfile.BadZipFile)
+
+# Start logging
+module_logger = logging.getLogger(__name__)
+
+
+def read_database(data_path: StrOrPath, use_cache: bool = True):
+    """Converts the CDF database into many pandas table
 
-def read_database(data_path: StrOrPath):
-    """Converts the CDF database into many pandas table"""
+    If use_cache is True, the fields are saved to a .npy file in data_path
+    the first time the database is read, and memory-mapped from the file
+    subsequently."""
 
     data_path = Path(data_path)
+    fields_path = data_path / CACHE_FIELDS_NAME
+    axes_path = data_path / CACHE_AXES_NAME
+
+    if use_cache and _is_cache_valid(data_path, fields_path, axes_path):
+        module_logger.debug("Loading cached CFD database")
+
+        try:
+            wake_database = WakeDatabase.load(fields_path, axes_path)
+        except CACHE_ERRORS as e:
+            module_logger.warning(
+                "Failed to load cached CFD database: {}. The cache will be "
+                "rebuilt".format(e)
+            )
+        else:
+            return wake_database.to_dict()
 
     # Read and load CFD database into a dataframe at import level
     # Read Ct and TI info file
     try:
         # Allocate memory and build database
         reader = initiate_reader(data_path)
-        database = create_database(reader, data_path)
+        wake_database = create_database(reader, data_path)
     finally:
         # Deallocate memory
         delete_reader()
 
-    return database
+    if not use_cache:
+        return wake_database.to_dict()
+
+    try:
+        wake_database.save(fields_path, axes_path)
+        wake_database = WakeDatabase.load(fields_path, axes_path)
+    except CACHE_ERRORS as e:
+        module_logger.warning("Failed to cache CFD database: {}".format(e))
+
+    return wake_database.to_dict()
+
+
+def _is_cache_valid(data_path: Path, fields_path: Path, axes_path: Path):
+    if not (fields_path.is_file() and axes_path.is_file()):
+        return False
+
+    cache_mtime = min(fields_path.stat().st_mtime, axes_path.stat().st_mtime)
+
+    for name in ["Ct_set.txt", "TI_set.txt"]:
+        set_path = data_path / name
+        if set_path.is_file() and set_path.stat().st_mtime > cache_mtime:
+            return False
+
+    return True
 
 
 def create_database(reader, data_path: Path):
-    """Create pandas tables from database reader"""
+    """Create a contiguous wake database from database reader"""
 
     # Read and load CFD database into a dataframe at import level
     # Read Ct and TI info file
     cts = list(set([float(i) for i in open(data_path / "Ct_set.txt")]))
     cts.sort()
-    ctsnames = ["ct" + str(i) for i in cts]
 
     tis = list(set([float(i) for i in open(data_path / "TI_set.txt")]))
     tis.sort()
-    tisnames = ["ti" + str(i) for i in tis]
-
-    #  Generate dataframe
-    dfU = pd.DataFrame(index=ctsnames, columns=tisnames)
-    dfV = pd.DataFrame(index=ctsnames, columns=tisnames)
-    dfTKE = pd.DataFrame(index=ctsnames, columns=tisnames)
-
-    for ii in tis:
-        for cc in cts:
-            reader.read_u_v_tke(cc, ii)
-            dfU.loc["ct" + str(cc), "ti" + str(ii)] = np.copy(reader.u)
-            dfV.loc["ct" + str(cc), "ti" + str(ii)] = np.copy(reader.v)
-            dfTKE.loc["ct" + str(cc), "ti" + str(ii)] = np.copy(reader.tke)
+
+    # Fields are stored as (ti, ct, y, x, var)
+    fields = None
+
+    for ii, ti in enumerate(tis):
+        for cc, ct in enumerate(cts):
+            reader.read_u_v_tke(ct, ti)
+
+            if fields is None:
+                shape = (len(tis), len(cts)) + reader.u.T.shape + (3,)
+                fields = np.empty(shape)
+
+            fields[ii, cc, :, :, 0] = reader.u.T
+            fields[ii, cc, :, :, 1] = reader.v.T
+            fields[ii, cc, :, :, 2] = reader.tke.T
             dfX = np.copy(reader.x)
             dfY = np.copy(reader.y)
 
-    # Build the dictionaries
-    database = {
-        "dfU": dfU,
-        "dfV": dfV,
-        "dfTKE": dfTKE,
-        "dfX": dfX,
-        "dfY": dfY,
-        "cts": np.asarray(cts),
-        "tis": np.asarray(tis),
-    }
-
-    return database
+    return WakeDatabase(np.asarray(cts), np.asarray(tis), dfX, dfY, fields)
 
 
 def initiate_reader(data_path: Path):
@@ -25,7 +25,7 @@ from shapely.errors import TopologicalError
 from shapely.geometry import LineString, Point, Polygon
 from shapely.plotting import patch_from_polygon
 
-from dtocean_tidal.utils.interpolation import interp_at_point
+from dtocean_tidal.utils.interpolation import bilinear_weights_batch
 from dtocean_tidal.utils.misc import closest_point, intersection, line
 
 # Start logging
@@ -38,7 +38,10 @@ class Wake:
     of turbine parameters
 
     Args:
-      data_reader (fortran): database reader
+      dataframe (dict): CFD database, as returned by read_database
+      U_dict (dict): unused, kept for backwards compatibility
+      V_dict (dict): unused, kept for backwards compatibility
+      TKE_dict (dict): unused, kept for backwards compatibility
       turbParams (dict): turbine's parameters
       BR (float): blockage ratio, float
 
@@ -85,14 +88,10 @@ class Wake:
         self.cutIn = turbParams["cutIO"][0]
         self.cutOut = turbParams["cutIO"][1]
 
-        # database values
-        self._dfU = U_dict
-        self._dfV = V_dict
-        self._dfTKE = TKE_dict
-        self._cts = np.copy(dataframe["cts"][:])
-        self._tis = np.copy(dataframe["tis"][:])
-        self._cts.sort()
-        self._tis.sort()
+        # database values, which are sorted by Ct and TI
+        self._database = dataframe["database"]
+        self._cts = np.copy(self._database.cts)
+        self._tis = np.copy(self._database.tis)
 
         # Real distance Empirical relationship for vertical blockage ratio and
         # yawing
@@ -115,27 +114,36 @@ class Wake:
           tke (numpy array): 2D array, TKE filed, m2/s2
         """
 
+        u, v, tke = self.read_at_points([x], [y], ct, ti, debug=debug)
+
+        return u[0], v[0], tke[0]
+
+    def read_at_points(self, x, y, ct, ti, debug=False):
+        """
+        Interpolates CFD datasets based on Ct and TI values at many points
+        Args:
+          x (numpy array): relative distances along streamline, m
+          y (numpy array): relative distances across streamline, m
+          ct (float): turbine's thrust coefficient, dimensionless
+          ti (float): turbulence intensity at hub's location,
+                      dimensionless [0 ; 1]
+
+        Returns:
+          u (numpy array): 1D array, flow velocity x component, m/s
+          v (numpy array): 1D array, flow velocity y component, m/s
+          tke (numpy array): 1D array, TKE, m2/s2
+        """
+
         debug = debug or self._debug
         if debug:
             module_logger.info("Picking CFD datasets...")
 
         # Looking through available Ct's and TI's values
-        ctbounds = []
-
-        for ss, ee in zip(self._cts[:-1], self._cts[1:]):
-            if ss <= ct <= ee:
-                ctbounds = [ss, ee]
-                break
-
-        tibounds = []
-
-        for ss, ee in zip(self._tis[:-1], self._tis[1:]):
-            if ss <= ti <= ee:
-                tibounds = [ss, ee]
-                break
+        ctidx = _find_bounds(self._cts, ct)
+        tiidx = _find_bounds(self._tis, ti)
 
         # If requested values outside of range
-        if ctbounds == []:
+        if ctidx is None:
             module_logger.debug(
                 (
                     "Requested Ct value {} is not covered by the "
@@ -146,15 +154,16 @@ class Wake:
             idx = (np.abs(self._cts - ct)).argmin()
 
             try:
-                ctbounds = [self._cts[idx - 1], self._cts[idx]]
+                ctidx = [idx - 1, idx]
+                self._cts[ctidx]
             except IndexError:
-                ctbounds = [self._cts[idx], self._cts[idx + 1]]
+                ctidx = [idx, idx + 1]
 
             module_logger.debug(
                 ("Ct value of {} will be " "used.").format(self._cts[idx])
             )
 
-        if tibounds == []:
+        if tiidx is None:
             module_logger.debug(
                 (
                     "Requested TI value {} is not covered by "
@@ -165,14 +174,18 @@ class Wake:
             idx = (np.abs(self._tis - ti)).argmin()
 
             try:
-                tibounds = [self._tis[idx - 1], self._tis[idx]]
+                tiidx = [idx - 1, idx]
+                self._tis[tiidx]
             except IndexError:
-                tibounds = [self._tis[idx], self._tis[idx + 1]]
+                tiidx = [idx, idx + 1]
 
             module_logger.debug(
                 ("TI value of {} will be " "used.").format(self._tis[0])
             )
 
+        ctbounds = self._cts[ctidx]
+        tibounds = self._tis[tiidx]
+
         # compute distance
         dist = np.zeros(4)
         dist[0] = (ct - ctbounds[0]) ** 2.0 + (ti - tibounds[0]) ** 2.0
@@ -185,21 +198,15 @@ class Wake:
         nn = 0
         atmp = np.zeros(3)
         btmp = np.zeros(3)
+        aidx = np.zeros(3, dtype=int)
+        bidx = np.zeros(3, dtype=int)
 
         for n in range(4):
             if not n == mloc:
-                if n == 0:
-                    atmp[nn] = ctbounds[0]
-                    btmp[nn] = tibounds[0]
-                elif n == 1:
-                    atmp[nn] = ctbounds[0]
-                    btmp[nn] = tibounds[1]
-                elif n == 2:
-                    atmp[nn] = ctbounds[1]
-                    btmp[nn] = tibounds[0]
-                elif n == 3:
-                    atmp[nn] = ctbounds[1]
-                    btmp[nn] = tibounds[1]
+                aidx[nn] = ctidx[n // 2]
+                bidx[nn] = tiidx[n % 2]
+                atmp[nn] = ctbounds[n // 2]
+                btmp[nn] = tibounds[n % 2]
 
                 nn += 1
 
@@ -222,26 +229,15 @@ class Wake:
 
         if debug:
             module_logger.info("...interpolation...")
-        u = 0.0
-        v = 0.0
-        tke = 0.0
-
-        for n in range(3):
-            if wght[n] == 0:
-                continue
 
-            tmpCt = atmp[n]
-            tmpTi = btmp[n]
+        # Only the grid values surrounding the points are read
+        rows, cols, weights = bilinear_weights_batch(x, y, X, Y)
+        values = self._database.get_values(bidx, aidx, rows, cols)
 
-            umat = self._dfU["ti" + str(tmpTi)]["ct" + str(tmpCt)] * wght[n]
-            vmat = self._dfV["ti" + str(tmpTi)]["ct" + str(tmpCt)] * wght[n]
-            tkemat = self._dfTKE["ti" + str(tmpTi)]["ct" + str(tmpCt)] * wght[n]
+        # Don't allow NaN values
+        values = np.where(np.isnan(values), 0.0, values)
 
-            tmp = interp_at_point(x, y, X, Y, [umat.T, vmat.T, tkemat.T])
-
-            u += tmp[0]
-            v += tmp[1]
-            tke += tmp[2]
+        u, v, tke = np.einsum("n,pk,npkq->qp", wght, weights, values)
 
         return u, v, tke
 
@@ -265,10 +261,36 @@ class Wake:
 
         """
 
+        wake_speed, newTKE = self.get_velocity_TKE_batch(
+            [distance], velHub, tiHub, debug=debug
+        )
+
+        return wake_speed[0], newTKE[0]
+
+    def get_velocity_TKE_batch(self, distances, velHub, tiHub, debug=False):
+        """Return velocity and T.K.E at many locations behind turbine for
+        input velocity and T.I. conditions.
+
+        Args:
+          distances (numpy.array): along and across distances to hub axis
+                                   (m), 2D array (Npoints, 2)
+          velHub (list): velocity components at hub, [u, v], float list
+          tiHub (float): turbulence intensity at hub (%)
+
+        Kwargs:
+          debug (bool): debug flag
+
+        Returns:
+          wake_speed (numpy.array): wake velocity magnitudes
+          newTKE (numpy.array): new turbulent kinetic energies
+
+        """
+
         debug = debug or self._debug
 
-        x = np.asarray(distance[0])
-        y = np.asarray(distance[1])
+        distances = np.asarray(distances, dtype=float).reshape(-1, 2)
+        x = distances[:, 0]
+        y = distances[:, 1]
 
         norm = np.sqrt((velHub[0] ** 2.0) + (velHub[1] ** 2.0))
 
@@ -325,25 +347,41 @@ class Wake:
         X = self._dfx
         Y = self._dfy
 
-        if (
-            (Ct > np.min(self._cts) and ry < np.radians(89.0))
-            and (X.min() < x < X.max())
-            and (Y.min() < y < Y.max())
-        ):
-            u, v, tke = self.read_at_point(x, y, Ct, tiHub, debug=debug)
-
-            indFac = np.sqrt(u**2.0 + v**2.0)
-            newTKE = norm * tke
+        indFac = np.ones(len(x))
+        newTKE = np.full(len(x), np.nan)
 
+        if Ct > np.min(self._cts) and ry < np.radians(89.0):
+            inside = (
+                (X.min() < x) & (x < X.max()) & (Y.min() < y) & (y < Y.max())
+            )
         else:
-            indFac = 1.0
-            newTKE = np.nan
+            inside = np.zeros(len(x), dtype=bool)
+
+        if inside.any():
+            u, v, tke = self.read_at_points(
+                x[inside], y[inside], Ct, tiHub, debug=debug
+            )
+
+            indFac[inside] = np.sqrt(u**2.0 + v**2.0)
+            newTKE[inside] = norm * tke
 
         wake_speed = norm * indFac
 
         return wake_speed, newTKE
 
 
+def _find_bounds(values, value):
+    """Return the indices of the first consecutive pair of sorted values that
+    bound the given value, or None if it is out of range"""
+
+    if len(values) < 2 or not values[0] <= value <= values[-1]:
+        return None
+
+    idx = max(int(np.searchsorted(values, value, side="left")), 1)
+
+    return [idx - 1, idx]
+
+
 # Simple formula for wake expansion while waiting for further development...
 # This feature is not needed for DTOcean as is.
 class WakeShape:
@@ -122,24 +122,36 @@ class WakeInteraction:
             module_logger.info("Querying parametric wake model...")
             start = time.time()
 
+        # Gather the wakes and the pairs of interacting turbines once
+        turb_wakes = [
+            self._wake["turbine{:0{width}d}".format(i, width=n_digits)]
+            for i in range(self._turbine_count)
+        ]
+        wake_pairs = _get_wake_pairs(
+            self._turbine_count,
+            self._array.distances,
+        )
+
         ind_err = np.inf
         old_coefficient = np.ones(self._turbine_count)
         newVel = iniVel.copy()
         newTI = iniTI.copy()
         newTKE = iniTKE.copy()
+        previous = None
         loop_counter = 0
 
         while ind_err > self._criterior and loop_counter < self._max_loop:
-            (newVel, newSpeed, newTI, newTKE) = _solve_flow(
+            (newVel, newSpeed, newTI, newTKE, previous) = _solve_flow(
                 self._turbine_count,
-                self._array.distances,
-                self._wake,
+                wake_pairs,
+                turb_wakes,
                 newVel,
                 newTI,
                 newTKE,
                 iniVel,
                 iniTKE,
-                debug,
+                previous=previous,
+                debug=debug,
             )
 
             new_coefficient = newSpeed / iniSpeed
@@ -227,45 +239,67 @@ class WakeInteraction:
             plt.show()
 
 
+def _get_wake_pairs(turbine_count, turb_distances):
+    """Collect the indices of the downstream turbines and their distances from
+    the streamline of each upstream turbine, as arrays"""
+
+    n_digits = len(str(turbine_count))
+    wake_pairs = []
+
+    for i in range(turbine_count):
+        turb = "turbine{:0{width}d}".format(i, width=n_digits)
+        distances = turb_distances[turb]
+
+        downstream = np.array(sorted(distances.keys()), dtype=int)
+        distance_array = np.empty((len(downstream), 2))
+
+        for k, j in enumerate(downstream):
+            distance_array[k, :] = distances[j][:2]
+
+        wake_pairs.append((downstream, distance_array))
+
+    return wake_pairs
+
+
 def _solve_flow(
     turbine_count,
-    turb_distances,
+    wake_pairs,
     turb_wakes,
     turb_velocity,
     turb_TI,
     turb_TKE,
     base_velocity,
     base_TKE,
+    previous=None,
     debug=False,
 ):
-    new_vel = np.empty((2, turbine_count))
-    new_TKE = np.empty(turbine_count)
-    new_TI = np.empty(turbine_count)
-    new_speed = np.empty(turbine_count)
-    wake_mat = np.empty((turbine_count, turbine_count))
-    tke_mat = np.empty((turbine_count, turbine_count))
-
-    n_digits = len(str(turbine_count))
-
-    for i in range(turbine_count):
-        turb = "turbine{:0{width}d}".format(i, width=n_digits)
-
-        for j in range(turbine_count):
-            if j in turb_distances[turb].keys():
-                (wake_mat[i, j], tke_mat[i, j]) = turb_wakes[
-                    turb
-                ].get_velocity_TKE(
-                    turb_distances[turb][j][:],
-                    turb_velocity[:, i],
-                    turb_TI[i],
-                    debug=debug,
-                )
-
-            else:
-                wake_mat[i, j] = np.sqrt(
-                    turb_velocity[0, i] ** 2 + turb_velocity[1, i] ** 2
-                )
-                tke_mat[i, j] = np.nan
+    """Run one iteration of the wake superposition. The returned state can be
+    passed as the previous argument of the next iteration, so that the wakes
+    of turbines with unchanged inflow conditions are not recomputed."""
+
+    turb_speed = np.sqrt(turb_velocity[0, :] ** 2 + turb_velocity[1, :] ** 2)
+    wake_mat = np.repeat(turb_speed[:, None], turbine_count, axis=1)
+    tke_mat = np.full((turbine_count, turbine_count), np.nan)
+
+    for i, (downstream, distances) in enumerate(wake_pairs):
+        if len(downstream) == 0:
+            continue
+
+        if previous is not None and _is_inflow_unchanged(
+            previous, turb_velocity, turb_TI, i
+        ):
+            wake_mat[i, :] = previous[2][i, :]
+            tke_mat[i, :] = previous[3][i, :]
+            continue
+
+        (wake_mat[i, downstream], tke_mat[i, downstream]) = turb_wakes[
+            i
+        ].get_velocity_TKE_batch(
+            distances,
+            turb_velocity[:, i],
+            turb_TI[i],
+            debug=debug,
+        )
 
     superposition_model = DominantWake(turb_velocity, wake_mat)
     coefficients = superposition_model.coefficients
@@ -278,12 +312,22 @@ def _solve_flow(
     if np.isnan(new_TKE).any():
         new_TKE = np.where(np.isnan(new_TKE), turb_TKE, new_TKE)
 
-    for i in range(turbine_count):
-        new_vel[:, i] = base_velocity[:, i] * coefficients[i]
-        new_speed[i] = np.sqrt(new_vel[0, i] ** 2 + new_vel[1, i] ** 2)
-        new_TI[i] = _get_ti(new_TKE[i], new_speed[i])
+    new_vel = base_velocity * coefficients[None, :]
+    new_speed = np.sqrt(new_vel[0, :] ** 2 + new_vel[1, :] ** 2)
+    new_TI = _get_ti(new_TKE, new_speed)
+
+    state = (turb_velocity.copy(), turb_TI.copy(), wake_mat, tke_mat)
+
+    return new_vel, new_speed, new_TI, new_TKE, state
+
+
+def _is_inflow_unchanged(previous, turb_velocity, turb_TI, i):
+    previous_velocity, previous_TI, _, _ = previous
 
-    return new_vel, new_speed, new_TI, new_TKE
+    return (
+        np.array_equal(previous_velocity[:, i], turb_velocity[:, i])
+        and previous_TI[i] == turb_TI[i]
+    )
 
 
 def _get_tke(TI, U):
@@ -42,41 +42,7 @@ def interp_at_point(x, y, X, Y, Q):
       qi (list): interpolated values
 
     """
-    # find first two nearest
-    xDist = x - X
-    i = np.argmin(np.abs(xDist))
-    try:
-        if np.sign(xDist[i]) < 0.0 and i - 1 < 0:
-            raise IndexError
-        if np.abs(xDist[i + 1]) < np.abs(xDist[i - 1]):
-            i2 = i + 1
-        else:
-            i2 = i - 1
-        # computes weight
-        dist = np.abs(xDist[i]) + np.abs(xDist[i2])
-        ai = np.abs(xDist[i2] / dist)
-        ai2 = np.abs(xDist[i] / dist)
-    except IndexError:  # the given point is outside the Q array
-        i2 = 0
-        ai = 1.0
-        ai2 = 0.0
-    yDist = y - Y
-    j = np.argmin(np.abs(yDist))
-    try:
-        if np.sign(yDist[j]) < 0.0 and j - 1 < 0:
-            raise IndexError
-        if np.abs(yDist[j + 1]) < np.abs(yDist[j - 1]):
-            j2 = j + 1
-        else:
-            j2 = j - 1
-        # computes weight
-        dist = np.abs(yDist[j]) + np.abs(yDist[j2])
-        aj = np.abs(yDist[j2] / dist)
-        aj2 = np.abs(yDist[j] / dist)
-    except IndexError:  # the given point is outside the Q array
-        j2 = 0
-        aj = 1.0
-        aj2 = 0.0
+    rows, cols, weights = bilinear_weights(x, y, X, Y)
 
     # Bilinear interpolation
     qi = []
@@ -85,20 +51,98 @@ def interp_at_point(x, y, X, Y, Q):
         # Don't allow NaN values
         bi = 0
 
-        if not np.isnan(q[j, i]):
-            bi += q[j, i] * aj * ai
-        if not np.isnan(q[j, i2]):
-            bi += q[j, i2] * aj * ai2
-        if not np.isnan(q[j2, i]):
-            bi += q[j2, i] * aj2 * ai
-        if not np.isnan(q[j2, i2]):
-            bi += q[j2, i2] * ai2 * aj2
+        for j, i, w in zip(rows, cols, weights):
+            if not np.isnan(q[j, i]):
+                bi += q[j, i] * w
 
         qi.append(bi)
 
     return qi
 
 
+def bilinear_weights(x, y, X, Y):
+    """
+    Find the grid indices and weights for bilinear interpolation of a
+    quantity at point (x,y)
+
+    Args:
+      x (float): x axis coordinate, float
+      y (float): y axis coordinate, float
+      X (numpy.array): x axis coordinates, float array (N)
+      Y (numpy.array): y axis coordinates, float array (M)
+
+    Returns:
+      rows (numpy.array): Y indices of the 4 grid points, int array (4)
+      cols (numpy.array): X indices of the 4 grid points, int array (4)
+      weights (numpy.array): weights of the 4 grid points, float array (4)
+
+    """
+    rows, cols, weights = bilinear_weights_batch([x], [y], X, Y)
+
+    return rows[0], cols[0], weights[0]
+
+
+def bilinear_weights_batch(x, y, X, Y):
+    """
+    Find the grid indices and weights for bilinear interpolation of a
+    quantity at many points (x,y)
+
+    Args:
+      x (numpy.array): x axis coordinates of the points, float array (P)
+      y (numpy.array): y axis coordinates of the points, float array (P)
+      X (numpy.array): x axis coordinates, float array (N)
+      Y (numpy.array): y axis coordinates, float array (M)
+
+    Returns:
+      rows (numpy.array): Y indices of the grid points, int array (P, 4)
+      cols (numpy.array): X indices of the grid points, int array (P, 4)
+      weights (numpy.array): weights of the grid points, float array (P, 4)
+
+    """
+    i, i2, ai, ai2 = _nearest_two(np.asarray(x, dtype=float), X)
+    j, j2, aj, aj2 = _nearest_two(np.asarray(y, dtype=float), Y)
+
+    rows = np.stack([j, j, j2, j2], axis=-1)
+    cols = np.stack([i, i2, i, i2], axis=-1)
+    weights = np.stack([aj * ai, aj * ai2, aj2 * ai, aj2 * ai2], axis=-1)
+
+    return rows, cols, weights
+
+
+def _nearest_two(x, X):
+    """Find the nearest two coordinates in X to each value of x and their
+    linear interpolation weights. Values outside of X take the nearest
+    coordinate only."""
+
+    n = len(X)
+    points = np.arange(len(x))
+
+    # find first two nearest
+    xDist = x[:, None] - np.asarray(X)[None, :]
+    i = np.argmin(np.abs(xDist), axis=1)
+    dist_i = xDist[points, i]
+
+    # the given point is outside the array
+    outside = ((np.sign(dist_i) < 0.0) & (i - 1 < 0)) | (i + 1 >= n)
+
+    dist_up = np.abs(xDist[points, np.minimum(i + 1, n - 1)])
+    dist_down = np.abs(xDist[points, i - 1])
+    i2 = np.where(dist_up < dist_down, i + 1, i - 1)
+    dist_i2 = xDist[points, np.where(outside, i, i2)]
+
+    # computes weight
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dist = np.abs(dist_i) + np.abs(dist_i2)
+        ai = np.abs(dist_i2 / dist)
+        ai2 = np.abs(dist_i / dist)
+
+    i2 = np.where(outside, 0, i2)
+    ai = np.where(outside, 1.0, ai)
+    ai2 = np.where(outside, 0.0, ai2)
+
+    return i, i2, ai, ai2
+
+
 def volume_under_plane(x, y, z, debug=False):
     """
     Computes the volume under a given plane
@@ -28,6 +28,7 @@ This module contains the classes used to collect and modify the WP2 inputs
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from math import pi
 
 import numpy as np
@@ -50,12 +51,14 @@ from numpy import (
     zeros,
 )
 from numpy.linalg import solve
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import LinearOperator, gmres
 from scipy.special import jv, yv
 
 from dtocean_hydro.output import ReducedOutput
 
 from .utils.spec_class import wave_spec
-from .utils.StrDyn import EnergyProduction
+from .utils.StrDyn import EnergyProductionBatch
 from .utils.WatWaves import len2
 
 # Start logging
@@ -72,6 +75,12 @@ class MultiBody(object):
 
     Optional args:
         cylamplitude (boolean): used to save or not the partial wave, associated with the array
+        solver (str): method used to apply the inverse of the interaction system of equations. One of
+                      "direct" (explicit inverse), "lu" (reused LU factorisation) or "gmres" (matrix-free
+                      iterative solution). Defaults to "direct".
+        solver_tol (float): relative tolerance of the "gmres" solver. Defaults to 1e-6.
+        n_workers (int): number of threads used to solve the wave frequencies in parallel. If None, the
+                         frequencies are solved serially. Defaults to None.
 
     Attributes:
         coord (numpy.ndarray) [m]: UTM coordinates (Easting-Northing) describing the array layout.
@@ -110,10 +119,30 @@ class MultiBody(object):
         TI (-): unused
     """
 
-    def __init__(self, ihydro, iwec, cylamplitude=True, debug=False):
+    def __init__(
+        self,
+        ihydro,
+        iwec,
+        cylamplitude=True,
+        debug=False,
+        solver="direct",
+        solver_tol=1e-6,
+        n_workers=None,
+    ):
+        if solver not in ["direct", "lu", "gmres"]:
+            raise ValueError(
+                "Argument solver must be one of 'direct', 'lu' or 'gmres'"
+            )
+
+        if n_workers is not None and n_workers < 1:
+            raise ValueError("Argument n_workers must be greater than zero")
+
         # coordinates of WECs
         self.coord = None
         self.debug = debug
+        self.solver = solver
+        self.solver_tol = solver_tol
+        self.n_workers = n_workers
         # cylamplitude = True ==> will save cylindrical amplitude coefficients
         self.cylamplitude = cylamplitude
         self.depth = ihydro.depth
@@ -185,7 +214,6 @@ class MultiBody(object):
             dtype=float,
         )
         m, n = np.meshgrid(Nm, Nm, indexing="ij")
-        Gp = np.transpose(self.iwec.G, axes=(0, 2, 1))
         wec_Fex = None
         wec_dir = None
 
@@ -195,14 +223,22 @@ class MultiBody(object):
         for orient, thetas in zip(orients, theta_groups):
             ths = array([th for th in thetas], dtype=float)
 
-            d_rot = self.iwec.D * np.exp(-1j * (n - m) * orient)
-            g_rot = np.transpose(Gp * np.exp(1j * Nm * orient), axes=(0, 2, 1))
-            ar_rot = self.iwec.AR * np.exp(1j * Nm * orient)
+            # The transfer matrices are rotated as each frequency block is
+            # read, so the isolated WEC solution need not be held in memory
+            d_rot = RotatedTransferMatrix(
+                self.iwec.D, np.exp(-1j * (n - m) * orient)
+            )
+            g_rot = RotatedTransferMatrix(
+                self.iwec.G, np.exp(1j * Nm * orient)[:, np.newaxis]
+            )
+            ar_rot = RotatedTransferMatrix(
+                self.iwec.AR, np.exp(1j * Nm * orient)
+            )
 
             # solve for Madd, Crad and Fex
             self.Hydrodynamics(self.iwec, ths, d_rot, g_rot, ar_rot)
 
-            Pyr, P = EnergyProduction(
+            Pyr, P = EnergyProductionBatch(
                 NBo,
                 self.B,
                 self.Hs,
@@ -236,7 +272,7 @@ class MultiBody(object):
                 wec_Fex = Fex_iso[:, 0, :]
                 wec_dir = np.array([ths[0] - orient])
 
-            PyrWEC, PWEC = EnergyProduction(
+            PyrWEC, PWEC = EnergyProductionBatch(
                 1,
                 self.B,
                 self.Hs,
@@ -352,7 +388,10 @@ class MultiBody(object):
             iWEC (WEC class): It is an instance of WEC class.
             direction (numpy.ndarray) [rad]: It contains wave-directions considered for
                                                 diffraction problems.
-            order (int): Truncation order for the power series solution of cylindric waves (Kagemoto).
+            D_rot, G_rot, AR_rot (array-like): diffraction transfer matrix, force transfer matrix and
+                                               radiation amplitude coefficients of the isolated body,
+                                               indexed by wave-period first. Only the block for each
+                                               frequency is read.
         """
         # Check point {start}"
         TolCheck = 1e-3
@@ -371,29 +410,60 @@ class MultiBody(object):
         k0 = self.wnumber
         cfreq = 2 * pi / self.period
 
-        # Interaction theory from Kagemoto
-        (TS, TR, DS_array, DR_array, GS_array, GR_array, MS_inter, MR_inter) = (
-            self.Interaction(k0, D_rot, G_rot, iWEC.truncorder)
+        self._hydrodynamics_by_frequency(
+            iWEC, direction, D_rot, G_rot, AR_rot, k0, cfreq
         )
 
-        # Wave scattering between bodies
-        self.Scattering(
-            k0, direction, TS, DS_array, GS_array, MS_inter, iWEC.order[0]
-        )
+    def _hydrodynamics_by_frequency(
+        self, iWEC, direction, D_rot, G_rot, AR_rot, k0, cfreq
+    ):
+        """Solve each wave frequency independently, using a pool of threads
+        if n_workers is set. Each task builds the interaction matrices for its
+        own frequency only, so the transfer matrices are read one frequency
+        at a time and at most n_workers sets of matrices are held in memory
+        at once."""
 
-        # Radiated waves and scattering between bodies
-        self.Radiation(
-            k0,
-            cfreq,
-            TR,
-            DR_array,
-            GR_array,
-            MR_inter,
-            AR_rot,
-            iWEC.Madd,
-            iWEC.Crad,
-            iWEC.order.max(),
-        )
+        def solve_frequency(i):
+            k = slice(i, i + 1)
+
+            (TS, TR, DS_array, DR_array, GS_array, GR_array, MS, MR) = (
+                self.Interaction(k0[k], D_rot[k], G_rot[k], iWEC.truncorder[k])
+            )
+
+            scattering = self._get_scattering(
+                k0[k], direction, TS, DS_array, GS_array, MS, iWEC.order[0]
+            )
+
+            radiation = self._get_radiation(
+                k0[k],
+                cfreq[k],
+                TR,
+                DR_array,
+                GR_array,
+                MR,
+                AR_rot[k],
+                iWEC.Madd[k],
+                iWEC.Crad[k],
+                iWEC.order.max(),
+            )
+
+            return scattering, radiation
+
+        if self.n_workers is None:
+            results = [solve_frequency(i) for i in range(len2(k0))]
+        else:
+            with ThreadPoolExecutor(max_workers=self.n_workers) as executor:
+                results = list(executor.map(solve_frequency, range(len2(k0))))
+
+        self.Fex = np.concatenate([scat[0] for scat, _ in results])
+        self.Madd = np.concatenate([rad[0] for _, rad in results])
+        self.Crad = np.concatenate([rad[1] for _, rad in results])
+
+        if self.cylamplitude:
+            self.aS = [scat[1][0] for scat, _ in results]
+            self.AP = [scat[2][0] for scat, _ in results]
+            self.aR = [rad[2][0] for _, rad in results]
+            self.AR = [rad[3][0] for _, rad in results]
 
     def Interaction(self, k0, D, G, TruncOrder):
         """
@@ -425,7 +495,9 @@ class MultiBody(object):
                              len(GS) = period.
             GR_array (list): Same as GS_array but for radiation problems.
             MS_inter (list): It contains the matrix of the linear system of equations, already inverted, to solve
-                             the interaction in diffraction problems. len(MS_inter) = period.
+                             the interaction in diffraction problems. len(MS_inter) = period. If the solver
+                             attribute is not "direct", the inverse is not formed and the list contains
+                             InteractionLU or InteractionGMRES objects instead.
             MR_inter (list): Same as MS_inter but for radiation problems.
 
         Notes:
@@ -645,15 +717,28 @@ class MultiBody(object):
             rowS, colS = meshgrid(rowcolS, rowcolS, indexing="ij")
             rowR, colR = meshgrid(rowcolR, rowcolR, indexing="ij")
 
-            ms = solve(
-                eye(Nb * dimp[i, 0]) - dot(TS[i], DS_array[i]),
-                eye(Nb * dimp[i, 0]),
-            )
+            if self.solver == "gmres":
+                ms = InteractionGMRES(TS[i], DS_array[i], self.solver_tol)
+                mr = InteractionGMRES(TR[i], DR_array[i], self.solver_tol)
 
-            mr = solve(
-                eye(Nb * dimp[i, 1]) - dot(TR[i], DR_array[i]),
-                eye(Nb * dimp[i, 1]),
-            )
+            elif self.solver == "lu":
+                ms = InteractionLU(
+                    eye(Nb * dimp[i, 0]) - dot(TS[i], DS_array[i])
+                )
+                mr = InteractionLU(
+                    eye(Nb * dimp[i, 1]) - dot(TR[i], DR_array[i])
+                )
+
+            else:
+                ms = solve(
+                    eye(Nb * dimp[i, 0]) - dot(TS[i], DS_array[i]),
+                    eye(Nb * dimp[i, 0]),
+                )
+
+                mr = solve(
+                    eye(Nb * dimp[i, 1]) - dot(TR[i], DR_array[i]),
+                    eye(Nb * dimp[i, 1]),
+                )
 
             MS_inter.append(ms)
             MR_inter.append(mr)
@@ -688,6 +773,22 @@ class MultiBody(object):
             M_interaction (numpy.ndarray): Inverted matrix of the system of equations to be
                             solved at different wave-periods and directions. Shape: (period,dim*Nb,dim*Nb).
         """
+        (self.Fex, aS, AP) = self._get_scattering(
+            k0, direction, T, D_array, G_array, M_interaction, BaseOrder
+        )
+
+        # " Save amplitude coefficients "
+        if self.cylamplitude:
+            self.aS = aS
+            self.AP = AP
+
+    def _get_scattering(
+        self, k0, direction, T, D_array, G_array, M_interaction, BaseOrder
+    ):
+        """Calculate the excitation force and, if cylamplitude is True, the
+        scattered and ambient wave amplitude coefficients, without modifying
+        the object. See Scattering for the arguments."""
+
         if self.coord is None:
             raise RuntimeError(
                 "WEC positions are not set. Call the energy method first."
@@ -728,9 +829,8 @@ class MultiBody(object):
             (len2(k0), len2(direction), len2(G_array[0][0])), dtype=np.complex64
         )
         # " Save amplitude coefficients "
-        if self.cylamplitude:
-            self.aS = []
-            self.AP = []
+        aS_list = []
+        AP_list = []
         for i in range(len2(k0)):
             # """ Get the scatter cylindric wave for the scattering problem for
             # the entire array (i.e., solve system of equations, i.e. direct matrix method!!!) """
@@ -740,19 +840,19 @@ class MultiBody(object):
                 array([range(dimi)] * Nb).transpose()
                 + array(range(0, dim * Nb, dim))
             ).transpose().reshape(-1) + (Nm - Nmi)
-            aS = dot(
+            aS = interaction_dot(
                 dot(AP[i][:, col], D_array[i]), M_interaction[i]
             )  # aS= (Id-D*T)\D*AP with M_Interaction=(Id-D*T)**-1. However, all have been transposed for sake of convenience
             # " Save amplitude coefficients "
             if self.cylamplitude:
-                self.aS.append(aS)
-                self.AP.append(AP[i][:, col])
+                aS_list.append(aS)
+                AP_list.append(AP[i][:, col])
             # " Calculation of the excitation force for the entire array "
             Fex[i, :, :] = dot(
                 AP[i][:, col] + dot(aS, T[i]), G_array[i]
             )  # Fex= G*aI with aI=AP+T*aS so the overall incident wave for the scattering problem
 
-        self.Fex = Fex
+        return Fex, aS_list, AP_list
 
     def Radiation(
         self,
@@ -791,6 +891,41 @@ class MultiBody(object):
             Crad_iso (numpy.ndarray): Radiation damping of the isolated body at different
                     wave-periods. Shape: (period,dof,dof).
         """
+        (self.Madd, self.Crad, aR, AR) = self._get_radiation(
+            k0,
+            freq,
+            T,
+            D_array,
+            G_array,
+            M_interaction,
+            AR_iso,
+            Madd_iso,
+            Crad_iso,
+            BaseOrder,
+        )
+
+        # " Save amplitude coefficients "
+        if self.cylamplitude:
+            self.aR = aR
+            self.AR = AR
+
+    def _get_radiation(
+        self,
+        k0,
+        freq,
+        T,
+        D_array,
+        G_array,
+        M_interaction,
+        AR_iso,
+        Madd_iso,
+        Crad_iso,
+        BaseOrder,
+    ):
+        """Calculate the added mass and radiation damping of the array and,
+        if cylamplitude is True, the radiated wave amplitude coefficients,
+        without modifying the object. See Radiation for the arguments."""
+
         Nb = len2(self.coord)
         Nm = BaseOrder
         dof = len2(Madd_iso[0])
@@ -799,9 +934,8 @@ class MultiBody(object):
         Crad = zeros((len2(k0), Nb * dof, Nb * dof))
         # " For later usage D, G, T and M_inter are transposed "
         # " Save amplitude coefficients "
-        if self.cylamplitude:
-            self.aR = []
-            self.AR = []
+        aR_list = []
+        AR_list = []
         for k in range(len2(k0)):
             # """ Get the ambient radiated wave, AR, for the radiation problems (dof*Nb problems), i.e
             # (dof_0 induced to all Nb, ..., dof_f induced to all Nb), for the entire array """
@@ -831,7 +965,7 @@ class MultiBody(object):
             Fex_rad = zeros((dof, Nb, dof * Nb), dtype=np.complex64)
             # " Save amplitude coefficients "
             if self.cylamplitude:
-                self.AR.append(AR)
+                AR_list.append(AR)
                 aRaux = zeros(AR.shape, dtype=np.complex64)
             for i in range(dof):
                 # """ ¤^t means transpose(¤)
@@ -839,7 +973,9 @@ class MultiBody(object):
                 # for each dof_i, the columns for each constant row (body_j) are the (2*Nm+1)*Nb ambient
                 # wave coefficients required for solving 1 radiation problem (i.e. the radiation problem
                 # corresponding to body_j undergoing dof_i) """
-                aR = dot(dot(AR[i, :, :], D_array[k]), M_interaction[k])
+                aR = interaction_dot(
+                    dot(AR[i, :, :], D_array[k]), M_interaction[k]
+                )
                 # " Save amplitude coefficients "
                 if self.cylamplitude:
                     aRaux[i] = aR
@@ -853,7 +989,7 @@ class MultiBody(object):
                 Fex_rad[i, :, :] = dot(AR[i, :, :] + dot(aR, T[k]), G_array[k])
             # " Save amplitude coefficients "
             if self.cylamplitude:
-                self.aR.append(aRaux)
+                aR_list.append(aRaux)
             # " Calculation of the radiation force for the entire array "
             # """ To Fex_rad we should add the hydrodynamics of the device generating the wave that causes
             # Fex_rad[i,j,:] since this just accounts as it was a regular diffraction problem. This is achieved
@@ -888,8 +1024,7 @@ class MultiBody(object):
             Madd[k, :, :] = 1 / freq[k] ** 2 * real(Frad_k)
             Crad[k, :, :] = -1 / freq[k] * imag(Frad_k)
 
-        self.Madd = Madd
-        self.Crad = Crad
+        return Madd, Crad, aR_list, AR_list
 
     def EnergyBalance(self, power_prod_perD_perS):
         """
@@ -955,3 +1090,122 @@ class MultiBody(object):
         Balance = EnergyWOarray - EnergyWarray  # balance per sea state
 
         return np.max(Balance / EnergyWOarray)
+
+
+class RotatedTransferMatrix:
+    """
+    RotatedTransferMatrix: array-like view of a transfer matrix of the
+    isolated body, indexed by wave-period first, multiplied by a rotation
+    factor. The factor is only applied to the frequency blocks that are
+    read, so a lazily loaded matrix is not read whole.
+
+    Args:
+        matrix (array-like): the transfer matrix, e.g. a numpy.ndarray or a
+                             LazyDataset
+        factor (numpy.ndarray): factor broadcast against each frequency
+                                block of the matrix
+    """
+
+    def __init__(self, matrix, factor):
+        self._matrix = matrix
+        self._factor = factor
+
+    @property
+    def shape(self):
+        return self._matrix.shape
+
+    def __len__(self):
+        return len(self._matrix)
+
+    def __getitem__(self, index):
+        return np.asarray(self._matrix[index]) * self._factor
+
+    def __array__(self, dtype=None, copy=None):
+        data = np.asarray(self._matrix) * self._factor
+
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+
+        return data
+
+
+class InteractionLU:
+    """
+    InteractionLU: applies the inverse of the interaction system of equations
+    using its LU factorisation, rather than forming the inverse explicitly.
+
+    Args:
+        A (numpy.ndarray): the matrix of the system of equations, (Id-T*D)
+    """
+
+    def __init__(self, A):
+        self._lu_piv = lu_factor(A)
+
+    def rdot(self, X):
+        """Return dot(X, inv(A)) for the rows of X"""
+        return lu_solve(self._lu_piv, X.T, trans=1).T
+
+
+class InteractionGMRES:
+    """
+    InteractionGMRES: applies the inverse of the interaction system of
+    equations, (Id-T*D), using GMRES with matrix-free products of T and D.
+    As the diagonal blocks of T are zero, the block-diagonal (Jacobi)
+    preconditioner of the system is the identity and it is not applied.
+
+    Args:
+        T (numpy.ndarray): transformation matrix
+        D (numpy.ndarray): diffraction transfer matrix of the array
+        tol (float): relative tolerance of the solution
+    """
+
+    def __init__(self, T, D, tol=1e-6):
+        self._tol = tol
+        self._dtype = np.result_type(T, D, np.complex64)
+        self._op = _InteractionOperator(T, D, self._dtype)
+
+    def rdot(self, X):
+        """Return dot(X, inv(Id-T*D)) for the rows of X"""
+
+        X = np.atleast_2d(X)
+        Y = zeros(X.shape, dtype=self._dtype)
+
+        for i, x in enumerate(X):
+            y, info = gmres(self._op, x, rtol=self._tol, atol=0.0)
+
+            if info > 0:
+                module_logger.warning(
+                    "GMRES did not converge to the requested tolerance "
+                    "after {} iterations".format(info)
+                )
+
+            Y[i] = y
+
+        return Y
+
+
+class _InteractionOperator(LinearOperator):
+    """Applies the transpose of the interaction system of equations, so that
+    y * (Id-T*D) = x is solved as (Id-D^t*T^t) * y^t = x^t"""
+
+    def __init__(self, T, D, dtype):
+        n = len2(T)
+        super().__init__(dtype, (n, n))
+        self._T = T
+        self._D = D
+
+    def _matvec(self, x):
+        return x - dot(self._D.T, dot(self._T.T, x))
+
+
+def interaction_dot(X, M_interaction):
+    """
+    interaction_dot: Returns dot(X, M) where M is the inverse of the
+    interaction system of equations, given either explicitly or as an
+    InteractionLU or InteractionGMRES object.
+    """
+
+    if isinstance(M_interaction, np.ndarray):
+        return dot(X, M_interaction)
+
+    return M_interaction.rdot(X)
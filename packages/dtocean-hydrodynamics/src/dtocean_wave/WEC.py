@@ -31,7 +31,7 @@ import logging
 import numpy as np
 
 from .utils import read_bem_solution as reader
-from .utils.StrDyn import EnergyProduction
+from .utils.StrDyn import EnergyProductionBatch
 
 module_logger = logging.getLogger(__name__)
 
@@ -74,9 +74,9 @@ class wec(object):
         Kmooring_sm (numpy.ndarray): mooring stiffness function of the sea states and dof for the single machine
         order (numpy.ndarray): max order of the wave modes used to describe the array field around and generated by the body
         truncorder (numpy.ndarray): representative order of the wave modes used to describe the array field around and generated by the body
-        G (numpy.ndarray): force transfer matrix associated with the WEC
-        D (numpy.ndarray): diffraction transfer matrix associated with the WEC
-        AR (numpy.ndarray): partial wave amplitude associated with the WEC
+        G (LazyDataset): force transfer matrix associated with the WEC, read from the BEM solution file on demand
+        D (LazyDataset): diffraction transfer matrix associated with the WEC, read from the BEM solution file on demand
+        AR (LazyDataset): partial wave amplitude associated with the WEC, read from the BEM solution file on demand
         energyproduction (numpy.ndarray): average energy produced per year for the given sea states
         power (numpy.ndarray): power matrix of the WEC
         RAO (numpy.ndarray): response amplitude operator of the WEC
@@ -120,7 +120,7 @@ class wec(object):
             self.modes,
             self.order,
             self.truncorder,
-        ) = reader.read_hydrodynamic_solution(self.pathname)
+        ) = reader.read_hydrodynamic_solution(self.pathname, lazy=True)
 
         (
             self.Cfit,
@@ -156,7 +156,7 @@ class wec(object):
 
         NBo = 1  # Number of bodies
 
-        (Pyr, P) = EnergyProduction(
+        (Pyr, P) = EnergyProductionBatch(
             NBo,
             hydro_mb.B,
             hydro_mb.Hs,
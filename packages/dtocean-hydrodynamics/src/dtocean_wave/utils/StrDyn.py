@@ -283,41 +283,298 @@ def EnergyProduction(
                             powfun[bdy, ind, i_fr] = Vrpowfun + Vipowfun
 
                 ## Compute power matrix
-                Spec_.rm_spectrum()
+                P_dev[:, i_Tp, i_Hs, i_Dir] = _integrate_power(
+                    Spec_,
+                    powfun,
+                    df,
+                    Hs[i_Hs],
+                    Tp[i_Tp],
+                    Dirs[i_Dir],
+                    dirs[i_dir],
+                    RatedPower,
+                )
 
-                Spec_.Hs = Hs[i_Hs]
-                Spec_.fp = 1.0 / Tp[i_Tp]
-                Spec_.t_mean = Dirs[i_Dir]
-                Spec_.t = dirs[i_dir]
+                ## Compute yearly power production (Site dependent)
+                powprob = prob_occ[i_Tp, i_Hs, i_Dir]
+                powdev = P_dev[:, i_Tp, i_Hs, i_Dir]
 
-                Spec_.add_spectrum()
+                Pyr[:, i_Tp, i_Hs, i_Dir] = powprob * powdev
 
-                # integrate over frequencies
-                Ip = 2.0 * Spec_.specs[0][2].T * powfun  # a**2 = 2*Spec_val*df
-                Ip = 0.5 * ((Ip[:, :, 1:] + Ip[:, :, :-1]) * df).sum(axis=-1)
+    return Pyr, P_dev
 
-                # integrate over directions
-                if Nd_subset > 1:
-                    Ip = 0.5 * ((Ip[:, 1:] + Ip[:, :-1]) * Spec_.dth).sum(
-                        axis=-1
-                    )
 
-                free_power = Ip.reshape(-1)
+def EnergyProductionBatch(
+    NBodies,
+    Dirs,
+    Hs,
+    Tp,
+    dirs,
+    period,
+    ScatDiag,
+    M,
+    Madd,
+    CPTO,
+    Crad,
+    Kmoor,
+    Khyd,
+    Fex,
+    Kfit,
+    Cfit,
+    RatedPower=None,
+):
+    """
+    EnergyProductionBatch: calculates the energy production for the given sea
+    states, based on the given numerical model. Equivalent to EnergyProduction,
+    but the sea states are grouped by their PTO, mooring and fitting
+    coefficients and, for each group, the equations of motion for all
+    frequencies and wave directions are solved at once.
 
-                if (free_power > RatedPower).any():
-                    free_power = np.clip(free_power, None, RatedPower)
+    Args:
+        See EnergyProduction
 
-                P_dev[:, i_Tp, i_Hs, i_Dir] = free_power
+    Returns:
+        Pyr (numpy.ndarray):
+            power production per device per sea states normalised by the
+            probability of occurrence of the sea states
+        P_dev (numpy.ndarray):
+            power production per device per sea states
 
-                ## Compute yearly power production (Site dependent)
-                powprob = prob_occ[i_Tp, i_Hs, i_Dir]
-                powdev = P_dev[:, i_Tp, i_Hs, i_Dir]
+    """
 
-                Pyr[:, i_Tp, i_Hs, i_Dir] = powprob * powdev
+    NDir = len2(Dirs)
+    NHs = len2(Hs)
+    NTp = len2(Tp)
+    ndof = len(Khyd[0, :])
+    if RatedPower is None:
+        RatedPower = np.inf
+
+    # convert the tuple to numpy.ndarray to ease calculations
+    dirs = np.array(dirs)
+    prob_occ = scatterdiagram_threshold(ScatDiag[0])
+
+    # initialize spectrum
+    df = np.abs(1.0 / period[1:] - 1.0 / period[:-1])
+    fr = 1.0 / period
+    w = 2.0 * np.pi * fr
+
+    Spec_ = wave_spec(fr, 1, 1)
+    Spec_.s = ScatDiag[1][2]
+
+    # is s=0 or s=30 there is no need for directional spreading.
+    if Spec_.s <= 0 or Spec_.s > 30:
+        Nd_subset = 1
+    else:
+        Nd_subset = 3
+
+    Spec_.gamma = ScatDiag[1][1]
+    Spec_.spec_type = ScatDiag[1][0]
+
+    Spec_.add_spectrum()
+
+    # initialize output
+    P_dev = np.zeros((NBodies, NTp, NHs, NDir), dtype=float)
+    Pyr = np.zeros((NBodies, NTp, NHs, NDir), dtype=float)
+
+    # collect the sea states that share the same coefficients
+    search_region = list(range(len(dirs) // Nd_subset))
+    seastate_groups = {}
+
+    for i_Dir in range(NDir):
+        dir_subset_ind = np.where(
+            np.abs(dirs[search_region] - Dirs[i_Dir]) == 0
+        )[0]
+
+        if not dir_subset_ind.size:
+            continue
+
+        i_dir = [
+            dir_subset_ind[0] + el * len(search_region)
+            for el in range(Nd_subset)
+        ]
+
+        for i_Hs in range(NHs):
+            for i_Tp in range(NTp):
+                seastate = (i_Tp, i_Hs, i_Dir)
+                key = (
+                    CPTO[seastate].tobytes(),
+                    Cfit[seastate].tobytes(),
+                    Kmoor[seastate].tobytes(),
+                    Kfit[seastate].tobytes(),
+                )
+
+                if key not in seastate_groups:
+                    seastate_groups[key] = []
+
+                seastate_groups[key].append((seastate, i_dir))
+
+    # impedance terms that are common to all sea states
+    Mw = -(w**2)[:, None, None] * (block_diag(*[M] * NBodies) + Madd)
+    Cw = 1j * w[:, None, None] * Crad
+
+    for group in seastate_groups.values():
+        seastate = group[0][0]
+        Cpto_ = CPTO[seastate]
+
+        block2 = block_diag(*[Cpto_ + Cfit[seastate]] * NBodies)
+        block3 = block_diag(
+            *[Kmoor[seastate] + Khyd + Kfit[seastate]] * NBodies
+        )
+
+        # solve the equation of motion for all frequencies and the wave
+        # directions required by this group
+        dir_cols = sorted(set(i for _, i_dir in group for i in i_dir))
+        dir_map = {i: col for col, i in enumerate(dir_cols)}
+
+        H = Mw + Cw + 1j * w[:, None, None] * block2 + block3
+        force = np.transpose(Fex[:, dir_cols], axes=(0, 2, 1))
+
+        velo = solve(H, force) * (1j * w)[:, None, None]
+        velo = velo.reshape((len(w), NBodies, ndof, len(dir_cols)))
+
+        # power function indexed by body, direction and frequency
+        powfun_all = 0.5 * (
+            np.einsum("fbic,ij,fbjc->bcf", velo.real, Cpto_, velo.real)
+            + np.einsum("fbic,ij,fbjc->bcf", velo.imag, Cpto_, velo.imag)
+        )
+
+        for (i_Tp, i_Hs, i_Dir), i_dir in group:
+            powfun = powfun_all[:, [dir_map[i] for i in i_dir], :]
+
+            ## Compute power matrix
+            P_dev[:, i_Tp, i_Hs, i_Dir] = _integrate_power(
+                Spec_,
+                powfun,
+                df,
+                Hs[i_Hs],
+                Tp[i_Tp],
+                Dirs[i_Dir],
+                dirs[i_dir],
+                RatedPower,
+            )
+
+            ## Compute yearly power production (Site dependent)
+            powprob = prob_occ[i_Tp, i_Hs, i_Dir]
+            powdev = P_dev[:, i_Tp, i_Hs, i_Dir]
+
+            Pyr[:, i_Tp, i_Hs, i_Dir] = powprob * powdev
 
     return Pyr, P_dev
 
 
+def PowerWeights(Dir, Hs, Tp, dirs, period, ScatDiag_spec):
+    """
+    PowerWeights: calculates the weights that integrate the power function of
+    a body, indexed by direction and frequency, over the spectrum of a single
+    sea state. The power of the body is the sum of the product of the weights
+    and the power function. Equivalent to the integration carried out by
+    EnergyProduction, without a rated power.
+
+    Args:
+        Dir (float) [rad]:
+            wave direction of the sea state
+        Hs (float) [m]:
+            significant wave height of the sea state
+        Tp (float) [s]:
+            peak period of the sea state
+        dirs (tuple) [rad]:
+            tuple of wave directions associated with the current orientation
+        period (numpy.ndarray) [s]:
+            wave period used in the definition of the numerical model
+        ScatDiag_spec (tuple):
+            the type of wave spectrum (Spec name, gamma, directional
+            spreading)
+
+    Returns:
+        i_dir (list):
+            indices of the directions in dirs used by the sea state. None if
+            the sea state direction is not found in dirs.
+        weights (numpy.ndarray):
+            integration weights indexed by direction and frequency. None if
+            the sea state direction is not found in dirs.
+
+    """
+
+    dirs = np.array(dirs)
+    df = np.abs(1.0 / period[1:] - 1.0 / period[:-1])
+    fr = 1.0 / period
+
+    Spec_ = wave_spec(fr, 1, 1)
+    Spec_.s = ScatDiag_spec[2]
+
+    # is s=0 or s=30 there is no need for directional spreading.
+    if Spec_.s <= 0 or Spec_.s > 30:
+        Nd_subset = 1
+    else:
+        Nd_subset = 3
+
+    Spec_.gamma = ScatDiag_spec[1]
+    Spec_.spec_type = ScatDiag_spec[0]
+
+    search_region = list(range(len(dirs) // Nd_subset))
+    dir_subset_ind = np.where(np.abs(dirs[search_region] - Dir) == 0)[0]
+
+    if not dir_subset_ind.size:
+        return None, None
+
+    i_dir = [
+        dir_subset_ind[0] + el * len(search_region) for el in range(Nd_subset)
+    ]
+
+    Spec_.Hs = Hs
+    Spec_.fp = 1.0 / Tp
+    Spec_.t_mean = Dir
+    Spec_.t = dirs[i_dir]
+
+    Spec_.add_spectrum()
+
+    # trapezoidal integration over frequencies
+    freq_weights = np.zeros(len(fr))
+    freq_weights[1:] += 0.5 * df
+    freq_weights[:-1] += 0.5 * df
+
+    weights = 2.0 * Spec_.specs[0][2].T * freq_weights
+
+    # trapezoidal integration over directions
+    if Nd_subset > 1:
+        dir_weights = np.zeros(Nd_subset)
+        dir_weights[1:] += 0.5 * Spec_.dth
+        dir_weights[:-1] += 0.5 * Spec_.dth
+        weights *= dir_weights[:, None]
+
+    return i_dir, weights
+
+
+def _integrate_power(Spec_, powfun, df, Hs, Tp, Dir, dirs, RatedPower):
+    """Integrate the power function, indexed by body, direction and frequency,
+    over the spectrum of the given sea state and return the power per body"""
+
+    Nd_subset = powfun.shape[1]
+
+    Spec_.rm_spectrum()
+
+    Spec_.Hs = Hs
+    Spec_.fp = 1.0 / Tp
+    Spec_.t_mean = Dir
+    Spec_.t = dirs
+
+    Spec_.add_spectrum()
+
+    # integrate over frequencies
+    Ip = 2.0 * Spec_.specs[0][2].T * powfun  # a**2 = 2*Spec_val*df
+    Ip = 0.5 * ((Ip[:, :, 1:] + Ip[:, :, :-1]) * df).sum(axis=-1)
+
+    # integrate over directions
+    if Nd_subset > 1:
+        Ip = 0.5 * ((Ip[:, 1:] + Ip[:, :-1]) * Spec_.dth).sum(axis=-1)
+
+    free_power = Ip.reshape(-1)
+
+    if (free_power > RatedPower).any():
+        free_power = np.clip(free_power, None, RatedPower)
+
+    return free_power
+
+
 # if __name__ == "__main__":
 #
 #    NBo=1
@@ -28,9 +28,12 @@ This module provides several methods which are recurrently used to solve the wat
 
 import logging
 import os
+from functools import lru_cache
 from math import cos, log10, pi, tan, tanh
+from typing import overload
 
 import numpy as np
+import numpy.typing as npt
 from numpy import (
     arctan2,
     array,
@@ -127,6 +130,14 @@ def Newton(func, const, x=1, feat=(100, 1e-6, 1e-6)):
     return x, bl
 
 
+@overload
+def WNumber(period: float, depth) -> float: ...
+
+
+@overload
+def WNumber(period: npt.ArrayLike, depth) -> np.ndarray: ...
+
+
 def WNumber(period, depth):
     """
     Calculates wave-number, k0, from wave-period and water depth (T,h).
@@ -138,13 +149,46 @@ def WNumber(period, depth):
     Outputs:
         wavenumbers
     """
-    try:
-        L = array(
-            [Newton(Dispersion_T, (p, depth))[0] for p in period], dtype=float
+
+    periods = np.asarray(period, dtype=float)
+    k = _wnumber_travelling(tuple(periods.reshape(-1).tolist()), float(depth))
+
+    if periods.ndim == 0:
+        return float(k[0])
+
+    return k.reshape(periods.shape).copy()
+
+
+@lru_cache(maxsize=128)
+def _wnumber_travelling(periods, depth, tol=1e-12, kmax=50):
+    """Vectorised Newton solution of w**2 = g*k*tanh(k*h) for k. The result
+    is cached, so it is made read-only."""
+
+    w2 = (2 * pi / np.array(periods, dtype=float)) ** 2
+
+    # explicit approximation (Eckart) as first iterate
+    k_deep = w2 / g
+    k = k_deep / np.sqrt(np.tanh(k_deep * depth))
+
+    for _ in range(kmax):
+        th = np.tanh(k * depth)
+        f = g * k * th - w2
+        df = g * th + g * k * depth * (1 - th**2)
+        dk = f / df
+        k = k - dk
+
+        if (np.abs(dk) <= tol * np.abs(k)).all():
+            break
+
+    else:
+        module_logger.warning(
+            "Travelling wave-number did not converge. Max relative "
+            "change = {:.2e}".format(np.max(np.abs(dk) / np.abs(k)))
         )
-    except TypeError:
-        L = Newton(Dispersion_T, (period, depth))[0]
-    return 2 * pi / L
+
+    k.flags.writeable = False
+
+    return k
 
 
 def len2(x):
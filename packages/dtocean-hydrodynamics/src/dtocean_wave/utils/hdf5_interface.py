@@ -18,7 +18,7 @@
 
 """
 This module contains the methods used to write and read dictionaries to hdf5
-files
+files, and a store giving lazy access to the datasets of a hdf5 file
 
 .. module:: hdf5_interface
      :synopsis: hdf5 reader and writer
@@ -28,10 +28,16 @@ files
 """
 
 import os
+import weakref
+from typing import Any
 
 import h5py
 import numpy as np
 
+# Minimum number of elements in an array for it to be chunked and compressed
+# when writing
+_CHUNK_MIN_SIZE = 4096
+
 
 def create_empty_project(folder, prj_name):
     general_inputs = {
@@ -75,16 +81,45 @@ def create_empty_project(folder, prj_name):
     return load_dict_from_hdf5(filename)
 
 
-def save_dict_to_hdf5(dic, filename):
+def save_dict_to_hdf5(dic, filename, compression=None):
+    """Write a (nested) dictionary to a hdf5 file.
+
+    If compression is given, large numerical arrays are stored in chunks of
+    one index of their first axis (e.g. one wave frequency of a BEM
+    solution), compressed with the given filter, so that they can be read
+    efficiently block by block.
+
+    Args:
+        dic (dict): the dictionary to write
+        filename (str): path of the hdf5 file
+        compression (str, optional): h5py compression filter, e.g. "gzip"
+    """
+
     with h5py.File(filename, "w") as h5file:
-        recursively_save_dict_contents_to_group(h5file, "/", dic)
+        recursively_save_dict_contents_to_group(h5file, "/", dic, compression)
 
 
-def recursively_save_dict_contents_to_group(h5file, path, dic):
+def recursively_save_dict_contents_to_group(
+    h5file,
+    path,
+    dic,
+    compression=None,
+):
     for key, item in dic.items():
         if isinstance(item, dict):
             recursively_save_dict_contents_to_group(
-                h5file, path + key + "/", item
+                h5file,
+                path + key + "/",
+                item,
+                compression,
+            )
+        elif compression is not None and _is_chunkable(item):
+            h5file.create_dataset(
+                path + key,
+                data=item,
+                chunks=(1,) + item.shape[1:],
+                compression=compression,
+                shuffle=True,
             )
         else:
             h5file[path + key] = item
@@ -110,10 +145,7 @@ def recursively_load_dict_contents_from_group(h5file, path, decode_bytes=True):
 
     for key, item in h5file[path].items():
         if isinstance(item, h5py.Dataset):
-            value = item[()]
-            if decode_bytes and isinstance(value, bytes):
-                value = value.decode()
-            ans[key] = value
+            ans[key] = _read_dataset(item, decode_bytes)
         elif isinstance(item, h5py.Group):
             ans[key] = recursively_load_dict_contents_from_group(
                 h5file,
@@ -122,3 +154,171 @@ def recursively_load_dict_contents_from_group(h5file, path, decode_bytes=True):
             )
 
     return ans
+
+
+class HDF5Store(object):
+    """
+    HDF5Store: read only, lazy access to the contents of a hdf5 file. The
+        file is opened on first access and the handle is held until the
+        store is closed, either by calling close, on leaving a with block or
+        when the store is garbage collected. Items are only read when
+        requested, either whole or, using get_dataset, by slicing.
+
+        When pickled, only the file name is stored and the file is reopened
+        on first access after unpickling. An IOError is raised if the file
+        has been modified in the meantime.
+
+    Args:
+        filename (str): path of the hdf5 file
+        decode_bytes (bool, optional): decode bytes datasets to str when
+            read whole
+
+    Attributes:
+        filename (str): path of the hdf5 file
+        decode_bytes (bool): decode bytes datasets to str when read whole
+    """
+
+    def __init__(self, filename, decode_bytes=True):
+        self.filename = filename
+        self.decode_bytes = decode_bytes
+        self._stamp = _get_file_stamp(filename)
+        self._h5file = None
+        self._finalizer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_h5file"] = None
+        state["_finalizer"] = None
+        return state
+
+    def __contains__(self, key):
+        return key in self._get_file()
+
+    def __getitem__(self, key) -> Any:
+        item = self._get_file()[key]
+
+        if isinstance(item, h5py.Group):
+            return recursively_load_dict_contents_from_group(
+                self._get_file(),
+                "{}/".format(item.name),
+                self.decode_bytes,
+            )
+
+        return _read_dataset(item, self.decode_bytes)
+
+    def keys(self):
+        return list(self._get_file().keys())
+
+    def get_dataset(self, key):
+        """get_dataset: return a LazyDataset for the dataset with the given
+        key"""
+
+        self._get_dataset(key)
+
+        return LazyDataset(self, key)
+
+    def read(self, key, index=()):
+        """read: read the given index (or slice) of the dataset with the given
+        key"""
+
+        return self._get_dataset(key)[index]
+
+    def close(self):
+        if self._finalizer is None:
+            return
+
+        self._finalizer()
+        self._h5file = None
+        self._finalizer = None
+
+    def _get_file(self):
+        if self._h5file is not None:
+            return self._h5file
+
+        if _get_file_stamp(self.filename) != self._stamp:
+            errStr = "File {} has been modified since it was first opened"
+            raise IOError(errStr.format(self.filename))
+
+        self._h5file = h5py.File(self.filename, "r")
+        self._finalizer = weakref.finalize(self, self._h5file.close)
+
+        return self._h5file
+
+    def _get_dataset(self, key) -> h5py.Dataset:
+        item = self._get_file()[key]
+
+        if not isinstance(item, h5py.Dataset):
+            raise KeyError("Item '{}' is not a dataset".format(key))
+
+        return item
+
+
+class LazyDataset(object):
+    """
+    LazyDataset: array-like view of a dataset in a HDF5Store. Indexing reads
+        only the requested part of the dataset and converting to a numpy
+        array reads it whole.
+
+    Args:
+        store (HDF5Store): the store containing the dataset
+        key (str): key of the dataset in the store
+
+    Attributes:
+        shape (tuple): shape of the dataset
+        dtype (numpy.dtype): data type of the dataset
+    """
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+        dataset = store._get_dataset(key)
+        self.shape = dataset.shape
+        self.dtype = dataset.dtype
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, index):
+        return self._store.read(self._key, index)
+
+    def __array__(self, dtype=None, copy=None):
+        data = self._store.read(self._key)
+
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+
+        return data
+
+
+def _is_chunkable(item):
+    return (
+        isinstance(item, np.ndarray)
+        and item.ndim > 1
+        and item.size >= _CHUNK_MIN_SIZE
+        and item.dtype.kind in "biufc"
+    )
+
+
+def _read_dataset(dataset, decode_bytes=True):
+    value = dataset[()]
+
+    if decode_bytes and isinstance(value, bytes):
+        value = value.decode()
+
+    return value
+
+
+def _get_file_stamp(filename):
+    stat = os.stat(filename)
+    return (stat.st_size, stat.st_mtime_ns)
@@ -32,23 +32,43 @@ import os
 from . import hdf5_interface as h5i
 
 
-def read_hydrodynamic_solution(data_folder):
-    dic = h5i.load_dict_from_hdf5(__check_filename(data_folder))
-    m_m = dic["m_m"]
-    m_add = dic["m_add"]
-    c_rad = dic["c_rad"]
-    f_ex = dic["f_ex"]
-    periods = dic["periods"]
-    directions = dic["directions"]
-    k_hst = dic["k_hst"]
-    diffraction_tr_mat = dic["diffraction_tr_mat"]
-    force_tr_mat = dic["force_tr_mat"]
-    amplitude_coefficient_radiation = dic["amplitude_coefficient_radiation"]
-    water_depth = dic["water_depth"]
-    cyl_radius = dic["cyl_radius"]
-    modes = dic["modes"]
-    order = dic["max_order"]
-    truncation_order = dic["truncation_order"]
+def read_hydrodynamic_solution(data_folder, lazy=False):
+    """Read the hydrodynamic model of the isolated WEC.
+
+    If lazy is True, the diffraction transfer matrix, force transfer matrix
+    and radiation amplitude coefficients are returned as LazyDataset
+    objects, backed by a single open handle on the solution file, so that
+    they can be read one frequency block at a time.
+    """
+
+    store = h5i.HDF5Store(__check_filename(data_folder))
+
+    m_m = store["m_m"]
+    m_add = store["m_add"]
+    c_rad = store["c_rad"]
+    f_ex = store["f_ex"]
+    periods = store["periods"]
+    directions = store["directions"]
+    k_hst = store["k_hst"]
+    water_depth = store["water_depth"]
+    cyl_radius = store["cyl_radius"]
+    modes = store["modes"]
+    order = store["max_order"]
+    truncation_order = store["truncation_order"]
+
+    tr_mat_keys = [
+        "diffraction_tr_mat",
+        "force_tr_mat",
+        "amplitude_coefficient_radiation",
+    ]
+
+    if lazy:
+        tr_mats = [store.get_dataset(key) for key in tr_mat_keys]
+    else:
+        tr_mats = [store[key] for key in tr_mat_keys]
+        store.close()
+
+    diffraction_tr_mat, force_tr_mat, amplitude_coefficient_radiation = tr_mats
 
     return (
         m_m,
@@ -81,18 +101,18 @@ def read_directions(data_folder):
 
 
 def read_performancefit_solution(data_folder):
-    dic = h5i.load_dict_from_hdf5(__check_filename(data_folder))
-    c_ext = dic["c_ext"]
-    k_ext = dic["k_ext"]
-    c_fit = dic["c_fit"]
-    k_fit = dic["k_fit"]
-    c_pto = dic["c_pto"]
-    k_mooring = dic["k_mooring"]
-    te = dic["te"]
-    hm0 = dic["hm0"]
-    wave_dir = dic["wave_dir"]
-    scatter_diagram = dic["scatter_diagram"]
-    power_matrix = dic["power_matrix"]
+    with h5i.HDF5Store(__check_filename(data_folder)) as store:
+        c_ext = store["c_ext"]
+        k_ext = store["k_ext"]
+        c_fit = store["c_fit"]
+        k_fit = store["k_fit"]
+        c_pto = store["c_pto"]
+        k_mooring = store["k_mooring"]
+        te = store["te"]
+        hm0 = store["hm0"]
+        wave_dir = store["wave_dir"]
+        scatter_diagram = store["scatter_diagram"]
+        power_matrix = store["power_matrix"]
 
     return (
         c_fit + c_ext,
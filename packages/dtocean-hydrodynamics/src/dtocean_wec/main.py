@@ -565,7 +565,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
 
     def set_full_project(self):
         self.form_plot = Plotter(self)
-        self.form_power = PowerPerformance(self)
+        # Use a thread per CPU to fit the power matrix sea states
+        self.form_power = PowerPerformance(self, n_workers=os.cpu_count())
 
         sub_window = QMdiSubWindow(self.mdi_area)
         sub_window.setWidget(self.form_power)
@@ -630,6 +631,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             h5i.save_dict_to_hdf5(
                 data2dtocean,
                 os.path.join(self._data["prj_folder"], "wec_solution.h5"),
+                compression="gzip",
             )
         else:
             assert len(status) == 2
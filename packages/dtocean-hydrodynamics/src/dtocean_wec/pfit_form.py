@@ -54,11 +54,12 @@ class PowerPerformance(QWidget, Ui_Fit):
     trigger_results = Signal(dict)
     trigger_save = Signal(dict)
 
-    def __init__(self, parent):
+    def __init__(self, parent, n_workers=None):
         QWidget.__init__(self, parent)
         self.setupUi(self)
 
         self._data = None
+        self._n_workers = n_workers
         self.btn_browse_pfit.clicked.connect(self.browse_data)
         self.btn_load_pfit.clicked.connect(self.load_data)
         self.btn_fitting.clicked.connect(self.fitting)
@@ -213,6 +214,7 @@ class PowerPerformance(QWidget, Ui_Fit):
             [el - 1 for el in self._data["hyd"]["mooring_dof"]],
             self._data["hyd"]["order"],
             self.db_folder,
+            n_workers=self._n_workers,
         )
 
         per_fit.perf_fitting(
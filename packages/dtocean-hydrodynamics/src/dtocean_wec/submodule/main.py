@@ -49,14 +49,23 @@ class BemSolution(object):
          precompiled_case (int,optional)[]: number of the precompiled case to be selected from the WEC database.
          data_folder (string,optional)[]: path name of the folder holding the required input files.
          debug (boolean, string)[]: debug flag
+         n_workers (int,optional)[]: number of threads used by the power matrix fitting. If None, the sea states are fitted serially.
     Attributes:
            same as input arguments
 
     Returns: None
     """
 
-    def __init__(self, dataobj, db_folder, bin_folder, debug=False):
+    def __init__(
+        self,
+        dataobj,
+        db_folder,
+        bin_folder,
+        debug=False,
+        n_workers=None,
+    ):
         self.debug = debug
+        self.n_workers = n_workers
         self.data_folder = dataobj.data_folder
         self.project_folder = dataobj.project_folder
         self.precompiled_case = dataobj.precompiled_case
@@ -166,6 +175,7 @@ class BemSolution(object):
             self.reader.order,
             self.db_folder,
             debug=self.debug,
+            n_workers=self.n_workers,
         )
 
         if self.input_type == 1:
@@ -320,35 +320,16 @@ class NemohReader:
         return k_hst
 
     def __read_ca(self):
-        f_ca = open(os.path.join(self._path_prj_dyn_res, "CA.dat"), "r")
-        n_freq = int(float(f_ca.readline().split(":")[-1]))
-        ca = np.zeros((n_freq, self.loose_dof, self.loose_dof))
-        freq = np.zeros((n_freq, 1))  # Hz
+        return self.__read_radiation_coefficients("CA.dat")
 
-        # Nemoh split the line at the sixth element.
-        # Therefore a system with 9 dof will have 1full line plus 3elements in the second row.
-        # These last are still relative to the same i-index.
-        # The number or row per degree of freedom are totDOF/6
-        n_lines = int(np.ceil(self.loose_dof / 6.0))
-
-        for i_freq in range(n_freq):
-            freq[i_freq] = float(f_ca.readline().split()[0])
-            for dof in range(self.loose_dof):
-                ls_tmp = []
-                for nls in range(n_lines):
-                    ls_tmp += f_ca.readline().split()
-
-                ca[i_freq, dof, :] = np.asarray(ls_tmp, "f")
+    def __read_cm(self):
+        return self.__read_radiation_coefficients("CM.dat")
 
-        f_ca.close()
+    def __read_radiation_coefficients(self, file_name):
+        with open(os.path.join(self._path_prj_dyn_res, file_name), "r") as f:
+            lines = f.readlines()
 
-        return freq, ca
-
-    def __read_cm(self):
-        f_cm = open(os.path.join(self._path_prj_dyn_res, "CM.dat"), "r")
-        n_freq = int(float(f_cm.readline().split(":")[-1]))
-        cm = np.zeros((n_freq, self.loose_dof, self.loose_dof))
-        freq = np.zeros((n_freq, 1))  # Hz
+        n_freq = int(float(lines[0].split(":")[-1]))
 
         # Nemoh split the line at the sixth element.
         # Therefore a system with 9 dof will have 1full line plus 3elements in the second row.
@@ -356,50 +337,50 @@ class NemohReader:
         # The number or row per degree of freedom are totDOF/6
         n_lines = int(np.ceil(self.loose_dof / 6.0))
 
-        for i_freq in range(n_freq):
-            freq[i_freq] = float(f_cm.readline().split()[0])
-            for dof in range(self.loose_dof):
-                ls_tmp = []
-                for nls in range(n_lines):
-                    ls_tmp += f_cm.readline().split()
-
-                cm[i_freq, dof, :] = np.asarray(ls_tmp, "f")
+        headers, values = f_util.read_blocks(
+            lines[1:],
+            n_freq,
+            self.loose_dof * n_lines,
+            self.loose_dof**2,
+        )
 
-        f_cm.close()
+        freq = np.array([float(line.split()[0]) for line in headers])
+        coeffs = values.astype("f").reshape(
+            (n_freq, self.loose_dof, self.loose_dof)
+        )
 
-        return freq, cm
+        return freq.reshape((n_freq, 1)), coeffs.astype(float)
 
     def __read_fex(self):
-        f_Ex = open(
+        with open(
             os.path.join(self._path_prj_dyn_res, "ExcitationForce.tec"), "r"
-        )
+        ) as f_Ex:
+            lines = f_Ex.readlines()
+
         n_directions = int(self.angle_def[0])
         n_freq = int(self.frequency_def[0])
-
-        fex = 1j * np.zeros((n_freq, n_directions, self.loose_dof))
-        angles = np.zeros((n_directions, 1))
-        frequencies = np.zeros((n_freq, 1))
         n_lines = int(np.ceil(((self.loose_dof * 2) + 1) / 80.0))
-        for skip_header in range(self.loose_dof + 1):
-            f_Ex.readline()
-
-        for i_angle in range(n_directions):
-            line = f_Ex.readline()
-            angles[i_angle] = float(line.split("=")[2].split()[0])
-            for i_freq in range(n_freq):
-                ls_tmp = []
-                for nls in range(n_lines):
-                    ls_tmp += f_Ex.readline().split()
-
-                frequencies[i_freq] = float(ls_tmp[0])
-                MagPha = np.asarray(ls_tmp[1:], "f")
-                fex[i_freq, i_angle, :] = MagPha[0:-1:2] * np.exp(
-                    1j * MagPha[1::2]
-                )
+        n_values = self.loose_dof * 2 + 1
 
-        f_Ex.close()
+        headers, values = f_util.read_blocks(
+            lines[self.loose_dof + 1 :],
+            n_directions,
+            n_freq * n_lines,
+            n_freq * n_values,
+        )
+
+        angles = np.array(
+            [float(line.split("=")[2].split()[0]) for line in headers]
+        )
+
+        # values are indexed by direction, frequency and column
+        values = values.reshape((n_directions, n_freq, n_values))
+        frequencies = values[-1, :, :1].copy()
+        MagPha = values[:, :, 1:].astype("f")
+        fex = MagPha[:, :, 0::2] * np.exp(1j * MagPha[:, :, 1::2])
+        fex = np.transpose(fex, axes=(1, 0, 2)).astype(complex)
 
-        return (frequencies, angles, np.conj(fex))
+        return (frequencies, angles.reshape((n_directions, 1)), np.conj(fex))
 
     def __read_cylsurface(self):
         if not self.__get_array_mat:
@@ -415,46 +396,46 @@ class NemohReader:
             )
             Location = np.zeros((self.cyl_ntheta, self.cyl_nzeta, 3))
 
+            n_points = self.cyl_nzeta * self.cyl_ntheta
+
             for problems in range(n_problems):
-                # print problems
-                f_prob = open(
-                    os.path.join(
-                        self._path_prj_dyn_res,
-                        "cylsurface.{:5d}.dat".format(problems + 1),
-                    ),
-                    "r",
+                file_path = os.path.join(
+                    self._path_prj_dyn_res,
+                    "cylsurface.{:5d}.dat".format(problems + 1),
                 )
-                f_prob.readline()
-                f_prob.readline()
-
-                for n_zeta in range(self.cyl_nzeta):
-                    for n_theta in range(self.cyl_ntheta):
-                        temp = np.asarray(f_prob.readline().split(), "f")
-                        Location[n_theta, n_zeta, :] = temp[0:3]
-                        Pressure[n_theta, n_zeta, problems] = temp[3] * np.exp(
-                            1j * temp[4]
-                        )
-                f_prob.close()
 
-            Scattering = 1j * np.zeros(
-                (n_freq, n_directions, self.cyl_nzeta, self.cyl_ntheta)
-            )
-            Radiation = 1j * np.zeros(
-                (n_freq, self.loose_dof, self.cyl_nzeta, self.cyl_ntheta)
-            )
+                with open(file_path, "r") as f_prob:
+                    lines = f_prob.readlines()
 
-            problem_index = -1
-            for i_cfreq in range(n_freq):
-                for i_angle in range(n_directions):
-                    problem_index += 1
-                    Scattering[i_cfreq, i_angle, :, :] = np.transpose(
-                        Pressure[:, :, problem_index]
-                    )
-                for dof in range(self.loose_dof):
-                    problem_index += 1
-                    Radiation[i_cfreq, dof, :, :] = np.transpose(
-                        Pressure[:, :, problem_index]
+                table = f_util.read_table(lines[2 : 2 + n_points])
+
+                if table.shape[0] != n_points or table.shape[1] < 5:
+                    raise ValueError(
+                        "Unexpected data format in file {}".format(file_path)
                     )
+
+                # rows are ordered by zeta and then theta
+                table = table.astype("f").reshape(
+                    (self.cyl_nzeta, self.cyl_ntheta, -1)
+                )
+                Location = np.transpose(table[:, :, :3], axes=(1, 0, 2))
+                Location = Location.astype(float)
+                Pressure[:, :, problems] = np.transpose(
+                    table[:, :, 3] * np.exp(1j * table[:, :, 4])
+                )
+
+            # for each frequency, the diffraction problems for each direction
+            # are followed by the radiation problems for each dof
+            problems = np.transpose(Pressure, axes=(2, 1, 0)).reshape(
+                (
+                    n_freq,
+                    n_directions + self.loose_dof,
+                    self.cyl_nzeta,
+                    self.cyl_ntheta,
+                )
+            )
+            Scattering = problems[:, :n_directions].copy()
+            Radiation = problems[:, n_directions:].copy()
         else:
             # Dummy data when no field points are selected
             raise ValueError(
@@ -26,13 +26,16 @@ This module contains the main classes used to obtain the solution of the hydrody
 .. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
 """
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 import numpy as np
 from scipy import optimize
 
 import dtocean_wave.utils.hdf5_interface as h5i
-from dtocean_wave.utils.StrDyn import EnergyProduction
+from dtocean_wave.utils.StrDyn import EnergyProduction, PowerWeights
 from dtocean_wave.utils.WatWaves import len2
 
 # from .utils.conversion_utils import *
@@ -42,8 +45,31 @@ from .utils.conversion_utils import (
     set_wdirs_with_yaw,
 )
 
+# Start logging
+module_logger = logging.getLogger(__name__)
+
 
 class PowerMatrixFit:
+    """
+    PowerMatrixFit: fits damping and stiffness corrections to the numerical
+    model of the isolated WEC, such that its power matrix matches the
+    certified power matrix.
+
+    Optional args:
+        debug (boolean): print the progress of the fitting
+        n_workers (int): number of threads used to fit the sea states in
+                         parallel. If None, the sea states are fitted
+                         serially. Defaults to None.
+        worker_timeout (float): maximum time, in seconds, to wait for the
+                                fits of a group of sea states when fitting
+                                in parallel. If None, there is no limit.
+                                Defaults to None.
+        warm_start (boolean): start each fit from the solution of the sea
+                              state with the neighbouring period, if it is a
+                              better starting point than no correction.
+                              Defaults to True.
+    """
+
     def __init__(
         self,
         periods,
@@ -61,7 +87,13 @@ class PowerMatrixFit:
         order,
         db_folder,
         debug=False,
+        n_workers=None,
+        worker_timeout=None,
+        warm_start=True,
     ):
+        if n_workers is not None and n_workers < 1:
+            raise ValueError("Argument n_workers must be greater than zero")
+
         self.m_m = m_m
         self.m_add = m_add
         self.c_rad = c_rad
@@ -81,6 +113,9 @@ class PowerMatrixFit:
         self.order = order
         self.db_folder = db_folder
         self.debug = debug
+        self.n_workers = n_workers
+        self.worker_timeout = worker_timeout
+        self.warm_start = warm_start
         self._fex = f_ex
 
         self.c_pto = None
@@ -175,7 +210,6 @@ class PowerMatrixFit:
         sd_shape = sp_distr.shape
 
         ndof = self.n_dof
-        periods = self.periods  # wave periods analysed in bem
 
         self.c_ext = self.__check_matrix_dimension(
             self.c_ext, sd_shape, range(ndof)
@@ -225,69 +259,92 @@ class PowerMatrixFit:
             range(-self.order.max(), self.order.max() + 1), dtype=float
         )
         Gp = np.transpose(self.force_matrix, axes=(0, 2, 1))
+        orientations = list(zip(wdirs_yaw[::2], wdirs_yaw[1::2]))
+        f_ex_cache = {}
+
+        # Group the sea states into chains of increasing period, for each
+        # wave height and direction. Each chain is fitted in turn, so that
+        # fits can be warm-started from their neighbours, and the chains are
+        # fitted in parallel. If the direction of a sea state is found in
+        # more than one orientation, the last orientation is used.
+        chains = []
 
-        ind = 0
-        max_iter = len(wave_angles) * len(te) * len(hm0)
-        my_bounds = (
-            [
-                (-1, None),
-            ]
-            * ndof
-            * 2
-        )
-        x0 = [np.zeros((ndof * 2), "f")]  # x2 because two parameter are assesed
         for h_ind in range(len(hm0)):
-            for t_ind in range(len(te)):
-                for d_ind in range(len(wave_angles)):
-                    if self.debug:
-                        ind += 1
-                        print("sea state {} over {}".format(ind, max_iter))
-                    for orient, thetas in zip(wdirs_yaw[::2], wdirs_yaw[1::2]):
-                        if wave_angles[d_ind] not in thetas:
-                            continue
-                        ths = np.array([th for th in thetas], dtype=float)
-                        g_rot = np.transpose(
-                            Gp * np.exp(-1j * Nm * orient), axes=(0, 2, 1)
-                        )
-                        # Excitation Force isolated WEC
-                        (mths, mode) = np.meshgrid(ths, Nm, indexing="ij")
-                        AP = np.exp(-1j * mode * (np.pi / 2 + mths))
-                        f_ex = np.zeros(
-                            (len(periods), len(thetas), ndof), dtype=complex
-                        )
-                        for f in range(len2(self.periods)):
-                            f_ex[f, :, :] = np.dot(AP, g_rot[f])
-                        ref_power = machine_spec["power_matrix"][
-                            t_ind, h_ind, d_ind
-                        ]
-                        lin_fit_b = optimize.fmin_l_bfgs_b(
-                            self.__power_fit,
-                            x0,
-                            args=(
-                                (t_ind, h_ind, d_ind),
-                                thetas,
-                                ref_power,
-                                f_ex,
-                            ),
-                            approx_grad=1,
-                            bounds=my_bounds,
-                            pgtol=1e-12,
-                        )
-                        Cfit_sm[t_ind, h_ind, d_ind] = np.diag(
-                            lin_fit_b[0][:ndof]
-                        )
-                        Kfit_sm[t_ind, h_ind, d_ind] = np.diag(
-                            lin_fit_b[0][ndof:]
-                        )
-                        wec_power_matrix[t_ind, h_ind, d_ind] = (
-                            self.__power_fit(
-                                lin_fit_b[0],
-                                (t_ind, h_ind, d_ind),
-                                thetas,
-                                0,
-                                f_ex,
-                            )
-                        )
+            for d_ind in range(len(wave_angles)):
+                o_inds = [
+                    o_ind
+                    for o_ind, (_, thetas) in enumerate(orientations)
+                    if wave_angles[d_ind] in thetas
+                ]
+
+                if not o_inds:
+                    continue
+
+                o_ind = o_inds[-1]
+
+                if o_ind not in f_ex_cache:
+                    f_ex_cache[o_ind] = self.__get_f_ex(
+                        *orientations[o_ind], Gp, Nm
+                    )
+
+                chain = [
+                    ((t_ind, h_ind, d_ind), orientations[o_ind][1])
+                    for t_ind in range(len(te))
+                ]
+                chains.append((chain, f_ex_cache[o_ind]))
+
+        n_fits = sum(len(chain) for chain, _ in chains)
+        my_bounds = [(-1, None)] * ndof * 2
+        x0 = np.zeros(ndof * 2)
+
+        def fit_chain(chain, f_ex):
+            results = []
+            x_prev = None
+
+            for seastate_id, thetas in chain:
+                problem = self.__get_fit_problem(
+                    seastate_id,
+                    thetas,
+                    machine_spec["power_matrix"][seastate_id],
+                    f_ex,
+                )
+
+                x_start = x0
+
+                if (
+                    self.warm_start
+                    and x_prev is not None
+                    and problem(x_prev)[0] < problem(x0)[0]
+                ):
+                    x_start = x_prev
+
+                x_opt, _, _ = optimize.fmin_l_bfgs_b(
+                    problem,
+                    x_start,
+                    bounds=my_bounds,
+                    pgtol=1e-12,
+                )
+
+                power, _ = problem.power(x_opt)
+                results.append((seastate_id, x_opt, power))
+                x_prev = x_opt
+
+                if self.debug:
+                    print("sea state {} over {}".format(seastate_id, n_fits))
+
+            return results
+
+        if self.n_workers is None:
+            chain_results = [fit_chain(*chain) for chain in chains]
+        else:
+            chain_results = self.__fit_chains_parallel(fit_chain, chains)
+
+        for results in chain_results:
+            for seastate_id, x_opt, power in results:
+                Cfit_sm[seastate_id] = np.diag(x_opt[:ndof])
+                Kfit_sm[seastate_id] = np.diag(x_opt[ndof:])
+                wec_power_matrix[seastate_id] = power**2
+
         self.c_fit = Cfit_sm
         self.k_fit = Kfit_sm
         self.wec_power_matrix = np.sqrt(wec_power_matrix)
@@ -296,6 +353,103 @@ class PowerMatrixFit:
             wdirs_yaw, wec_original_power_matrix, skip_fit=True
         )
 
+    def __fit_chains_parallel(self, fit_chain, chains):
+        """Fit the chains of sea states using a pool of threads. If a chain
+        fails or exceeds worker_timeout, the remaining chains are cancelled
+        and an error is raised. Threads that are already running can not
+        be stopped, so they are left to finish in the background."""
+
+        executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        futures = [executor.submit(fit_chain, *chain) for chain in chains]
+        chain_results = []
+
+        try:
+            for (chain, _), future in zip(chains, futures):
+                try:
+                    results = future.result(timeout=self.worker_timeout)
+
+                except FutureTimeoutError:
+                    errStr = (
+                        "Fitting of sea states {} to {} did not complete "
+                        "within {} seconds"
+                    ).format(chain[0][0], chain[-1][0], self.worker_timeout)
+                    module_logger.error(errStr)
+                    raise RuntimeError(errStr) from None
+
+                except Exception:
+                    errStr = (
+                        "Fitting of sea states {} to {} failed with an "
+                        "unexpected error"
+                    ).format(chain[0][0], chain[-1][0])
+                    module_logger.exception(errStr)
+                    raise
+
+                chain_results.append(results)
+
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return chain_results
+
+    def __get_f_ex(self, orient, thetas, Gp, Nm):
+        """Return the excitation force of the isolated WEC for the given
+        orientation, indexed by period, direction and dof"""
+
+        ths = np.array([th for th in thetas], dtype=float)
+        g_rot = np.transpose(Gp * np.exp(-1j * Nm * orient), axes=(0, 2, 1))
+        (mths, mode) = np.meshgrid(ths, Nm, indexing="ij")
+        AP = np.exp(-1j * mode * (np.pi / 2 + mths))
+        f_ex = np.zeros(
+            (len(self.periods), len(thetas), self.n_dof), dtype=complex
+        )
+
+        for f in range(len2(self.periods)):
+            f_ex[f, :, :] = np.dot(AP, g_rot[f])
+
+        return f_ex
+
+    def __get_fit_problem(self, seastate_id, thetas, target_pow, f_ex):
+        """Return the objective function of the fit for the given sea state.
+        Equivalent to __power_fit, but with an analytic gradient."""
+
+        assert self.c_pto is not None
+        assert self.k_mooring is not None
+        assert self.k_ext is not None
+        assert self.c_ext is not None
+        assert self.wave_dir is not None
+        assert self.hm0 is not None
+        assert self.tp is not None
+
+        assert not isinstance(self.k_ext, (float, int))
+        assert not isinstance(self.c_ext, (float, int))
+
+        i_dir, weights = PowerWeights(
+            self.wave_dir[seastate_id[2]],
+            self.hm0[seastate_id[1]],
+            self.tp[seastate_id[0]],
+            thetas,
+            self.periods,
+            self.scatter_diagram_spec,
+        )
+
+        force = None
+
+        if i_dir is not None:
+            force = np.transpose(f_ex[:, i_dir], axes=(0, 2, 1))
+
+        return _SeaStateFit(
+            self.periods,
+            self.m_m,
+            self.m_add,
+            self.c_rad,
+            self.c_pto[seastate_id] + self.c_ext[seastate_id],
+            self.c_pto[seastate_id],
+            self.k_mooring[seastate_id] + self.k_hst + self.k_ext[seastate_id],
+            force,
+            weights,
+            target_pow,
+        )
+
     def __power_fit(self, x, seastate_id, thetas, target_pow, f_ex):
         """
         power_fit: calls the power_wec to assess the power production of the WEC, given a frequency domain model and the sea states
@@ -461,3 +615,110 @@ class PowerMatrixFit:
                             )
 
             return np.sqrt(wec_power_matrix)
+
+
+class _SeaStateFit:
+    """
+    _SeaStateFit: objective function of the power matrix fit for a single
+        sea state, being the square relative error between the target and
+        absorbed power. The gradient with respect to the diagonal fitting damping and
+        stiffness coefficients is calculated using the adjoint of the
+        frequency domain equation of motion, so each evaluation needs two
+        solutions per frequency, regardless of the number of dofs.
+
+    Args:
+        periods (numpy.ndarray) [s]: wave periods of the numerical model
+        m_m (numpy.ndarray): mass matrix
+        m_add (numpy.ndarray): added mass matrix, per period
+        c_rad (numpy.ndarray): radiation damping matrix, per period
+        c_fixed (numpy.ndarray): pto and external damping matrix
+        c_pto (numpy.ndarray): pto damping matrix
+        k_fixed (numpy.ndarray): mooring, hydrostatic and external stiffness
+            matrix
+        force (numpy.ndarray): excitation force indexed by period, dof and
+            direction. None if the sea state is not modelled.
+        weights (numpy.ndarray): power integration weights indexed by
+            direction and period (see StrDyn.PowerWeights). None if the sea
+            state is not modelled.
+        target_pow (float) [W]: certified power of the sea state
+    """
+
+    def __init__(
+        self,
+        periods,
+        m_m,
+        m_add,
+        c_rad,
+        c_fixed,
+        c_pto,
+        k_fixed,
+        force,
+        weights,
+        target_pow,
+    ):
+        w = 2.0 * np.pi / np.asarray(periods)
+
+        self._iw = 1j * w
+        self._h_fixed = (
+            -(w**2)[:, None, None] * (m_m + m_add)
+            + self._iw[:, None, None] * (c_rad + c_fixed)
+            + k_fixed
+        )
+        self._c_pto = c_pto
+        self._c_pto_sym = 0.5 * (c_pto + c_pto.T)
+        self._force = force
+        self._weights = weights
+        self.target_pow = target_pow
+
+    def power(self, x):
+        """
+        power: calculate the absorbed power and its gradient
+
+        Args:
+            x (numpy.ndarray): flat array of Cfit and Kfit coefficients
+
+        Returns:
+            (tuple): the absorbed power and its gradient with respect to x
+        """
+
+        if self._weights is None:
+            return 0.0, np.zeros(len(x))
+
+        Nx = len(x) // 2
+        diag = np.arange(Nx)
+
+        h = self._h_fixed.copy()
+        h[:, diag, diag] += self._iw[:, None] * x[:Nx] + x[Nx:]
+
+        velo = np.linalg.solve(h, self._force) * self._iw[:, None, None]
+
+        # power function indexed by direction and frequency
+        powfun = 0.5 * (
+            np.einsum("fic,ij,fjc->cf", velo.real, self._c_pto, velo.real)
+            + np.einsum("fic,ij,fjc->cf", velo.imag, self._c_pto, velo.imag)
+        )
+        power = (self._weights * powfun).sum()
+
+        # The derivative of the power function for a change dH in the
+        # impedance matrix H is -Re(adj^H dH velo), where adj solves
+        # H^H adj = sym(Cpto) velo
+        h_adj = np.conj(np.transpose(h, axes=(0, 2, 1)))
+        adj = np.linalg.solve(
+            h_adj, np.einsum("ij,fjc->fic", self._c_pto_sym, velo)
+        )
+        sens = np.conj(adj) * velo * self._weights.T[:, None, :]
+
+        grad_c = -(self._iw[:, None, None] * sens).real.sum(axis=(0, 2))
+        grad_k = -sens.real.sum(axis=(0, 2))
+
+        return power, np.r_[grad_c, grad_k]
+
+    def __call__(self, x):
+        # The error is normalised by the target power, so that the
+        # convergence of the optimiser does not depend on its magnitude
+        scale = self.target_pow if self.target_pow > 0 else 1.0
+
+        power, grad = self.power(x)
+        error = (self.target_pow - power) / scale
+
+        return error**2, -2.0 * error * grad / scale
@@ -18,6 +18,8 @@
 import os
 import shutil
 
+import numpy as np
+
 
 def copy_result_to_project(source, destination, file_fl=False):
     src_st = os.path.join(source, "hydrostatic")
@@ -64,6 +66,83 @@ def split_string(string, num_type=float):
     return list_out
 
 
+def read_table(lines, n_cols=None):
+    """
+    Parse lines of whitespace separated numbers into a 2D array, with a
+    single conversion of all the values. Blank lines are ignored.
+
+    Args:
+        lines (list): lines of the table
+        n_cols (int, optional): expected number of columns. If None, the
+            number of columns is inferred from the number of values.
+
+    Returns:
+        numpy.ndarray: array of shape (number of lines, n_cols)
+    """
+
+    lines = [line for line in lines if line.strip()]
+    n_rows = len(lines)
+
+    if n_rows == 0:
+        raise ValueError("Expected a table, found no lines with values")
+
+    values = np.array(" ".join(lines).split(), dtype=float)
+
+    if n_cols is None:
+        n_cols = values.size // n_rows
+
+    if values.size != n_rows * n_cols:
+        raise ValueError(
+            "Expected a table of {} lines with {} values each, found {} "
+            "values".format(n_rows, n_cols, values.size)
+        )
+
+    return values.reshape((n_rows, n_cols))
+
+
+def read_blocks(lines, n_blocks, n_value_lines, n_values):
+    """
+    Parse a sequence of blocks of whitespace separated numbers. Each block
+    is made of a header line followed by the given number of value lines.
+    The values of all the blocks are converted at once.
+
+    Args:
+        lines (list): lines containing the blocks, without any file header
+        n_blocks (int): number of blocks
+        n_value_lines (int): number of value lines per block
+        n_values (int): number of values per block
+
+    Returns:
+        tuple: the list of header lines and an array of the values of shape
+            (n_blocks, n_values)
+    """
+
+    block_size = n_value_lines + 1
+    n_lines = n_blocks * block_size
+
+    if len(lines) < n_lines:
+        raise ValueError(
+            "Expected {} blocks of {} lines, found {} lines".format(
+                n_blocks, block_size, len(lines)
+            )
+        )
+
+    body = list(lines[:n_lines])
+    headers = body[::block_size]
+    del body[::block_size]
+
+    values = np.array(" ".join(body).split(), dtype=float)
+
+    if values.size != n_blocks * n_values:
+        raise ValueError(
+            "Expected {} blocks of {} values, found {} values".format(
+                n_blocks, n_values, values.size
+            )
+        )
+
+    return headers, values.reshape((n_blocks, n_values))
+
+
 def load_file(path, file_name):
     """
     the method is case sensitive, it distinguishes from capital and lower size letters
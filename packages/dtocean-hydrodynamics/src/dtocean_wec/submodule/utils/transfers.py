@@ -101,8 +101,9 @@ def transfers(
         indexing="ij",
         sparse=True,
     )
+    wnumbers = WNumber(periods, water_depth)
     for ind, per in enumerate(periods):
-        wave_cond = (water_depth, 2.0 * np.pi / per, WNumber(per, water_depth))
+        wave_cond = (water_depth, 2.0 * np.pi / per, wnumbers[ind])
         a_s_scat = bem2cyl(wave_cond, discrete_cyl, vpot_scat[ind], targ_order)
         a_s_rad[ind] = bem2cyl(
             wave_cond, discrete_cyl, vpot_rad[ind], targ_order
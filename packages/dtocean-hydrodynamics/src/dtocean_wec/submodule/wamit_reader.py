@@ -304,22 +304,17 @@ class WamitReader:
         f1_full = self.__load_ASCII(self.data_folder, ".1")
         assert isinstance(f1_full, list)
 
-        f1 = f1_full[1:]
+        f1 = f_util.read_table(f1_full[1:])  # skip first line, i.e. header
         n_per = len(self.periods)
-        m_add = []
-        c_rad = []
-        n_lines = len(f1)
-        for i, line in enumerate(f1):  # skip first line, i.e. header
-            linep = line.split()
-            m_add.append(float(linep[-2]))
-            c_rad.append(
-                float(linep[-1])
-            )  # Cradij component is given in the last column
+        n_lines = f1.shape[0]
         dofcheck = int(np.sqrt((n_lines + 1) / n_per))
         if dofcheck != self.n_dof:
             raise IOError(
                 "Total number of dof from Madd does not match total number of dof from dof_solid + dof_gener*NBODY"
             )
+        # Cradij component is given in the last column
+        m_add = f1[:, -2]
+        c_rad = f1[:, -1]
         m_add = self.rho * np.asarray(m_add, "f").reshape(
             (n_per, self.n_dof, self.n_dof)
         )  # dimentionalise the wamit output
@@ -344,15 +339,16 @@ class WamitReader:
         f2_full = self.__load_ASCII(self.data_folder, ".2")
         assert isinstance(f2_full, list)
 
-        f2 = f2_full[1:]
+        f2 = f_util.read_table(f2_full[1:])  # skip first line, i.e. header
         n_per = len(self.periods)
         n_dir = len(self.directions)
-        fex = np.zeros(n_per * n_dir * self.n_dof, dtype=complex)
-        for i, line in enumerate(f2):  # skip first line, i.e. header
-            linep = line.split()
-            fex[i] = complex(
-                float(linep[-2]), float(linep[-1])
-            )  # Fex is given as real(fex) and im(fex) in the last two columns
+        if f2.shape[0] != n_per * n_dir * self.n_dof:
+            raise IOError(
+                "The number of lines in the .2 file does not match the "
+                "number of periods, directions and dofs"
+            )
+        # Fex is given as real(fex) and im(fex) in the last two columns
+        fex = f2[:, -2] + 1j * f2[:, -1]
         fex = (
             self.rho * self.g * fex.reshape((n_per, n_dir, self.n_dof))
         )  # The reshape is easy the way Fex is given by WAMIT (as it was seen for the mass matrix)
@@ -365,16 +361,14 @@ class WamitReader:
         fmmx_full = self.__load_ASCII(self.data_folder, ".mmx")
         assert isinstance(fmmx_full, list)
 
-        fmmx = fmmx_full[13:]
-        mm = np.zeros((self.n_dof, self.n_dof), "f")
         dof_gener = self.__n_dof_gener
-        for line in fmmx[: (6 + dof_gener) ** 2]:
-            linep = line.split()
-            i_in = int(linep[0]) - 1
-            j_in = int(linep[1]) - 1
-            mm[i_in, j_in] = float(
-                linep[2]
-            )  # M[row_i,column_j]. M is given [row1,...,rowdof] so then afterwards a reshape will work super!
+        fmmx = f_util.read_table(fmmx_full[13:][: (6 + dof_gener) ** 2])
+        mm = np.zeros((self.n_dof, self.n_dof), "f")
+        i_in = fmmx[:, 0].astype(int) - 1
+        j_in = fmmx[:, 1].astype(int) - 1
+        mm[i_in, j_in] = fmmx[
+            :, 2
+        ]  # M[row_i,column_j]. M is given [row1,...,rowdof] so then afterwards a reshape will work super!
 
         return mm
 
@@ -384,13 +378,11 @@ class WamitReader:
         fhst_full = self.__load_ASCII(self.data_folder, ".hst")
         assert isinstance(fhst_full, list)
 
-        fhst = fhst_full[1:]
+        fhst = f_util.read_table(fhst_full[1:])
         khst = np.zeros((self.n_dof, self.n_dof), "f")
-        for line in fhst:
-            linep = line.split()
-            i_in = int(linep[0]) - 1
-            j_in = int(linep[1]) - 1
-            khst[i_in, j_in] = float(linep[2])
+        i_in = fhst[:, 0].astype(int) - 1
+        j_in = fhst[:, 1].astype(int) - 1
+        khst[i_in, j_in] = fhst[:, 2]
         khst *= self.rho * self.g
 
         return khst
@@ -405,15 +397,8 @@ class WamitReader:
         assert isinstance(ffpt_full, list)
 
         ffpt = ffpt_full[1:]
-        fpt = []
-        for line in ffpt:
-            linep = (
-                line.split()
-            )  # split characters into a list where sep is whitespace
-            fpt.append(
-                np.asarray(linep, "f")
-            )  # [linep[0],linep[1],linep[2]),linep[3]])
-        fpt = np.asarray(fpt)  # fpt= [ID, x(ID), y(ID), z(ID)]
+        # fpt= [ID, x(ID), y(ID), z(ID)]
+        fpt = f_util.read_table(ffpt).astype("f")
         r = np.sqrt(fpt[0, 1] ** 2 + fpt[0, 2] ** 2)  # radius of the cylinder
         x = fpt[fpt[:, 3] == fpt[0, 3], 1]
         y = fpt[fpt[:, 3] == fpt[0, 3], 2]
@@ -73,6 +73,30 @@ def test_checkMinDist(test_coords, expected):
     assert arr.minDist_constraint == expected
 
 
+def test_checkMinDist_grid():
+    lease = np.array([[-100, -100], [100, -100], [100, 100], [-100, 100]], "f")
+
+    arr = Array_pkg(
+        lease,
+        lease * 1.05,
+        (10, 10),
+        45.0 / 180 * np.pi,
+        Polygon(lease * 0.2),
+        True,
+    )
+
+    x, y = np.meshgrid(np.arange(10) * 12.0, np.arange(10) * 15.0)
+    coords = np.column_stack([x.ravel(), y.ravel()])
+    coords[-1] = [coords[-2, 0] + 5.0, coords[-2, 1]]
+
+    arr.coord = coords
+    arr.checkMinDist()
+
+    assert arr.minDist_constraint
+    assert np.isclose(arr._actual_mindist, 5.0)
+    assert np.isclose(arr._mindist_percent_max, 0.5)
+
+
 def test_checkMinDist_error():
     lease = np.array([[-100, -100], [100, -100], [100, 100], [-100, 100]], "f")
 
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2025 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+.. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
+"""
+
+import numpy as np
+import pytest
+from shapely.geometry import Point, Polygon
+
+from dtocean_hydro.utils.geometry import points_intersect, points_intersect_any
+
+
+@pytest.fixture
+def points():
+    x, y = np.meshgrid(np.linspace(-1, 11, 25), np.linspace(-1, 11, 25))
+    return np.column_stack([x.ravel(), y.ravel()])
+
+
+def test_points_intersect(points):
+    poly = Polygon([(0, 0), (10, 0), (10, 5), (5, 10), (0, 10)])
+
+    expected = [Point(x, y).intersects(poly) for x, y in points]
+    result = points_intersect(poly, points)
+
+    assert (result == expected).all()
+
+
+def test_points_intersect_none(points):
+    result = points_intersect(None, points)
+
+    assert result.shape == (len(points),)
+    assert not result.any()
+
+
+def test_points_intersect_empty():
+    poly = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)])
+    result = points_intersect(poly, np.array([]))
+
+    assert result.shape == (0,)
+
+
+def test_points_intersect_any(points):
+    polys = [
+        Polygon([(0, 0), (4, 0), (4, 4), (0, 4)]),
+        Polygon([(3, 3), (8, 3), (8, 8), (3, 8)]),
+    ]
+
+    expected = [
+        any(Point(x, y).intersects(poly) for poly in polys) for x, y in points
+    ]
+    result = points_intersect_any(polys, points)
+
+    assert (result == expected).all()
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2025 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+.. moduleauthor:: Mathew Topper <damm_horse@yahoo.co.uk>
+"""
+
+import logging
+import pickle
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import Polygon
+
+from dtocean_hydro.utils.layout_cache import (
+    LayoutCache,
+    get_folder_stamp,
+    get_hydro_key,
+)
+
+
+@pytest.fixture
+def coords():
+    return np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 20.0]])
+
+
+def test_LayoutCache_bad_maxsize():
+    with pytest.raises(ValueError) as excinfo:
+        LayoutCache(0)
+
+    assert "must be greater than zero" in str(excinfo)
+
+
+def test_LayoutCache_get_miss(coords):
+    cache = LayoutCache()
+
+    assert cache.get(coords) is None
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+
+def test_LayoutCache_get_hit(coords):
+    cache = LayoutCache()
+    cache.put(coords, 1e6, 0.9)
+
+    # Device order and small perturbations do not change the layout
+    test = cache.get(coords[::-1] + 1e-4)
+
+    assert test == (1e6, 0.9)
+    assert cache.hits == 1
+    assert cache.misses == 0
+
+
+def test_LayoutCache_eviction(coords):
+    cache = LayoutCache(2)
+    cache.put(coords, 1.0, 1.0)
+    cache.put(coords + 1, 2.0, 1.0)
+
+    # Make the first layout the most recently used
+    assert cache.get(coords) is not None
+
+    cache.put(coords + 2, 3.0, 1.0)
+
+    assert len(cache) == 2
+    assert cache.get(coords) is not None
+    assert cache.get(coords + 1) is None
+    assert cache.get(coords + 2) is not None
+
+
+def test_LayoutCache_save_no_path():
+    cache = LayoutCache()
+
+    with pytest.raises(RuntimeError) as excinfo:
+        cache.save()
+
+    assert "No cache file path provided" in str(excinfo)
+
+
+def test_LayoutCache_persist(tmp_path, coords):
+    path = str(tmp_path / "cache.npz")
+
+    cache = LayoutCache(hydro_key="mock", path=path)
+    cache.put(coords, 1e6, 0.9)
+    cache.save()
+
+    test = LayoutCache(hydro_key="mock", path=path)
+    other = LayoutCache(hydro_key="other", path=path)
+
+    assert test.get(coords) == (1e6, 0.9)
+    assert other.get(coords) is None
+    assert len(test) == 1
+
+
+def test_LayoutCache_persist_no_hydro_key(tmp_path, coords):
+    path = str(tmp_path / "cache.npz")
+
+    cache = LayoutCache(path=path)
+    cache.put(coords, 1e6, 0.9)
+    cache.put(coords[:2], 2e6, 0.8)
+    cache.save()
+
+    test = LayoutCache(path=path)
+
+    assert test.get(coords[:2]) == (2e6, 0.8)
+    assert test.get(coords) == (1e6, 0.9)
+
+
+def test_LayoutCache_load_bad_file(caplog, tmp_path, coords):
+    path = tmp_path / "cache.npz"
+
+    with open(path, "wb") as f:
+        pickle.dump({"mock": 1}, f)
+
+    with caplog.at_level(logging.WARNING):
+        test = LayoutCache(path=str(path))
+
+    assert len(test) == 0
+    assert "Could not load layout cache file" in caplog.text
+
+
+def test_LayoutCache_get_key(coords):
+    cache = LayoutCache()
+
+    assert cache.get_key(coords) == cache.get_key(coords[::-1] + 0.001)
+    assert cache.get_key(coords) != cache.get_key(coords + 1)
+
+
+@pytest.fixture
+def hydro_inputs():
+    machine = SimpleNamespace(
+        Type="Tidal",
+        MinDist=(20.0, 20.0),
+        UserArray={"Option": 1, "Value": "rectangular"},
+        power_curve=pd.DataFrame({"speed": [1.0, 2.0], "power": [0.1, 0.5]}),
+    )
+    site = SimpleNamespace(
+        LeaseArea=np.array([[0.0, 0.0], [100.0, 0.0], [100.0, 50.0]]),
+        NogoAreas=[Polygon([(10, 10), (20, 10), (20, 20)])],
+        Beta=None,
+    )
+
+    return machine, site
+
+
+def test_get_hydro_key(hydro_inputs):
+    machine, site = hydro_inputs
+    expected = get_hydro_key(machine, site)
+
+    # Attribute order and pickling do not change the key
+    reordered = SimpleNamespace(**dict(reversed(vars(site).items())))
+    machine_copy = pickle.loads(pickle.dumps(machine))
+
+    assert get_hydro_key(machine_copy, reordered) == expected
+
+    site.Beta = 0.4
+
+    assert get_hydro_key(machine, site) != expected
+
+
+def test_get_hydro_key_array_change(hydro_inputs):
+    machine, site = hydro_inputs
+    expected = get_hydro_key(machine, site)
+
+    site.LeaseArea[1, 0] = 101.0
+
+    assert get_hydro_key(machine, site) != expected
+
+
+def test_get_folder_stamp(tmp_path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.txt").write_text("bb")
+
+    test = get_folder_stamp(str(tmp_path))
+
+    assert [(name, size) for name, size, _ in test] == [
+        ("a.txt", 1),
+        ("sub/b.txt", 2),
+    ]
+    assert get_folder_stamp(str(tmp_path / "missing")) is None
+    assert get_folder_stamp(None) is None
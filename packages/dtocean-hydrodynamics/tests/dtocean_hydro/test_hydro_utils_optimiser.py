@@ -25,6 +25,7 @@ import pytest
 
 from dtocean_hydro.input import WP2_MachineData, WP2_SiteData, WP2input
 from dtocean_hydro.main import WP2
+from dtocean_hydro.utils.layout_cache import LayoutCache
 
 
 @pytest.fixture
@@ -48,3 +49,85 @@ def test_SearchOptimum_estimate_start_point(searchoptimum):
     test = searchoptimum.estimate_start_point()
     assert len(test) == 2
     assert len(test[0]) == 2
+
+
+def test_SearchOptimum_n_workers_bad(searchoptimum):
+    with pytest.raises(ValueError) as excinfo:
+        type(searchoptimum)(
+            searchoptimum._optim_func,
+            searchoptimum._hyd_obj,
+            searchoptimum._array,
+            searchoptimum._Val,
+            searchoptimum._Opt,
+            searchoptimum._max_num_dev,
+            searchoptimum._min_q_factor,
+            searchoptimum.nogo_areas,
+            n_workers=0,
+        )
+
+    assert "must be greater than zero" in str(excinfo)
+
+
+def test_SearchOptimum_optimCostFunNormBatch_parallel(
+    tidalsite, tidal, tidal_kwargs
+):
+    tidal = deepcopy(tidal)
+    tidal[-3]["Option"] = 1
+    tidal[-3]["Value"] = "rectangular"
+
+    site = WP2_SiteData(*tidalsite)
+    machine = WP2_MachineData(*tidal, **tidal_kwargs)
+
+    data = WP2input(machine, site)
+    wp2 = WP2(data, n_search_workers=2)
+    hyd_obj = wp2._get_hyd_obj()
+    serial = wp2._get_optim_obj(hyd_obj)
+    searcher = wp2._get_optim_obj(hyd_obj)
+
+    # Includes a layout within the cache resolution of the first
+    xs = [(5.0, 5.0), (10.0, 2.0), (5.0, 5.0 + 1e-9), (2.0, 10.0)]
+    expected = serial.optimCostFunNormBatch(xs)
+
+    with searcher.evaluation_pool():
+        assert searcher._pool is not None
+        test = searcher.optimCostFunNormBatch(xs)
+
+    assert searcher._pool is None
+    assert test == expected
+
+    assert serial._cache is not None
+    assert searcher._cache is not None
+    assert serial._cache.hits > 0
+    assert searcher._cache.hits == serial._cache.hits
+    assert searcher._cache.misses == serial._cache.misses
+
+
+def test_SearchOptimum_cache_parallel(tmp_path, tidalsite, tidal, tidal_kwargs):
+    tidal = deepcopy(tidal)
+    tidal[-3]["Option"] = 1
+    tidal[-3]["Value"] = "rectangular"
+
+    site = WP2_SiteData(*tidalsite)
+    machine = WP2_MachineData(*tidal, **tidal_kwargs)
+    cache_path = str(tmp_path / "cache.npz")
+
+    data = WP2input(machine, site)
+    wp2 = WP2(data, n_search_workers=2, layout_cache_path=cache_path)
+    hyd_obj = wp2._get_hyd_obj()
+    searcher = wp2._get_optim_obj(hyd_obj)
+
+    xs = [(5.0, 5.0), (10.0, 2.0), (5.0, 5.0)]
+
+    with searcher.evaluation_pool():
+        searcher.optimCostFunNormBatch(xs)
+
+    assert searcher._cache is not None
+    assert searcher._cache.hits + searcher._cache.misses > 0
+    assert len(searcher._cache) > 0
+
+    searcher._cache.save()
+
+    test = LayoutCache(hydro_key=searcher._cache.hydro_key, path=cache_path)
+
+    assert searcher._cache.hydro_key is not None
+    assert len(test) == len(searcher._cache)
@@ -112,6 +112,21 @@ def test_PositionCounter_get_cost():
     assert not counter.get_cost(mock)
 
 
+def test_PositionCounter_get_cost_indexed(mocker):
+    counter = PositionCounter()
+    get_cost = mocker.spy(counter, "_get_cost")
+
+    for i in range(100):
+        evaluation = counter.next_evaluation()
+        position = [float(i)] * 7
+        counter.set_params(
+            evaluation, "mock", "mock", 1.0, "Success", *position, 1
+        )
+
+    assert not counter.get_cost(*[1.0] * 7)
+    assert get_cost.call_count == 0
+
+
 def test_PositionEvaluator_init_bad_objective(
     mocker, lease_polygon, layer_depths
 ):
@@ -124,6 +139,11 @@ def test_PositionEvaluator_init_bad_objective(
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     mock_core = mocker.MagicMock()
 
@@ -150,6 +170,11 @@ def evaluator(mocker, lease_polygon, layer_depths):
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     mock_core = mocker.MagicMock()
 
@@ -257,6 +282,41 @@ def test_PositionEvaluator_get_worker_results_not_number(
     assert "cost is not a number" in caplog.text
 
 
+def test_PositionEvaluator_get_pool_initializer(evaluator):
+    initializer, initargs = evaluator._get_pool_initializer("mock.dtop")
+
+    assert initializer.__name__ == "init_worker"
+    assert initargs == ("mock.dtop",)
+
+
+def test_PositionEvaluator_get_pool_task(evaluator):
+    worker_project_path = os.path.join("mock", "mock_1.dtop")
+    n_evals = 2
+    args = ["mock"] * 6 + [1]
+
+    task, task_args = evaluator._get_pool_task(
+        worker_project_path, n_evals, *args
+    )
+
+    assert task.__name__ == "main_worker"
+    assert task_args == (os.path.join("mock", "mock_1"),) + ("mock",) * 6 + (
+        1,
+        2,
+    )
+
+
+def test_PositionEvaluator_get_pool_results(evaluator):
+    worker_output = {"status": "Success", "results": {"mock": 1}}
+    results = evaluator._get_pool_results(1, worker_output)
+
+    assert results == {
+        "status": "Success",
+        "worker_results_path": os.path.join("mock", "mock_1.yaml"),
+        "cost": 1,
+        "results": {"mock": 1},
+    }
+
+
 def test_PositionEvaluator_set_counter_params_no_results(evaluator):
     evaluation = 1
     worker_project_path = "mock"
@@ -441,6 +501,43 @@ def test_PositionEvaluator_pre_constraints_hook_spacing_true(
     assert expected in line
 
 
+@pytest.mark.parametrize("spacing_radius, expected", [(5, False), (50, True)])
+def test_PositionEvaluator_pre_constraints_hook_spacing_radius(
+    mocker, tmpdir, evaluator, spacing_radius, expected
+):
+    evaluator._violation_log_path = os.path.join(str(tmpdir), "violations.txt")
+    evaluator._spacing_radius = spacing_radius
+
+    mocker.patch.object(
+        evaluator._tool_man,
+        "execute_tool",
+        side_effect=RuntimeError(
+            "Violation of the minimum distance constraint"
+        ),
+        autospec=True,
+    )
+
+    grid_orientation = 0
+    delta_row = 10
+    delta_col = 20
+    n_nodes = 5
+    t1 = 0.5
+    t2 = 0.5
+    dev_per_string = 5
+
+    args = (
+        grid_orientation,
+        delta_row,
+        delta_col,
+        n_nodes,
+        t1,
+        t2,
+        dev_per_string,
+    )
+
+    assert evaluator.pre_constraints_hook(*args) is expected
+
+
 def test_PositionEvaluator_pre_constraints_hook_spacing_error(
     mocker, tmpdir, evaluator
 ):
@@ -490,6 +587,15 @@ def test_PositionEvaluator_cleanup_hook(tmpdir, evaluator):
     assert not tmpdir.listdir()
 
 
+def test_PositionEvaluator_cleanup_hook_pool(tmpdir, evaluator):
+    evaluator._n_workers = 1
+    p = tmpdir.join("mock.txt")
+
+    evaluator._cleanup_hook(str(p), None, None)
+
+    assert not tmpdir.listdir()
+
+
 def test_get_range_fixed():
     a = 1
     b = 2
@@ -635,6 +741,11 @@ def test_PositionOptimiser_start(
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     mock_simulation = mocker.MagicMock()
     mock_simulation.get_output_ids.return_value = [mock_var]
@@ -750,6 +861,11 @@ def test_PositionOptimiser_start_more(
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     mock_var = "mock"
 
@@ -1006,6 +1122,11 @@ def test_PositionOptimiser_restart(mocker, tmpdir, lease_polygon, layer_depths):
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     counter_dict = {0: "mock", 1: "mock", 2: "mock", 3: "mock", 4: "mock"}
 
@@ -1126,6 +1247,11 @@ def test_PositionOptimiser_restart_more(
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     popsize = 8
     mock_es = mocker.MagicMock()
@@ -1290,6 +1416,11 @@ def test_PositionOptimiser_next_dump(
         return_value=positioner,
         autospec=True,
     )
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.get_spacing_radius",
+        return_value=None,
+        autospec=True,
+    )
 
     mock_var = "mock"
 
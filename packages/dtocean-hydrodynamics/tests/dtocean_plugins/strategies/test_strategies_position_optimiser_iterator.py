@@ -21,13 +21,16 @@ from dtocean_plugins.strategies.basic import BasicStrategy
 dtocean_hydro = pytest.importorskip("dtocean_hydro")
 
 if dtocean_hydro:
+    from dtocean_plugins.strategies.position_optimiser import iterator
     from dtocean_plugins.strategies.position_optimiser.iterator import (  # pylint: disable=no-name-in-module
         _get_basic_strategy,
         _get_branch,
         get_positioner,
+        init_worker,
         interface,
         iterate,
         main,
+        main_worker,
         prepare,
         write_result_file,
     )
@@ -432,6 +435,116 @@ def test_main_exception(mocker):
     assert str(write_result_file_args[5]) == "mock"
 
 
+def test_init_worker(mocker):
+    project = mocker.MagicMock()
+
+    core = mocker.MagicMock()
+    core.load_project.return_value = project
+
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.iterator.Core",
+        return_value=core,
+        autospec=True,
+    )
+
+    get_positioner = mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.iterator.get_positioner",
+        autospec=True,
+    )
+
+    mocker.patch.object(iterator, "_worker_core", None)
+    mocker.patch.object(iterator, "_worker_project", None)
+    mocker.patch.object(iterator, "_worker_positioner", None)
+
+    init_worker("mock.dtop")
+
+    core.load_project.assert_called_once_with("mock.dtop")
+    assert iterator._worker_core is core
+    assert iterator._worker_project is project
+    assert iterator._worker_positioner is get_positioner.return_value
+
+
+def test_main_worker(mocker):
+    project = mocker.MagicMock()
+    core = mocker.MagicMock()
+
+    mocker.patch.object(iterator, "_worker_core", core)
+    mocker.patch.object(iterator, "_worker_project", project)
+    mocker.patch.object(iterator, "_worker_positioner", "mock")
+
+    iterate = mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.iterator.iterate",
+        autospec=True,
+    )
+
+    write_result_file = mocker.patch(
+        "dtocean_plugins.strategies."
+        "position_optimiser.iterator."
+        "write_result_file",
+        return_value={"status": "Success"},
+        autospec=True,
+    )
+
+    result = main_worker("mock", 0, 10, 20, 5, 0.5, 0.5, 5, 2)
+
+    iterate_args = iterate.call_args.args
+    write_result_file_args = write_result_file.call_args.args
+
+    assert result == {"status": "Success"}
+    assert project.to_project.called
+    assert iterate_args[1] is project.to_project.return_value
+    assert iterate_args[2] == "mock"
+    assert iterate_args[3:] == (0.0, 10.0, 20.0, 5, 0.5, 0.5, 5, 2)
+    assert not core.load_project.called
+    assert not core.dump_project.called
+    assert write_result_file_args[2] == "mock"
+    assert write_result_file_args[4] == "Success"
+
+
+def test_main_worker_exception(mocker):
+    mocker.patch.object(iterator, "_worker_core", mocker.MagicMock())
+    mocker.patch.object(iterator, "_worker_project", mocker.MagicMock())
+    mocker.patch.object(iterator, "_worker_positioner", "mock")
+
+    mocker.patch(
+        "dtocean_plugins.strategies.position_optimiser.iterator.iterate",
+        side_effect=RuntimeError("mock"),
+        autospec=True,
+    )
+
+    write_result_file = mocker.patch(
+        "dtocean_plugins.strategies."
+        "position_optimiser.iterator."
+        "write_result_file",
+        autospec=True,
+    )
+
+    main_worker("mock", 0, 10, 20, 5, 0.5, 0.5)
+
+    write_result_file_args = write_result_file.call_args.args
+
+    assert write_result_file_args[3] == {
+        "theta": 0.0,
+        "dr": 10.0,
+        "dc": 20.0,
+        "n_nodes": 5,
+        "t1": 0.5,
+        "t2": 0.5,
+    }
+    assert write_result_file_args[4] == "Exception"
+    assert str(write_result_file_args[5]) == "mock"
+
+
+def test_main_worker_not_initialised(mocker):
+    mocker.patch.object(iterator, "_worker_core", None)
+    mocker.patch.object(iterator, "_worker_project", None)
+
+    with pytest.raises(RuntimeError) as excinfo:
+        main_worker("mock", 0, 10, 20, 5, 0.5, 0.5)
+
+    assert "not initialised" in str(excinfo)
+
+
 def test_interface(mocker):
     prj_file_path = "mock.prj"
     grid_orientation = 0
@@ -23,9 +23,10 @@ Created on Wed Sep 26 13:17:52 2018
 
 import numpy as np
 import pytest
+from scipy.interpolate import RectBivariateSpline
 
 from dtocean_tidal.main import Hydro
-from dtocean_tidal.modules.streamline import Streamlines
+from dtocean_tidal.modules.streamline import Streamlines, _StreamlineHistory
 
 YMAX = 350.0
 BATHYGLOB = -31.5
@@ -107,25 +108,50 @@ def test_Streamlines_plot(mocker, data):
     assert show_patch.called
 
 
-def test_Streamlines_detect_loop(mocker, data):
-    positions = np.array([[420.0, 175.0, 20.0], [514.5, 233.33333333, 20.0]])
+def _trace_history(points, window):
+    history = _StreamlineHistory(1, (10, 10), (1, 1), window)
+    idx = np.array([0])
 
-    SLs = Streamlines(data, positions, 2)
+    for x, y in points:
+        cells = (np.array([int(y)]), np.array([int(x)]))
+        history.append(idx, np.array([x]), np.array([y]), cells)
+        history.detect_loops(idx, cells, 0.9)
 
-    x = y = [0, 0]
+    return history
 
-    assert SLs._detectLoop(x, y)
 
+@pytest.mark.parametrize("window", [2, 8])
+def test_StreamlineHistory_detect_loop(window):
+    points = [
+        (0.5, 0.5),
+        (1.5, 0.5),
+        (2.5, 0.5),
+        (2.5, 1.5),
+        (1.5, 1.5),
+        (0.5, 1.5),
+        (0.5, 0.6),
+    ]
 
-def test_Streamlines_dont_detect_loop(mocker, data):
-    positions = np.array([[420.0, 175.0, 20.0], [514.5, 233.33333333, 20.0]])
+    history = _trace_history(points, window)
 
-    SLs = Streamlines(data, positions, 2)
+    assert history.looped[0]
 
-    x = [0, 0]
-    y = [0, 20]
 
-    assert not SLs._detectLoop(x, y)
+@pytest.mark.parametrize("window", [2, 8])
+def test_StreamlineHistory_dont_detect_loop(window):
+    points = [
+        (0.5, 0.5),
+        (1.5, 0.5),
+        (2.5, 0.5),
+        (2.5, 1.5),
+        (1.5, 1.5),
+        (0.5, 1.5),
+        (0.5, 2.5),
+    ]
+
+    history = _trace_history(points, window)
+
+    assert not history.looped[0]
 
 
 def test_Streamlines_makeStreamline(mocker, data):
@@ -137,3 +163,96 @@ def test_Streamlines_makeStreamline(mocker, data):
 
     assert sx[-1] > sx[0]
     assert np.isclose(sy, 175).all()
+
+
+@pytest.mark.parametrize(
+    "flow, positions, expected",
+    [
+        (
+            "meander",
+            [[100.0, 175.0, 20.0], [300.0, 100.0, 20.0]],
+            [
+                (
+                    314,
+                    [100.0, 471.273796, 840.472287],
+                    [175.0, 190.143326, 176.993701],
+                ),
+                (
+                    230,
+                    [300.0, 571.08522, 842.08765],
+                    [100.0, 114.044073, 134.952175],
+                ),
+            ],
+        ),
+        (
+            "node",
+            [[300.0, 175.0, 20.0], [514.5, 233.33333333, 20.0]],
+            [
+                (43, [300.0, 352.5, 400.0], [175.0, 175.0, 175.0]),
+                (
+                    48,
+                    [514.5, 454.5, 402.0],
+                    [233.333333, 233.333333, 233.333333],
+                ),
+            ],
+        ),
+    ],
+)
+def test_Streamlines_makeStreamlines(data, flow, positions, expected):
+    x = data["X"]
+    y = data["Y"]
+    X, _ = np.meshgrid(x, y)
+
+    if flow == "meander":
+        U = np.ones(X.shape)
+        V = 0.5 * np.sin(X / 50.0)
+    else:
+        U = -(X - 400.0) / 100.0
+        V = np.zeros(X.shape)
+
+    data["U"] = U
+    data["V"] = V
+    data["interpU"] = RectBivariateSpline(x, y, U.T)
+    data["interpV"] = RectBivariateSpline(x, y, V.T)
+
+    SLs = Streamlines(data, np.array(positions), 2)
+
+    # Expected values are the first, middle and last points given by the
+    # original point-by-point implementation
+    for (sx, sy), (n_points, ex, ey) in zip(SLs.streamlines, expected):
+        assert len(sx) == n_points
+        assert np.allclose(np.take(sx, [0, n_points // 2, -1]), ex)
+        assert np.allclose(np.take(sy, [0, n_points // 2, -1]), ey)
+
+
+def test_Streamlines_maxlen(data):
+    positions = np.array([[420.0, 175.0, 20.0], [514.5, 233.33333333, 20.0]])
+
+    SLs = Streamlines(data, positions, 2, maxlen=50.0)
+
+    for sx, sy in SLs.streamlines:
+        length = np.hypot(np.diff(sx), np.diff(sy)).sum()
+        assert 50.0 - SLs.dr < length <= 50.0
+
+
+def test_Streamlines_node(data):
+    x = data["X"]
+    y = data["Y"]
+    X, _ = np.meshgrid(x, y)
+
+    # Flow converging on a line of velocity nodes
+    U = -(X - 400.0) / 100.0
+    V = np.zeros(X.shape)
+
+    data["U"] = U
+    data["V"] = V
+    data["interpU"] = RectBivariateSpline(x, y, U.T)
+    data["interpV"] = RectBivariateSpline(x, y, V.T)
+
+    positions = np.array([[300.0, 175.0, 20.0], [514.5, 233.33333333, 20.0]])
+
+    SLs = Streamlines(data, positions, 2)
+
+    for sx, sy in SLs.streamlines:
+        assert np.isclose(sx[-1], 400.0, atol=SLs.dr)
+        assert len(sx) < 200
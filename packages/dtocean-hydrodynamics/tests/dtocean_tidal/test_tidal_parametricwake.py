@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2026 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from dtocean_tidal.submodel.ParametricWake import (
+    Wake,
+    WakeDatabase,
+    reader,
+)
+from dtocean_tidal.utils.interpolation import interp_at_point
+
+
+@pytest.fixture
+def wake_database():
+    rng = np.random.default_rng(3)
+
+    cts = np.array([0.2, 0.5, 0.8])
+    tis = np.array([0.05, 0.1, 0.2, 0.3])
+    x = np.linspace(-2, 20, 12)
+    y = np.linspace(-3, 3, 7)
+
+    fields = rng.random((len(tis), len(cts), len(y), len(x), 3))
+    fields[0, 1, 3, 4, 0] = np.nan
+
+    return WakeDatabase(cts, tis, x, y, fields)
+
+
+@pytest.fixture
+def turb_params():
+    return {
+        "RY": 0.0,
+        "TIH": 0.1,
+        "Ct": [np.array([0.0, 5.0]), np.array([0.5, 0.5])],
+        "Diam": 1.0,
+        "cutIO": [0.5, 4.0],
+    }
+
+
+def test_WakeDatabase_bad_shape(wake_database):
+    with pytest.raises(ValueError) as excinfo:
+        WakeDatabase(
+            wake_database.cts,
+            wake_database.tis,
+            wake_database.x,
+            wake_database.y,
+            wake_database.fields[1:],
+        )
+
+    assert "Expected fields with shape" in str(excinfo.value)
+
+
+def test_WakeDatabase_save_load(tmp_path, wake_database):
+    fields_path = tmp_path / "fields.npy"
+    axes_path = tmp_path / "axes.npz"
+
+    wake_database.save(fields_path, axes_path)
+    test = WakeDatabase.load(fields_path, axes_path)
+
+    assert isinstance(test.fields, np.memmap)
+    assert np.array_equal(test.fields, wake_database.fields, equal_nan=True)
+    assert np.array_equal(test.cts, wake_database.cts)
+    assert np.array_equal(test.tis, wake_database.tis)
+    assert np.array_equal(test.x, wake_database.x)
+    assert np.array_equal(test.y, wake_database.y)
+    assert set(tmp_path.iterdir()) == {fields_path, axes_path}
+
+
+def test_WakeDatabase_to_dict(wake_database):
+    test = wake_database.to_dict()
+    umat = test["dfU"]["ti0.1"]["ct0.5"]
+
+    assert test["database"] is wake_database
+    assert umat.shape == (len(wake_database.x), len(wake_database.y))
+    assert np.shares_memory(umat, wake_database.fields)
+
+
+def test_read_database_cache(mocker, tmp_path, wake_database):
+    mocker.patch.object(reader, "initiate_reader")
+    mocker.patch.object(reader, "delete_reader")
+    create_database = mocker.patch.object(
+        reader, "create_database", return_value=wake_database
+    )
+
+    first = reader.read_database(tmp_path)
+    second = reader.read_database(tmp_path)
+
+    assert create_database.call_count == 1
+    assert (tmp_path / reader.CACHE_FIELDS_NAME).is_file()
+    assert isinstance(second["database"].fields, np.memmap)
+    assert np.array_equal(
+        first["database"].fields, second["database"].fields, equal_nan=True
+    )
+
+
+@pytest.mark.parametrize(
+    "file_name", [reader.CACHE_FIELDS_NAME, reader.CACHE_AXES_NAME]
+)
+def test_read_database_cache_truncated(
+    mocker,
+    tmp_path,
+    wake_database,
+    file_name,
+):
+    mocker.patch.object(reader, "initiate_reader")
+    mocker.patch.object(reader, "delete_reader")
+    create_database = mocker.patch.object(
+        reader, "create_database", return_value=wake_database
+    )
+
+    reader.read_database(tmp_path)
+
+    file_path = tmp_path / file_name
+    file_path.write_bytes(file_path.read_bytes()[:100])
+
+    test = reader.read_database(tmp_path)
+
+    assert create_database.call_count == 2
+    assert np.array_equal(
+        test["database"].fields, wake_database.fields, equal_nan=True
+    )
+
+    reader.read_database(tmp_path)
+
+    assert create_database.call_count == 2
+
+
+def test_read_database_no_cache(mocker, tmp_path, wake_database):
+    mocker.patch.object(reader, "initiate_reader")
+    mocker.patch.object(reader, "delete_reader")
+    mocker.patch.object(reader, "create_database", return_value=wake_database)
+
+    test = reader.read_database(tmp_path, use_cache=False)
+
+    assert test["database"] is wake_database
+    assert not (tmp_path / reader.CACHE_FIELDS_NAME).is_file()
+
+
+@pytest.mark.parametrize(
+    "x, y, ct, ti",
+    [
+        (5.1, 0.3, 0.35, 0.12),
+        (0.2, -1.1, 0.5, 0.1),
+        (13.0, 2.2, 0.79, 0.25),
+        (3.0, 0.0, 0.9, 0.4),
+        (3.0, 0.0, 0.1, 0.01),
+    ],
+)
+def test_Wake_read_at_point(wake_database, turb_params, x, y, ct, ti):
+    wake = Wake(wake_database.to_dict(), None, None, None, turb_params, 0.0)
+    test = wake.read_at_point(x, y, ct, ti)
+
+    # Reference calculation by triangular interpolation of whole fields
+    cts = wake_database.cts
+    tis = wake_database.tis
+
+    ctidx = np.clip(np.searchsorted(cts, ct), 1, len(cts) - 1)
+    tiidx = np.clip(np.searchsorted(tis, ti), 1, len(tis) - 1)
+
+    if not cts[0] <= ct <= cts[-1]:
+        idx = np.abs(cts - ct).argmin()
+        ctidx = idx if idx > 0 else len(cts)
+
+    if not tis[0] <= ti <= tis[-1]:
+        idx = np.abs(tis - ti).argmin()
+        tiidx = idx if idx > 0 else len(tis)
+
+    corners = [
+        (ctidx - 1, tiidx - 1),
+        (ctidx - 1, tiidx % len(tis)),
+        (ctidx % len(cts), tiidx - 1),
+        (ctidx % len(cts), tiidx % len(tis)),
+    ]
+    dist = [(ct - cts[c]) ** 2 + (ti - tis[t]) ** 2 for c, t in corners]
+    corners.pop(int(np.argmax(dist)))
+
+    a = [cts[c] for c, _ in corners]
+    b = [tis[t] for _, t in corners]
+
+    wght = np.ones(3)
+    wght[0] = (b[1] - b[2]) * (ct - a[2]) + (a[2] - a[1]) * (ti - b[2])
+    wght[1] = (b[2] - b[0]) * (ct - a[2]) + (a[0] - a[2]) * (ti - b[2])
+    wght[0] /= (b[1] - b[2]) * (a[0] - a[2]) + (a[2] - a[1]) * (b[0] - b[2])
+    wght[2] = 1.0 - wght[0] - wght[1]
+
+    expected = np.zeros(3)
+
+    for w, (c, t) in zip(wght, corners):
+        Q = [wake_database.fields[t, c, :, :, k] * w for k in range(3)]
+        expected += interp_at_point(x, y, wake_database.x, wake_database.y, Q)
+
+    assert np.allclose(test, expected)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2026 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from dtocean_tidal.submodel.ParametricWake import Wake, WakeDatabase
+from dtocean_tidal.submodel.WakeInteraction.solver import (
+    _get_wake_pairs,
+    _solve_flow,
+)
+
+
+@pytest.fixture
+def wakes():
+    rng = np.random.default_rng(4)
+
+    cts = np.array([0.2, 0.5, 0.8])
+    tis = np.array([0.05, 0.1, 0.2, 0.3])
+    x = np.linspace(-2, 20, 12)
+    y = np.linspace(-3, 3, 7)
+    fields = 0.5 + 0.5 * rng.random((len(tis), len(cts), len(y), len(x), 3))
+    database = WakeDatabase(cts, tis, x, y, fields).to_dict()
+
+    turb_params = {
+        "RY": 0.0,
+        "TIH": 0.1,
+        "Ct": [np.array([0.0, 5.0]), np.array([0.3, 0.7])],
+        "Diam": 1.0,
+        "cutIO": [0.5, 4.0],
+    }
+
+    return [
+        Wake(database, None, None, None, turb_params, 0.1) for _ in range(4)
+    ]
+
+
+@pytest.fixture
+def turb_distances():
+    return {
+        "turbine0": {1: np.array([4.0, 0.5]), 2: np.array([10.0, -1.0])},
+        "turbine1": {2: np.array([6.0, -1.5]), 3: np.array([25.0, 0.0])},
+        "turbine2": {3: np.array([3.0, 2.0])},
+        "turbine3": {},
+    }
+
+
+def test_get_wake_pairs(turb_distances):
+    wake_pairs = _get_wake_pairs(4, turb_distances)
+
+    assert len(wake_pairs) == 4
+    assert (wake_pairs[0][0] == [1, 2]).all()
+    assert np.allclose(wake_pairs[1][1], [[6.0, -1.5], [25.0, 0.0]])
+    assert wake_pairs[3][0].size == 0
+    assert wake_pairs[3][1].shape == (0, 2)
+
+
+def test_solve_flow(wakes, turb_distances):
+    velocity = np.array([[2.0, 1.9, 1.8, 1.7], [0.1, 0.0, -0.1, 0.2]])
+    TI = np.array([0.1, 0.12, 0.15, 0.2])
+    TKE = 1.5 * (TI * np.hypot(*velocity)) ** 2
+
+    wake_pairs = _get_wake_pairs(4, turb_distances)
+    new_vel, new_speed, new_TI, new_TKE, _ = _solve_flow(
+        4, wake_pairs, wakes, velocity, TI, TKE, velocity, TKE
+    )
+
+    # Reference calculation, one pair at a time
+    speed = np.hypot(*velocity)
+    wake_mat = np.repeat(speed[:, None], 4, axis=1)
+    tke_mat = np.full((4, 4), np.nan)
+
+    for i in range(4):
+        for j, distance in turb_distances["turbine{}".format(i)].items():
+            wake_mat[i, j], tke_mat[i, j] = wakes[i].get_velocity_TKE(
+                distance, velocity[:, i], TI[i]
+            )
+
+    coefficients = (wake_mat / speed[:, None]).min(axis=0)
+
+    assert np.allclose(new_vel, velocity * coefficients)
+    assert np.allclose(new_speed, speed * coefficients)
+    assert np.isfinite(new_TI).all()
+    assert np.isfinite(new_TKE).all()
+
+
+def test_solve_flow_previous(mocker, wakes, turb_distances):
+    velocity = np.array([[2.0, 1.9, 1.8, 1.7], [0.1, 0.0, -0.1, 0.2]])
+    TI = np.array([0.1, 0.12, 0.15, 0.2])
+    TKE = 1.5 * (TI * np.hypot(*velocity)) ** 2
+
+    wake_pairs = _get_wake_pairs(4, turb_distances)
+    expected = _solve_flow(
+        4, wake_pairs, wakes, velocity, TI, TKE, velocity, TKE
+    )
+
+    spies = [mocker.spy(wake, "get_velocity_TKE_batch") for wake in wakes]
+
+    # Change the inflow of turbine 1 only
+    velocity[0, 1] = 1.8
+    test = _solve_flow(
+        4,
+        wake_pairs,
+        wakes,
+        velocity,
+        TI,
+        TKE,
+        velocity,
+        TKE,
+        previous=expected[4],
+    )
+
+    assert [spy.call_count for spy in spies] == [0, 1, 0, 0]
+    assert np.allclose(test[4][2][[0, 2]], expected[4][2][[0, 2]])
+    assert not np.allclose(test[4][2][1], expected[4][2][1])
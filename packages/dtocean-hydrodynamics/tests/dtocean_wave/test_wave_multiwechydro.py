@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2025 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from dtocean_wave.MultiWEChydro import (
+    InteractionGMRES,
+    InteractionLU,
+    MultiBody,
+    RotatedTransferMatrix,
+    interaction_dot,
+)
+from dtocean_wave.utils.hdf5_interface import HDF5Store, save_dict_to_hdf5
+
+
+@pytest.fixture
+def interaction_system():
+    rng = np.random.default_rng(1)
+
+    nb = 3
+    n = 4
+
+    # transformation matrix with zero diagonal blocks
+    T = 0.1 * (
+        rng.standard_normal((nb * n, nb * n))
+        + 1j * rng.standard_normal((nb * n, nb * n))
+    )
+
+    for i in range(nb):
+        T[i * n : (i + 1) * n, i * n : (i + 1) * n] = 0
+
+    D = np.zeros((nb * n, nb * n), dtype=complex)
+    block = rng.standard_normal((n, n)) + 1j * rng.standard_normal((n, n))
+
+    for i in range(nb):
+        D[i * n : (i + 1) * n, i * n : (i + 1) * n] = block
+
+    X = rng.standard_normal((2, nb * n)) + 1j * rng.standard_normal((2, nb * n))
+
+    return T, D, X
+
+
+def test_MultiBody_bad_solver():
+    with pytest.raises(ValueError) as excinfo:
+        MultiBody(None, None, solver="bad")
+
+    assert "must be one of" in str(excinfo.value)
+
+
+def test_interaction_dot_direct(interaction_system):
+    T, D, X = interaction_system
+    M = np.linalg.inv(np.eye(len(T)) - np.dot(T, D))
+
+    test = interaction_dot(X, M)
+
+    assert np.allclose(test, np.dot(X, M))
+
+
+def test_InteractionLU(interaction_system):
+    T, D, X = interaction_system
+    A = np.eye(len(T)) - np.dot(T, D)
+    expected = np.dot(X, np.linalg.inv(A))
+
+    test = interaction_dot(X, InteractionLU(A))
+
+    assert np.allclose(test, expected)
+
+
+def test_InteractionGMRES(interaction_system):
+    T, D, X = interaction_system
+    A = np.eye(len(T)) - np.dot(T, D)
+    expected = np.dot(X, np.linalg.inv(A))
+
+    test = interaction_dot(X, InteractionGMRES(T, D, tol=1e-10))
+
+    assert np.allclose(test, expected)
+
+
+@pytest.fixture
+def multibody_data(mocker):
+    rng = np.random.default_rng(2)
+
+    n_freqs = 4
+    order = 2
+    dim = 2 * order + 1
+    dof = 2
+
+    period = np.linspace(4.0, 10.0, n_freqs)
+
+    ihydro = mocker.MagicMock()
+    ihydro.depth = 50.0
+    ihydro.period = period
+    ihydro.wnumber = 4 * np.pi**2 / 9.81 / period**2
+
+    iwec = mocker.MagicMock()
+    iwec.matrix_zoh_interp.return_value = (None, None, None, None)
+    iwec.period = period
+    iwec.depth = 50.0
+    iwec.order = np.array([order, order])
+    iwec.truncorder = np.array([[order, order], [order, 1]] * (n_freqs // 2))
+    iwec.Madd = rng.standard_normal((n_freqs, dof, dof))
+    iwec.Crad = rng.standard_normal((n_freqs, dof, dof))
+
+    def complex_normal(shape):
+        return 0.1 * (
+            rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+        )
+
+    D = complex_normal((n_freqs, dim, dim))
+    G = complex_normal((n_freqs, dim, dof))
+    AR = complex_normal((n_freqs, dof, dim))
+
+    coord = np.array([[0.0, 0.0], [50.0, 10.0], [20.0, 80.0]])
+    direction = np.array([0.0, np.pi / 4])
+
+    return ihydro, iwec, coord, direction, D, G, AR
+
+
+def test_MultiBody_bad_n_workers(mocker):
+    with pytest.raises(ValueError) as excinfo:
+        MultiBody(None, None, n_workers=0)
+
+    assert "greater than zero" in str(excinfo.value)
+
+
+def _solve_all_frequencies(body, iwec, direction, D, G, AR):
+    k0 = body.wnumber
+    cfreq = 2 * np.pi / body.period
+
+    (TS, TR, DS_array, DR_array, GS_array, GR_array, MS, MR) = body.Interaction(
+        k0, D, G, iwec.truncorder
+    )
+
+    body.Scattering(k0, direction, TS, DS_array, GS_array, MS, iwec.order[0])
+    body.Radiation(
+        k0,
+        cfreq,
+        TR,
+        DR_array,
+        GR_array,
+        MR,
+        AR,
+        iwec.Madd,
+        iwec.Crad,
+        iwec.order.max(),
+    )
+
+
+@pytest.mark.parametrize("n_workers", [None, 3])
+@pytest.mark.parametrize("solver", ["direct", "lu"])
+def test_MultiBody_Hydrodynamics_n_workers(multibody_data, solver, n_workers):
+    ihydro, iwec, coord, direction, D, G, AR = multibody_data
+
+    serial = MultiBody(ihydro, iwec, solver=solver)
+    serial.coord = coord
+    _solve_all_frequencies(serial, iwec, direction, D, G, AR)
+
+    parallel = MultiBody(ihydro, iwec, solver=solver, n_workers=n_workers)
+    parallel.coord = coord
+    parallel.Hydrodynamics(iwec, direction, D, G, AR)
+
+    assert np.allclose(parallel.Fex, serial.Fex)
+    assert np.allclose(parallel.Madd, serial.Madd)
+    assert np.allclose(parallel.Crad, serial.Crad)
+
+    for attr in ["aS", "AP", "aR", "AR"]:
+        for test, expected in zip(
+            getattr(parallel, attr), getattr(serial, attr)
+        ):
+            assert np.allclose(test, expected)
+
+
+def test_RotatedTransferMatrix():
+    rng = np.random.default_rng(3)
+    matrix = rng.random((4, 3, 2))
+    factor = np.exp(1j * np.arange(3))[:, np.newaxis]
+
+    test = RotatedTransferMatrix(matrix, factor)
+    expected = matrix * factor
+
+    assert test.shape == matrix.shape
+    assert len(test) == 4
+    assert np.allclose(test[1], expected[1])
+    assert np.allclose(test[1:3], expected[1:3])
+    assert np.allclose(np.asarray(test), expected)
+
+
+@pytest.mark.parametrize("n_workers", [None, 3])
+def test_MultiBody_Hydrodynamics_lazy(
+    mocker,
+    tmp_path,
+    multibody_data,
+    n_workers,
+):
+    ihydro, iwec, coord, direction, D, G, AR = multibody_data
+
+    filename = tmp_path / "wec_solution.h5"
+    save_dict_to_hdf5(
+        {"D": D, "G": G, "AR": AR},
+        filename,
+        compression="gzip",
+    )
+
+    order = iwec.order.max()
+    Nm = np.arange(-order, order + 1)
+    m, n = np.meshgrid(Nm, Nm, indexing="ij")
+    orient = np.pi / 3
+    d_factor = np.exp(-1j * (n - m) * orient)
+    g_factor = np.exp(1j * Nm * orient)[:, np.newaxis]
+    ar_factor = np.exp(1j * Nm * orient)
+
+    expected = MultiBody(ihydro, iwec)
+    expected.coord = coord
+    expected.Hydrodynamics(
+        iwec, direction, D * d_factor, G * g_factor, AR * ar_factor
+    )
+
+    # The matrices should only be read one frequency at a time
+    mocker.patch.object(
+        RotatedTransferMatrix,
+        "__array__",
+        side_effect=AssertionError("Matrix read whole"),
+    )
+
+    with HDF5Store(filename) as store:
+        test = MultiBody(ihydro, iwec, n_workers=n_workers)
+        test.coord = coord
+        test.Hydrodynamics(
+            iwec,
+            direction,
+            RotatedTransferMatrix(store.get_dataset("D"), d_factor),
+            RotatedTransferMatrix(store.get_dataset("G"), g_factor),
+            RotatedTransferMatrix(store.get_dataset("AR"), ar_factor),
+        )
+
+    assert np.allclose(test.Fex, expected.Fex)
+    assert np.allclose(test.Madd, expected.Madd)
+    assert np.allclose(test.Crad, expected.Crad)
@@ -1,6 +1,13 @@
+import gc
+import os
+import pickle
+
+import h5py
 import numpy as np
+import pytest
 
 from dtocean_wave.utils.hdf5_interface import (
+    HDF5Store,
     load_dict_from_hdf5,
     save_dict_to_hdf5,
 )
@@ -23,3 +30,118 @@ def test_save_load(tmp_path):
     assert np.all(dd["y"] == data["y"])
     assert np.all(dd["d"]["z"] == data["d"]["z"])
     assert dd["d"]["b"] == data["d"]["b"]
+
+
+@pytest.fixture
+def solution_data():
+    rng = np.random.default_rng(0)
+    tr_mat = rng.random((20, 15, 15)) + 1j * rng.random((20, 15, 15))
+
+    return {
+        "name": "solution",
+        "periods": np.linspace(2, 20, 20),
+        "tr_mat": tr_mat,
+        "d": {"z": np.ones((2, 3))},
+    }
+
+
+def test_save_compression(tmp_path, solution_data):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename, compression="gzip")
+
+    with h5py.File(filename, "r") as h5file:
+        assert h5file["tr_mat"].chunks == (1, 15, 15)
+        assert h5file["tr_mat"].compression == "gzip"
+        assert h5file["periods"].chunks is None
+        assert h5file["d/z"].chunks is None
+
+    dd = load_dict_from_hdf5(filename)
+
+    assert dd["name"] == solution_data["name"]
+    assert np.all(dd["tr_mat"] == solution_data["tr_mat"])
+    assert np.all(dd["d"]["z"] == solution_data["d"]["z"])
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_HDF5Store(tmp_path, solution_data, compression):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename, compression=compression)
+
+    with HDF5Store(filename) as store:
+        assert "tr_mat" in store
+        assert set(store.keys()) == {"name", "periods", "tr_mat", "d"}
+        assert store["name"] == solution_data["name"]
+        assert np.all(store["d"]["z"] == solution_data["d"]["z"])
+        assert np.all(store.read("tr_mat", 3) == solution_data["tr_mat"][3])
+
+    assert store._h5file is None
+
+
+def test_HDF5Store_get_dataset(tmp_path, solution_data):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename, compression="gzip")
+
+    store = HDF5Store(filename)
+    dataset = store.get_dataset("tr_mat")
+    expected = solution_data["tr_mat"]
+
+    assert dataset.shape == expected.shape
+    assert dataset.dtype == expected.dtype
+    assert dataset.ndim == 3
+    assert len(dataset) == 20
+    assert np.all(dataset[2] == expected[2])
+    assert np.all(dataset[2:4] == expected[2:4])
+    assert np.all(np.asarray(dataset) == expected)
+
+    with pytest.raises(KeyError):
+        store.get_dataset("d")
+
+    store.close()
+
+
+def test_HDF5Store_garbage_collected(tmp_path, solution_data):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename)
+
+    store = HDF5Store(filename)
+    dataset = store.get_dataset("tr_mat")
+    h5file = store._h5file
+    del store
+    gc.collect()
+
+    # The dataset keeps the store alive
+    assert h5file
+    assert np.all(dataset[1] == solution_data["tr_mat"][1])
+
+    del dataset
+    gc.collect()
+
+    assert not h5file
+
+
+def test_HDF5Store_pickle(tmp_path, solution_data):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename)
+
+    store = HDF5Store(filename)
+    dataset = store.get_dataset("tr_mat")
+    test = pickle.loads(pickle.dumps(dataset))
+
+    assert np.all(test[5] == solution_data["tr_mat"][5])
+
+    store.close()
+    test._store.close()
+
+
+def test_HDF5Store_modified(tmp_path, solution_data):
+    filename = tmp_path / "test.h5"
+    save_dict_to_hdf5(solution_data, filename)
+
+    store = HDF5Store(filename)
+    save_dict_to_hdf5({"x": np.arange(10)}, filename)
+    os.utime(filename, ns=(0, 0))
+
+    with pytest.raises(IOError) as excinfo:
+        store["periods"]
+
+    assert "has been modified" in str(excinfo.value)
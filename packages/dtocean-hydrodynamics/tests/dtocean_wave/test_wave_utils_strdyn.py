@@ -22,8 +22,13 @@ Created on Fri Jun 02 12:37:42 2017
 """
 
 import numpy as np
+import pytest
 
-from dtocean_wave.utils.StrDyn import EnergyProduction
+from dtocean_wave.utils.StrDyn import (
+    EnergyProduction,
+    EnergyProductionBatch,
+    PowerWeights,
+)
 
 
 def test_EnergyProduction():
@@ -67,3 +72,127 @@ def test_EnergyProduction():
     assert Pyr.shape == (1, 7, 4, 2)
     assert P_dev.shape == (1, 7, 4, 2)
     assert P_dev.sum() > Pyr.sum()
+
+
+@pytest.mark.parametrize("spreading", [0, 10])
+def test_EnergyProductionBatch(spreading):
+    rng = np.random.default_rng(0)
+
+    NBo = 3
+    ndof = 2
+    N = NBo * ndof
+    Nf = 20
+    B = np.array([0, 180.0]) / 180.0 * np.pi
+    Hs = np.array([0.5, 1, 1.5, 2.0])
+    Tp = np.array([3.5, 4.5, 5.5, 6.5, 7.5, 8.5, 9.5])
+    wdir = np.linspace(0, 360, 30, endpoint=False) / 180.0 * np.pi
+    wdir = np.concatenate([wdir, wdir + 0.05, wdir - 0.05])
+    period = np.linspace(2, 15, Nf)
+    ScatDiag = (np.ones((7, 4, 2)) / (7 * 4 * 2), ("Jonswap", 3.3, spreading))
+    M = np.eye(ndof) * 5
+    Madd = np.array([np.eye(N) + 0.01 * rng.random((N, N))] * Nf)
+    Crad = np.array([0.5 * np.eye(N) + 0.01 * rng.random((N, N))] * Nf)
+    Cpto = rng.random((7, 4, 2, ndof, ndof))
+    Cpto[:3] = Cpto[0]
+    Kmoor = np.zeros((7, 4, 2, ndof, ndof))
+    Khyd = np.eye(ndof) * 3
+    Fex = rng.random((Nf, 90, N)) + 1j * rng.random((Nf, 90, N))
+    Kfit = np.array([[[np.eye(ndof)] * 2] * 4] * 7)
+    Cfit = np.array([[[np.eye(ndof)] * 2] * 4] * 7)
+    RatedPower = 0.05
+
+    args = (
+        NBo,
+        B,
+        Hs,
+        Tp,
+        wdir,
+        period,
+        ScatDiag,
+        M,
+        Madd,
+        Cpto,
+        Crad,
+        Kmoor,
+        Khyd,
+        Fex,
+        Kfit,
+        Cfit,
+        RatedPower,
+    )
+
+    Pyr, P_dev = EnergyProduction(*args)
+    Pyr_batch, P_dev_batch = EnergyProductionBatch(*args)
+
+    assert np.allclose(Pyr_batch, Pyr)
+    assert np.allclose(P_dev_batch, P_dev)
+
+
+@pytest.mark.parametrize("spreading", [0, 10])
+def test_PowerWeights(spreading):
+    rng = np.random.default_rng(0)
+
+    ndof = 2
+    Nf = 20
+    B = np.array([0.0])
+    Hs = np.array([1.5])
+    Tp = np.array([6.5])
+    wdir = np.linspace(0, 360, 30, endpoint=False) / 180.0 * np.pi
+    wdir = np.concatenate([wdir, wdir + 0.05, wdir - 0.05])
+    period = np.linspace(2, 15, Nf)
+    ScatDiag = (np.ones((1, 1, 1)), ("Jonswap", 3.3, spreading))
+    M = np.eye(ndof) * 5
+    Madd = np.array([np.eye(ndof)] * Nf)
+    Crad = np.array([0.5 * np.eye(ndof)] * Nf)
+    Cpto = np.eye(ndof).reshape((1, 1, 1, ndof, ndof))
+    Kmoor = np.zeros((1, 1, 1, ndof, ndof))
+    Khyd = np.eye(ndof) * 3
+    Fex = rng.random((Nf, 90, ndof)) + 1j * rng.random((Nf, 90, ndof))
+    Kfit = np.zeros((1, 1, 1, ndof, ndof))
+    Cfit = np.zeros((1, 1, 1, ndof, ndof))
+
+    _, P_dev = EnergyProduction(
+        1,
+        B,
+        Hs,
+        Tp,
+        wdir,
+        period,
+        ScatDiag,
+        M,
+        Madd,
+        Cpto,
+        Crad,
+        Kmoor,
+        Khyd,
+        Fex,
+        Kfit,
+        Cfit,
+    )
+
+    i_dir, weights = PowerWeights(B[0], Hs[0], Tp[0], wdir, period, ScatDiag[1])
+
+    w = 2.0 * np.pi / period
+    H = (
+        -(w**2)[:, None, None] * (M + Madd)
+        + 1j * w[:, None, None] * (Crad + Cpto[0, 0, 0])
+        + Khyd
+    )
+    force = np.transpose(Fex[:, i_dir], axes=(0, 2, 1))
+    velo = np.linalg.solve(H, force) * (1j * w)[:, None, None]
+    powfun = 0.5 * (np.abs(velo) ** 2).sum(axis=1).T
+
+    assert weights.shape == (len(i_dir), Nf)
+    assert np.isclose((weights * powfun).sum(), P_dev[0, 0, 0, 0])
+
+
+def test_PowerWeights_missing_direction():
+    wdir = np.linspace(0, 360, 30, endpoint=False) / 180.0 * np.pi
+    period = np.linspace(2, 15, 20)
+
+    i_dir, weights = PowerWeights(
+        0.01, 1.5, 6.5, wdir, period, ("Jonswap", 3.3, 0)
+    )
+
+    assert i_dir is None
+    assert weights is None
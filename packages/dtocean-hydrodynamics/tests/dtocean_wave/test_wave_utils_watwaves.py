@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+#    Copyright (C) 2026 Mathew Topper
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy as np
+import pytest
+
+from dtocean_wave.utils.WatWaves import (
+    Dispersion_T,
+    Newton,
+    WNumber,
+)
+
+
+@pytest.mark.parametrize("depth", [5.0, 30.0, 500.0])
+def test_WNumber(depth):
+    periods = np.linspace(2.0, 20.0, 10)
+    expected = np.array(
+        [2 * np.pi / Newton(Dispersion_T, (p, depth))[0] for p in periods]
+    )
+
+    test = WNumber(periods, depth)
+
+    assert np.allclose(test, expected)
+
+
+def test_WNumber_scalar():
+    expected = 2 * np.pi / Newton(Dispersion_T, (8.0, 30.0))[0]
+    test = WNumber(8.0, 30.0)
+
+    assert isinstance(test, float)
+    assert np.isclose(test, expected)
+
+
+def test_WNumber_cached_copy():
+    periods = [4.0, 8.0]
+
+    first = WNumber(periods, 30.0)
+    first[:] = 0
+
+    second = WNumber(periods, 30.0)
+
+    assert (second > 0).all()
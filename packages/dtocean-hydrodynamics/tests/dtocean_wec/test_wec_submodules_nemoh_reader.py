@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+
+from dtocean_wec.submodule.nemoh_reader import NemohReader
+
+
+def _format_values(values):
+    return " ".join("{:.6E}".format(value) for value in values)
+
+
+def _write_lines(file_path, lines):
+    file_path.write_text("".join(line + "\n" for line in lines))
+
+
+@pytest.fixture
+def reader(tmp_path):
+    # Bypass reading the project inputs, as only the result files are tested
+    reader = object.__new__(NemohReader)
+    reader._path_prj_dyn_res = tmp_path
+    reader.g = 9.82
+
+    return reader
+
+
+@pytest.mark.parametrize(
+    "file_name, method",
+    [("CA.dat", "_NemohReader__read_ca"), ("CM.dat", "_NemohReader__read_cm")],
+)
+def test_NemohReader_read_radiation_coefficients(
+    tmp_path,
+    reader,
+    file_name,
+    method,
+):
+    rng = np.random.default_rng(0)
+    n_dof = 7
+    frequencies = np.array([0.1, 0.2])
+    coeffs = rng.random((len(frequencies), n_dof, n_dof))
+
+    # Rows of coefficients are split after the sixth value
+    lines = ["Nb de frequence :  {}".format(len(frequencies))]
+
+    for frequency, coeff in zip(frequencies, coeffs):
+        lines.append(_format_values([frequency]))
+
+        for row in coeff:
+            lines.append(_format_values(row[:6]))
+            lines.append(_format_values(row[6:]))
+
+    _write_lines(tmp_path / file_name, lines)
+    reader.loose_dof = n_dof
+
+    test_freq, test_coeffs = getattr(reader, method)()
+
+    assert test_freq.shape == (2, 1)
+    assert np.allclose(test_freq[:, 0], frequencies)
+    assert test_coeffs.shape == coeffs.shape
+    assert np.allclose(test_coeffs, coeffs, rtol=1e-6)
+
+
+def test_NemohReader_read_radiation_coefficients_truncated(tmp_path, reader):
+    lines = ["Nb de frequence :  1", _format_values([0.1]), "1.0 2.0"]
+
+    _write_lines(tmp_path / "CA.dat", lines)
+    reader.loose_dof = 2
+
+    with pytest.raises(ValueError):
+        reader._NemohReader__read_ca()
+
+
+def test_NemohReader_read_fex(tmp_path, reader):
+    rng = np.random.default_rng(1)
+    n_dof = 2
+    frequencies = np.array([0.5, 1.0, 1.5])
+    angles = np.array([0.0, 45.0])
+    magnitude = rng.random((len(frequencies), len(angles), n_dof))
+    phase = rng.uniform(-np.pi, np.pi, magnitude.shape)
+
+    lines = ['VARIABLES="w (rad/s)"']
+    lines += [
+        '"abs(F  1  {})" "angle(F  1  {})"'.format(i, i) for i in range(n_dof)
+    ]
+
+    for i_angle, angle in enumerate(angles):
+        lines.append(
+            'Zone t="Diffraction force - beta =    {:.4f} deg",F=POINT,'
+            "i=     {}".format(angle, len(frequencies))
+        )
+
+        for i_freq, frequency in enumerate(frequencies):
+            values = [frequency]
+
+            for dof in range(n_dof):
+                values.append(magnitude[i_freq, i_angle, dof])
+                values.append(phase[i_freq, i_angle, dof])
+
+            lines.append(_format_values(values))
+
+    _write_lines(tmp_path / "ExcitationForce.tec", lines)
+    reader.loose_dof = n_dof
+    reader.angle_def = [len(angles), angles[0], angles[-1]]
+    reader.frequency_def = [len(frequencies), frequencies[0], frequencies[-1]]
+
+    test_freq, test_angles, test_fex = reader._NemohReader__read_fex()
+    expected = np.conj(magnitude * np.exp(1j * phase))
+
+    assert np.allclose(test_freq[:, 0], frequencies)
+    assert np.allclose(test_angles[:, 0], angles)
+    assert test_fex.shape == expected.shape
+    assert np.allclose(test_fex, expected, rtol=1e-5)
+
+
+def test_NemohReader_read_cylsurface(tmp_path, reader):
+    rng = np.random.default_rng(2)
+    n_dof = 1
+    periods = np.array([5.0, 10.0])
+    directions = np.array([0.0])
+    n_theta = 3
+    n_zeta = 2
+    n_problems = len(periods) * (len(directions) + n_dof)
+
+    theta = np.linspace(0, 2 * np.pi, n_theta, endpoint=False)
+    zeta = np.array([-1.0, -2.0])
+    magnitude = rng.random((n_problems, n_zeta, n_theta))
+    phase = rng.uniform(-np.pi, np.pi, magnitude.shape)
+
+    # Points are ordered by zeta and then theta
+    for problem in range(n_problems):
+        lines = ["VARIABLES=", "Zone"]
+
+        for i_zeta, z in enumerate(zeta):
+            for i_theta, t in enumerate(theta):
+                values = [
+                    np.cos(t),
+                    np.sin(t),
+                    z,
+                    magnitude[problem, i_zeta, i_theta],
+                    phase[problem, i_zeta, i_theta],
+                ]
+                lines.append(_format_values(values))
+
+        file_name = "cylsurface.{:5d}.dat".format(problem + 1)
+        _write_lines(tmp_path / file_name, lines)
+
+    reader._NemohReader__get_array_mat = True
+    reader.loose_dof = n_dof
+    reader.periods = periods
+    reader.directions = directions
+    reader.cyl_radius = 1.0
+    reader.cyl_ntheta = n_theta
+    reader.cyl_nzeta = n_zeta
+
+    scattering, radiation, cyl_t, cyl_z = reader._NemohReader__read_cylsurface()
+
+    # For each period, the diffraction problems are followed by the
+    # radiation problems
+    pressure = (magnitude * np.exp(1j * phase)).reshape(
+        (len(periods), len(directions) + n_dof, n_zeta, n_theta)
+    )
+    cfreq = 2 * np.pi / periods[:, None, None, None]
+    expected_scattering = np.conj(
+        pressure[:, : len(directions)] * reader.g / 1j / cfreq
+    )
+    expected_radiation = np.conj(
+        pressure[:, len(directions) :] * reader.g / 1j / cfreq * -1j * cfreq
+    )
+
+    assert np.allclose(scattering, expected_scattering, rtol=1e-5)
+    assert np.allclose(radiation, expected_radiation, rtol=1e-5)
+    assert np.allclose(cyl_t, theta)
+    assert np.allclose(cyl_z, zeta)
@@ -0,0 +1,194 @@
+import time
+
+import numpy as np
+import pytest
+
+from dtocean_wec.submodule.power_matrix_fitting import PowerMatrixFit
+from dtocean_wec.submodule.utils.conversion_utils import set_wdirs_with_yaw
+
+
+@pytest.fixture
+def model():
+    rng = np.random.default_rng(0)
+
+    ndof = 3
+    n_periods = 15
+    order = np.array([2])
+    n_modes = 2 * order.max() + 1
+
+    periods = np.linspace(3, 15, n_periods)
+    directions = np.linspace(0, 2 * np.pi, 8, endpoint=False)
+    m_m = np.eye(ndof) * 2.0
+    m_add = np.eye(ndof) + 0.05 * rng.random((n_periods, ndof, ndof))
+    c_rad = 0.3 * np.eye(ndof) + 0.02 * rng.random((n_periods, ndof, ndof))
+    k_hst = np.eye(ndof) * 5.0
+    f_ex = rng.random((n_periods, 8, ndof)) + 1j * rng.random(
+        (n_periods, 8, ndof)
+    )
+    force_matrix = rng.random((n_periods, n_modes, ndof)) + 1j * rng.random(
+        (n_periods, n_modes, ndof)
+    )
+
+    return (
+        periods,
+        directions,
+        m_m,
+        m_add,
+        c_rad,
+        None,
+        k_hst,
+        None,
+        f_ex,
+        force_matrix,
+        [0, 2],
+        [1],
+        order,
+        "",
+    )
+
+
+@pytest.fixture
+def site_spec():
+    p = np.ones((3, 2, 1))
+
+    return {
+        "probability_of_occurence": p / p.sum(),
+        "spec_shape": "Jonswap",
+        "spec_gamma": 3.3,
+        "spec_spreading": 0.0,
+        "te": np.array([5.0, 6.0, 7.0]),
+        "hm0": np.array([1.0, 2.0]),
+        "wave_angles": np.array([0.0]),
+    }
+
+
+@pytest.fixture
+def machine_spec(model, site_spec):
+    machine_spec = {
+        "yaw": 0.0,
+        "c_pto": 1.0,
+        "k_mooring": 0.5,
+        "power_matrix": np.zeros((3, 2, 1)),
+    }
+
+    # Perturb the power matrix of the unfitted model
+    pfit = PowerMatrixFit(*model)
+    pfit.perf_fitting(dict(machine_spec), site_spec)
+
+    rng = np.random.default_rng(1)
+    scale = 0.9 + 0.1 * rng.random(pfit.wec_power_matrix.shape)
+    machine_spec["power_matrix"] = pfit.wec_power_matrix * scale
+
+    return machine_spec
+
+
+@pytest.fixture
+def fit_problem(model, machine_spec, site_spec):
+    pfit = PowerMatrixFit(*model)
+    pfit.perf_fitting(dict(machine_spec), site_spec)
+
+    wdirs_yaw = set_wdirs_with_yaw(
+        pfit.wave_dir.copy(), 0.0, pfit.wave_dir[0], 0.0
+    )
+    orient, thetas = wdirs_yaw[0], wdirs_yaw[1]
+
+    Nm = np.arange(-2, 3, dtype=float)
+    Gp = np.transpose(pfit.force_matrix, axes=(0, 2, 1))
+    f_ex = pfit._PowerMatrixFit__get_f_ex(orient, thetas, Gp, Nm)
+    problem = pfit._PowerMatrixFit__get_fit_problem(
+        (1, 0, 0), thetas, 3.0, f_ex
+    )
+
+    return pfit, problem, thetas, f_ex
+
+
+def test_PowerMatrixFit_n_workers_invalid(model):
+    with pytest.raises(ValueError):
+        PowerMatrixFit(*model, n_workers=0)
+
+
+@pytest.mark.parametrize(
+    "x", [np.zeros(6), np.array([0.2, -0.1, 0.5, 0.3, 0.0, -0.2])]
+)
+def test_SeaStateFit_power(fit_problem, x):
+    pfit, problem, thetas, f_ex = fit_problem
+
+    power, _ = problem.power(x)
+    expected = pfit._PowerMatrixFit__power_fit(x, (1, 0, 0), thetas, 0.0, f_ex)
+
+    assert np.isclose(power**2, expected)
+
+
+@pytest.mark.parametrize(
+    "x", [np.zeros(6), np.array([0.2, -0.1, 0.5, 0.3, 0.0, -0.2])]
+)
+def test_SeaStateFit_gradient(fit_problem, x):
+    _, problem, _, _ = fit_problem
+
+    objective, grad = problem(x)
+
+    eps = 1e-6
+    expected = np.array(
+        [
+            (problem(x + eps * e)[0] - problem(x - eps * e)[0]) / (2 * eps)
+            for e in np.eye(len(x))
+        ]
+    )
+
+    assert objective > 0
+    assert np.allclose(grad, expected, rtol=1e-5, atol=1e-10)
+
+
+def test_perf_fitting(model, machine_spec, site_spec):
+    pfit = PowerMatrixFit(*model)
+    pfit.perf_fitting(dict(machine_spec), site_spec)
+
+    assert np.allclose(
+        pfit.wec_power_matrix, machine_spec["power_matrix"], rtol=1e-3
+    )
+
+
+@pytest.mark.parametrize("warm_start", [True, False])
+def test_perf_fitting_n_workers(model, machine_spec, site_spec, warm_start):
+    serial = PowerMatrixFit(*model, warm_start=warm_start)
+    serial.perf_fitting(dict(machine_spec), site_spec)
+
+    parallel = PowerMatrixFit(*model, n_workers=2, warm_start=warm_start)
+    parallel.perf_fitting(dict(machine_spec), site_spec)
+
+    assert np.allclose(serial.c_fit, parallel.c_fit)
+    assert np.allclose(serial.k_fit, parallel.k_fit)
+    assert np.allclose(serial.wec_power_matrix, parallel.wec_power_matrix)
+
+
+def test_perf_fitting_n_workers_error(mocker, model, machine_spec, site_spec):
+    mocker.patch(
+        "dtocean_wec.submodule.power_matrix_fitting.optimize.fmin_l_bfgs_b",
+        side_effect=ValueError("fit failed"),
+    )
+
+    pfit = PowerMatrixFit(*model, n_workers=2)
+
+    with pytest.raises(ValueError, match="fit failed"):
+        pfit.perf_fitting(dict(machine_spec), site_spec)
+
+
+def test_perf_fitting_n_workers_timeout(
+    mocker,
+    model,
+    machine_spec,
+    site_spec,
+):
+    def slow_fit(*args, **kwargs):
+        time.sleep(1)
+        raise ValueError("fit too slow")
+
+    mocker.patch(
+        "dtocean_wec.submodule.power_matrix_fitting.optimize.fmin_l_bfgs_b",
+        side_effect=slow_fit,
+    )
+
+    pfit = PowerMatrixFit(*model, n_workers=2, worker_timeout=0.1)
+
+    with pytest.raises(RuntimeError, match="did not complete"):
+        pfit.perf_fitting(dict(machine_spec), site_spec)
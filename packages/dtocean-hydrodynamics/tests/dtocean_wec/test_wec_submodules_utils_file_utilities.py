@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from dtocean_wec.submodule.utils.file_utilities import read_blocks, read_table
+
+
+def test_read_table():
+    lines = [" 1 2 3.0\n", "\n", " 4 5 6.5E+00\n"]
+    result = read_table(lines, 3)
+
+    assert result.shape == (2, 3)
+    assert np.allclose(result, [[1, 2, 3], [4, 5, 6.5]])
+
+
+def test_read_table_infer_columns():
+    lines = [" 1 2 3 4\n", " 5 6 7 8\n"]
+    result = read_table(lines)
+
+    assert result.shape == (2, 4)
+
+
+@pytest.mark.parametrize("n_cols", [None, 3])
+def test_read_table_ragged(n_cols):
+    lines = [" 1 2 3\n", " 4 5\n"]
+
+    with pytest.raises(ValueError):
+        read_table(lines, n_cols)
+
+
+@pytest.mark.parametrize("lines", [[], ["\n", "  \n"]])
+def test_read_table_empty(lines):
+    with pytest.raises(ValueError, match="no lines"):
+        read_table(lines)
+
+
+def test_read_blocks():
+    lines = [
+        " 0.1\n",
+        " 1 2 3\n",
+        " 4\n",
+        " 0.2\n",
+        " 5 6 7\n",
+        " 8\n",
+        "trailing\n",
+    ]
+
+    headers, values = read_blocks(lines, 2, 2, 4)
+
+    assert headers == [" 0.1\n", " 0.2\n"]
+    assert values.shape == (2, 4)
+    assert np.allclose(values, [[1, 2, 3, 4], [5, 6, 7, 8]])
+
+
+def test_read_blocks_short():
+    lines = [" 0.1\n", " 1 2 3\n", " 4\n", " 0.2\n", " 5 6 7\n"]
+
+    with pytest.raises(ValueError):
+        read_blocks(lines, 2, 2, 4)
+
+
+def test_read_blocks_bad_count():
+    lines = [" 0.1\n", " 1 2 3\n", " 4\n", " 0.2\n", " 5 6\n", " 8\n"]
+
+    with pytest.raises(ValueError):
+        read_blocks(lines, 2, 2, 4)
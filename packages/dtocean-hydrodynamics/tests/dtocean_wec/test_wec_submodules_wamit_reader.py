@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+
+from dtocean_wec.submodule.wamit_reader import WamitReader
+
+
+def _format_values(values):
+    return " ".join("{:.6E}".format(value) for value in values)
+
+
+def _write_lines(file_path, lines):
+    file_path.write_text("".join(line + "\n" for line in lines))
+
+
+@pytest.fixture
+def reader(tmp_path):
+    # Bypass reading the project inputs, as only the result files are tested
+    reader = object.__new__(WamitReader)
+    reader.data_folder = str(tmp_path)
+    reader.debug = False
+    reader.rho = 1025.0
+    reader.g = 9.82
+    reader.periods = np.array([5.0, 10.0])
+    reader.directions = np.array([0.0, 90.0])
+    reader.n_dof = 2
+
+    return reader
+
+
+def test_WamitReader_read_1(tmp_path, reader):
+    rng = np.random.default_rng(0)
+    shape = (len(reader.periods), reader.n_dof, reader.n_dof)
+    m_add = rng.random(shape)
+    c_rad = rng.random(shape)
+
+    lines = ["header"]
+
+    for i_per, period in enumerate(reader.periods):
+        for i in range(reader.n_dof):
+            for j in range(reader.n_dof):
+                values = [m_add[i_per, i, j], c_rad[i_per, i, j]]
+                lines.append(
+                    "{:.6E} {} {} {}".format(
+                        period, i + 1, j + 1, _format_values(values)
+                    )
+                )
+
+    _write_lines(tmp_path / "test.1", lines)
+
+    test_m_add, test_c_rad = reader._WamitReader__read_1()
+    omega = 2 * np.pi / reader.periods[:, None, None]
+
+    assert np.allclose(test_m_add, reader.rho * m_add, rtol=1e-6)
+    assert np.allclose(test_c_rad, reader.rho * omega * c_rad, rtol=1e-6)
+
+
+def test_WamitReader_read_1_bad_dof(tmp_path, reader):
+    lines = ["header"] + ["5.0 1 1 1.0 1.0"] * len(reader.periods)
+
+    _write_lines(tmp_path / "test.1", lines)
+
+    with pytest.raises(IOError):
+        reader._WamitReader__read_1()
+
+
+def test_WamitReader_read_2(tmp_path, reader):
+    rng = np.random.default_rng(1)
+    shape = (len(reader.periods), len(reader.directions), reader.n_dof)
+    fex = rng.random(shape) + 1j * rng.random(shape)
+
+    lines = ["header"]
+
+    for i_per, period in enumerate(reader.periods):
+        for i_dir, direction in enumerate(reader.directions):
+            for i in range(reader.n_dof):
+                value = fex[i_per, i_dir, i]
+                values = [
+                    abs(value),
+                    np.angle(value, deg=True),
+                    value.real,
+                    value.imag,
+                ]
+                lines.append(
+                    "{:.6E} {:.6E} {} {}".format(
+                        period, direction, i + 1, _format_values(values)
+                    )
+                )
+
+    _write_lines(tmp_path / "test.2", lines)
+
+    test = reader._WamitReader__read_2()
+
+    assert np.allclose(test, reader.rho * reader.g * fex, rtol=1e-6)
+
+
+def test_WamitReader_read_2_bad_lines(tmp_path, reader):
+    lines = ["header", "5.0 0.0 1 1.0 0.0 1.0 0.0"]
+
+    _write_lines(tmp_path / "test.2", lines)
+
+    with pytest.raises(IOError):
+        reader._WamitReader__read_2()
+
+
+def test_WamitReader_read_hst(tmp_path, reader):
+    k_hst = np.array([[1.5, 0.0], [0.0, 2.5]])
+    lines = ["header"]
+
+    for i in range(reader.n_dof):
+        for j in range(reader.n_dof):
+            lines.append("{} {} {:.6E}".format(i + 1, j + 1, k_hst[i, j]))
+
+    _write_lines(tmp_path / "test.hst", lines)
+
+    test = reader._WamitReader__read_hst()
+
+    assert np.allclose(test, reader.rho * reader.g * k_hst)
+
+
+def test_WamitReader_read_mmx(tmp_path, reader):
+    rng = np.random.default_rng(2)
+    reader.n_dof = 6
+    reader._WamitReader__n_dof_gener = 0
+    m_m = rng.random((6, 6))
+
+    lines = ["header"] * 13
+
+    for i in range(6):
+        for j in range(6):
+            lines.append("{} {} {:.6E}".format(i + 1, j + 1, m_m[i, j]))
+
+    lines.append("trailing text")
+    _write_lines(tmp_path / "test.mmx", lines)
+
+    test = reader._WamitReader__read_mmx()
+
+    assert np.allclose(test, m_m, rtol=1e-6)
+
+
+def test_WamitReader_read_fpt(tmp_path, reader):
+    reader._WamitReader__get_array_mat = True
+    theta = np.pi * np.array([0.0, 0.5, 0.75, -0.5])
+    zeta = np.array([-1.0, -2.0, -3.0])
+    radius = 2.0
+
+    lines = ["header"]
+    point_id = 0
+
+    for z in zeta:
+        for t in theta:
+            point_id += 1
+            values = [radius * np.cos(t), radius * np.sin(t), z]
+            lines.append("{} {}".format(point_id, _format_values(values)))
+
+    _write_lines(tmp_path / "test.fpt", lines)
+
+    x, y, z, r, t = reader._WamitReader__read_fpt()
+
+    assert np.isclose(r, radius)
+    assert np.allclose(x, radius * np.cos(theta), atol=1e-6)
+    assert np.allclose(y, radius * np.sin(theta), atol=1e-6)
+    assert np.allclose(t, theta, atol=1e-6)
+    assert np.allclose(z, zeta)
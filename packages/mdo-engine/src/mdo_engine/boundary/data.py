@@ -119,6 +119,9 @@ class Structure(ABC):
         dt.tzinfo,
     ]
 
+    # File suffix of the optional binary serialization format
+    binary_suffix: str | None = None
+
     @property
     @abc.abstractmethod
     def version(self) -> int:
@@ -147,11 +150,43 @@ class Structure(ABC):
     def get_value(self, data):
         pass
 
-    def save_value(self, data: Any, root_path: PathOrStr) -> Path:
-        stub_path = Path(root_path)
-        file_path = stub_path.with_suffix(".json")
+    def can_save_binary(self, value: Any) -> bool:
+        """Returns True if the given value should be saved using the binary
+        format of the structure. Structures opt in to binary serialization
+        by setting binary_suffix and implementing toBinary and fromBinary"""
+        return self.binary_suffix is not None and value is not None
+
+    @staticmethod
+    def toBinary(value: Any, file_path: Path, version: int) -> None:
+        """Writes the given value and version number to a binary file"""
+        raise NotImplementedError
+
+    @staticmethod
+    def fromBinary(file_path: Path) -> Any:
+        """Reads structure compatible data from a binary file, using the
+        version number stored in the file"""
+        raise NotImplementedError
+
+    def save_value(
+        self,
+        data: Any,
+        root_path: PathOrStr,
+        binary: bool = False,
+    ) -> Path:
+        """Save the data to a file with the given root path and return the
+        file path. JSON is used unless binary is True and the structure can
+        save the value in its binary format"""
 
+        stub_path = Path(root_path)
         data_value = self.get_value(data)
+
+        if binary and self.can_save_binary(data_value):
+            assert self.binary_suffix is not None
+            file_path = stub_path.with_suffix(self.binary_suffix)
+            self.toBinary(data_value, file_path, self.version)
+            return file_path
+
+        file_path = stub_path.with_suffix(".json")
         data_string = self.toText(data_value)
         data_versioned = {"version": self.version, "data": data_string}
 
@@ -166,6 +201,17 @@ class Structure(ABC):
 
         return self.fromText(data_versioned["data"], data_versioned["version"])
 
+    def load_binary(self, file_path: PathOrStr):
+        file_path = Path(file_path)
+
+        if file_path.suffix != self.binary_suffix:
+            errStr = (
+                "Structure {} can not load binary file with suffix '{}'"
+            ).format(self.__class__.__name__, file_path.suffix)
+            raise ValueError(errStr)
+
+        return self.fromBinary(file_path)
+
     @classmethod
     def equals(cls, left, right):
         return left == right
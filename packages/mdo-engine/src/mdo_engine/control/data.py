@@ -3,10 +3,12 @@
 Control classes relating to Data entities
 """
 
+import hashlib
 import logging
 import os
 import traceback
-from copy import deepcopy
+import uuid
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -382,6 +384,8 @@ class DataStorage(Plugin):
         data_dir="data",
         root_dir=None,
         warn_save=True,
+        content_hash=False,
+        binary=False,
     ):
         for data_index in data_indexes:
             self._convert_data_to_box(
@@ -390,6 +394,8 @@ class DataStorage(Plugin):
                 data_dir,
                 root_dir,
                 warn_save,
+                content_hash,
+                binary,
             )
 
     def deserialise_data(
@@ -417,8 +423,33 @@ class DataStorage(Plugin):
         data_dir="data",
         root_dir=None,
         warn_save=True,
+        incremental=False,
+        binary=False,
     ) -> dict[str, Any]:
-        self.serialise_data(data_pool, data_pool, data_dir, root_dir, warn_save)
+        """Save the data in the pool, replacing it with SerialBox objects.
+
+        If incremental is True, data files are named by the hash of their
+        contents and entries with a saved SerialBox record for the same
+        data_dir and root_dir (see get_saved_box) whose file still exists
+        are not saved again. The saved records of the pool are then
+        updated.
+
+        If binary is True, structures that support it save their data in
+        a binary format rather than JSON (see Structure.save_value).
+        """
+
+        if incremental:
+            self._restore_saved_boxes(data_pool, data_dir, root_dir)
+
+        self.serialise_data(
+            data_pool,
+            data_pool,
+            data_dir,
+            root_dir,
+            warn_save,
+            content_hash=incremental,
+            binary=binary,
+        )
 
         data = {}
         links = data_pool.mirror_links()
@@ -426,6 +457,10 @@ class DataStorage(Plugin):
         for index in data_pool:
             box = data_pool.get(index)
             assert isinstance(box, SerialBox)
+
+            if incremental:
+                self.set_saved_box(data_pool, index, box, data_dir, root_dir)
+
             data[index] = {
                 "identifier": box.identifier,
                 "load_dict": box.load_dict,
@@ -438,6 +473,44 @@ class DataStorage(Plugin):
             "links": links,
         }
 
+    def set_saved_box(
+        self,
+        data_pool: DataPool,
+        data_index: str,
+        data_box: SerialBox,
+        data_dir="data",
+        root_dir=None,
+    ):
+        """Record that the given pool entry is saved by data_box, in a file
+        under data_dir. The record is only used by get_saved_box for the
+        same data_dir and root_dir."""
+
+        location = _get_save_location(data_dir, root_dir)
+        data_pool.set_saved(data_index, (location, data_box))
+
+    def get_saved_box(
+        self,
+        data_pool: DataPool,
+        data_index: str,
+        data_dir="data",
+        root_dir=None,
+    ) -> SerialBox | None:
+        """Return the SerialBox recorded by set_saved_box for the given pool
+        entry, or None if the entry was not saved to data_dir and root_dir
+        since it was last changed."""
+
+        record = data_pool.get_saved(data_index)
+
+        if record is None:
+            return None
+
+        location, data_box = record
+
+        if location != _get_save_location(data_dir, root_dir):
+            return None
+
+        return data_box
+
     def deserialise_pool(
         self,
         serial_pool: DataPool | dict[str, Any],
@@ -445,7 +518,13 @@ class DataStorage(Plugin):
         root_dir=None,
         warn_missing=False,
         warn_load=False,
+        lazy=False,
     ):
+        """Convert the SerialBox objects in the given pool to Data objects.
+        If lazy is True, each SerialBox is only loaded when first retrieved
+        from the pool, so the files under root_dir must persist until then.
+        """
+
         if isinstance(serial_pool, DataPool):
             data_pool = serial_pool
         else:
@@ -462,6 +541,23 @@ class DataStorage(Plugin):
             data_pool._data = data
             data_pool._links = serial_pool["links"]
 
+        if lazy:
+            data_indexes = [
+                index
+                for index in data_pool
+                if isinstance(data_pool.get(index), SerialBox)
+            ]
+            loader = partial(
+                self._load_box,
+                data_catalog,
+                root_dir=root_dir,
+                warn_missing=warn_missing,
+                warn_load=warn_load,
+            )
+            data_pool.set_loader(loader, data_indexes)
+
+            return data_pool
+
         self.deserialise_data(
             data_catalog,
             data_pool,
@@ -482,11 +578,8 @@ class DataStorage(Plugin):
         for var_id in var_ids:
             data_index = datastate.get_index(var_id)
             data_obj = data_pool.get(data_index)
-            new_data_obj = deepcopy(data_obj)
 
-            self.add_data_to_state(
-                new_pool, new_datastate, var_id, new_data_obj
-            )
+            self.add_data_to_state(new_pool, new_datastate, var_id, data_obj)
 
         return new_pool, new_datastate
 
@@ -545,6 +638,8 @@ class DataStorage(Plugin):
         data_dir,
         root_dir=None,
         warn_save=True,
+        content_hash=False,
+        binary=False,
     ):
         data_obj = data_pool.get(data_index)
 
@@ -554,10 +649,21 @@ class DataStorage(Plugin):
         structure_name = data_obj.get_structure_name()
         data_structure = self.get_structure(structure_name)
 
-        root_path = os.path.join(data_dir, data_index)
+        # Files to be renamed by content are first written to a unique name,
+        # so that files referenced by a previous save are never overwritten
+        if content_hash:
+            root_name = "{}_{}".format(data_index, uuid.uuid4().hex)
+        else:
+            root_name = data_index
+
+        root_path = os.path.join(data_dir, root_name)
 
         try:
-            file_path = data_structure.save_value(data_obj._data, root_path)
+            file_path = data_structure.save_value(
+                data_obj._data,
+                root_path,
+                binary=binary,
+            )
         except Exception:
             msgStr = (
                 "Saving of data with index {} failed with an unexpected "
@@ -569,6 +675,9 @@ class DataStorage(Plugin):
             else:
                 raise Exception(msgStr)
 
+        if content_hash:
+            file_path = _move_to_content_path(file_path)
+
         if root_dir is None:
             store_path = str(file_path)
         else:
@@ -584,6 +693,26 @@ class DataStorage(Plugin):
         data_box = SerialBox(identifier, load_dict)
         data_pool.replace(data_index, data_box)
 
+    def _restore_saved_boxes(self, data_pool, data_dir, root_dir=None):
+        for data_index in data_pool:
+            data_box = self.get_saved_box(
+                data_pool,
+                data_index,
+                data_dir,
+                root_dir,
+            )
+
+            if data_box is None:
+                continue
+
+            file_path = Path(data_box.load_dict["file_path"])
+
+            if root_dir is not None:
+                file_path = Path(root_dir) / file_path
+
+            if file_path.is_file():
+                data_pool.replace(data_index, data_box)
+
     def _convert_box_to_data(
         self,
         data_catalog,
@@ -598,6 +727,26 @@ class DataStorage(Plugin):
         if not isinstance(data_box, SerialBox):
             return
 
+        data_obj = self._load_box(
+            data_catalog,
+            data_index,
+            data_box,
+            root_dir,
+            warn_missing=warn_missing,
+            warn_load=warn_load,
+        )
+
+        data_pool.replace(data_index, data_obj)
+
+    def _load_box(
+        self,
+        data_catalog,
+        data_index,
+        data_box,
+        root_dir=None,
+        warn_missing=False,
+        warn_load=False,
+    ) -> Data:
         file_path = Path(data_box.load_dict["file_path"])
         structure_name = data_box.load_dict["structure_name"]
 
@@ -609,7 +758,10 @@ class DataStorage(Plugin):
         data_structure = self.get_structure(structure_name)
 
         try:
-            data = data_structure.load_data(load_path)
+            if load_path.suffix == ".json":
+                data = data_structure.load_data(load_path)
+            else:
+                data = data_structure.load_binary(load_path)
         except Exception:
             msgStr = (
                 "Deserializing of data with id {} failed with an "
@@ -637,7 +789,7 @@ class DataStorage(Plugin):
 
             data_obj = Data(data_box.identifier, structure_name, None)
 
-        data_pool.replace(data_index, data_obj)
+        return data_obj
 
     def _make_data(self, data_catalog, identifier, data, warn_missing=False):
         if not self.is_valid(data_catalog, identifier):
@@ -670,3 +822,30 @@ def _check_valid_datastate(datastate):
             "but recieved {}."
         ).format(datastate.__class__.__name__)
         raise ValueError(errStr)
+
+
+def _get_save_location(data_dir, root_dir=None) -> tuple[str, str | None]:
+    """Return the resolved data and root directories of a save, which
+    identify where the files recorded by SerialBox objects are stored"""
+
+    if root_dir is not None:
+        root_dir = os.path.realpath(root_dir)
+
+    return os.path.realpath(data_dir), root_dir
+
+
+def _move_to_content_path(file_path: Path) -> Path:
+    """Rename the given file using the hash of its contents. If a file with
+    the same contents already exists, the given file is removed."""
+
+    with open(file_path, "rb") as fstream:
+        digest = hashlib.file_digest(fstream, "sha1").hexdigest()
+
+    content_path = file_path.with_name(digest + file_path.suffix)
+
+    if content_path.is_file():
+        file_path.unlink()
+    else:
+        file_path.replace(content_path)
+
+    return content_path
@@ -15,6 +15,7 @@ from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from ..boundary.data import SerialBox
 from ..boundary.interface import MaskVariable
@@ -42,6 +43,9 @@ class Loader:
 
     def __init__(self, datastore: DataStorage):
         self._store: DataStorage = datastore
+        self._merge_indexes: WeakKeyDictionary[Simulation, _MergeIndex] = (
+            WeakKeyDictionary()
+        )
 
     def get_structure(self, structure_class_name):
         cls = self._store.get_structure(structure_class_name)
@@ -353,25 +357,31 @@ class Loader:
         variable have None value when merging a state it should be deleted
         from the final output."""
 
-        active_states = simulation.mirror_active_states()
-
         log_msg = "Merging active DataStates."
         module_logger.debug(log_msg)
 
-        if not active_states:
+        if not simulation._active_states:
             return None
 
+        if remove_none_keys:
+            merge_index = self._merge_indexes.get(simulation)
+
+            if merge_index is None:
+                merge_index = _MergeIndex()
+                self._merge_indexes[simulation] = merge_index
+
+            merged_map = merge_index.update(simulation._active_states)
+
+            return PseudoState(dict(merged_map), level)
+
         merged_map = {}
 
-        for state in active_states:
+        for state in simulation._active_states:
             # Loop if the state is masked.
             if state.ismasked():
                 continue
 
-            data_map = state.mirror_map()
-            merged_map = self._update_dict(
-                merged_map, data_map, remove_none_keys
-            )
+            merged_map = self._update_dict(merged_map, state.mirror_map())
 
         merged_state = PseudoState(merged_map, level)
 
@@ -388,7 +398,7 @@ class Loader:
             final_dict.update(add_data)
 
         else:
-            final_dict = deepcopy(old_dict)
+            final_dict = dict(old_dict)
             final_dict.update(new_dict)
 
         return final_dict
@@ -1181,6 +1191,104 @@ class Controller(Loader):
         simulation.set_merged_state(merged_state)
 
 
+class _MergeIndex:
+    """Incrementally maintained merge of the active states of a simulation.
+
+    For each variable, the stack of active states which contain it is
+    recorded, in order, so that adding, masking, unmasking or removing a
+    state only updates the merged indexes of the variables in that state.
+    Active states are identified by object identity and are assumed not to
+    change their contents while they are active. The identifiers of each
+    state are recorded when it is added, as removed states may have been
+    cleared.
+    """
+
+    def __init__(self):
+        self._states: list[DataState] = []
+        self._masked: list[bool] = []
+        self._identifiers: list[tuple[str, ...]] = []
+        self._stacks: dict[str, list[DataState]] = {}
+        self._merged: dict[str, str] = {}
+
+    def update(self, active_states: list[DataState]) -> dict[str, str]:
+        """Synchronise the index with the given active states and return
+        the merged map of variable identifiers to data indexes. The
+        returned dictionary is owned by the index and must not be
+        modified."""
+
+        active_ids = set(id(state) for state in active_states)
+        records = zip(self._states, self._masked, self._identifiers)
+        kept = []
+        affected: set[str] = set()
+
+        for state, masked, identifiers in records:
+            if id(state) in active_ids:
+                kept.append((state, masked, identifiers))
+                continue
+
+            for var_id in identifiers:
+                self._stacks[var_id].remove(state)
+                affected.add(var_id)
+
+        # Rebuild if the surviving states have been reordered or replaced
+        if any(old[0] is not new for old, new in zip(kept, active_states)):
+            self._rebuild(active_states)
+            return self._merged
+
+        for state, masked, identifiers in kept:
+            if state.ismasked() != masked:
+                affected.update(identifiers)
+
+        added = [
+            tuple(state.get_identifiers())
+            for state in active_states[len(kept) :]
+        ]
+
+        for state, identifiers in zip(active_states[len(kept) :], added):
+            for var_id in identifiers:
+                self._stacks.setdefault(var_id, []).append(state)
+                affected.add(var_id)
+
+        self._states = list(active_states)
+        self._masked = [state.ismasked() for state in active_states]
+        self._identifiers = [record[2] for record in kept] + added
+
+        for var_id in affected:
+            self._resolve(var_id)
+
+        return self._merged
+
+    def _rebuild(self, active_states: list[DataState]):
+        self._states = []
+        self._masked = []
+        self._identifiers = []
+        self._stacks = {}
+        self._merged = {}
+        self.update(active_states)
+
+    def _resolve(self, var_id: str):
+        # The last unmasked state containing the variable sets its index. A
+        # None index removes the variable from the merged map.
+        stack = self._stacks.get(var_id, [])
+
+        if not stack:
+            self._stacks.pop(var_id, None)
+
+        for state in reversed(stack):
+            if state.ismasked():
+                continue
+
+            data_index = state.get_index(var_id)
+
+            if data_index is None:
+                break
+
+            self._merged[var_id] = data_index
+            return
+
+        self._merged.pop(var_id, None)
+
+
 def _copy_sim_class(simulation, force_title=None, null_title=False):
     # Set the title
     if null_title:
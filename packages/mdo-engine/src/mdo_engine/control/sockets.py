@@ -20,6 +20,8 @@ class Socket(Plugin):
     def __init__(self):
         super(Socket, self).__init__()
         self._interface_classes = {}
+        self._providers = None
+        self._receivers = None
 
     def discover_interfaces(self, package, super_cls, warn_import=False):
         """Retrieve all of the interfaces. Should be abstract?"""
@@ -29,24 +31,29 @@ class Socket(Plugin):
 
         cls_map = self._discover_plugins(package, super_cls, warn_import)
         self._interface_classes.update(cls_map)
+        self._clear_index()
 
     def add_interface(self, interface_class):
-        self._interface_classes[interface_class.__name__] = interface_class
+        cls_name = interface_class.__name__
+
+        # Replacing an interface invalidates the index
+        if cls_name in self._interface_classes:
+            self._clear_index()
+
+        self._interface_classes[cls_name] = interface_class
+
+        if self._providers is not None:
+            self._index_interface(cls_name, interface_class)
 
     def get_all_variables(self):
         """Return a unique list of all valid variables available from the
         interfaces discovered."""
 
-        all_vars = set()
-
-        # Work through the interfaces
-        for cls_name, cls_attr in self._interface_classes.items():
-            inputs, _ = cls_attr.get_inputs(True)
-            outputs = cls_attr.get_outputs()
+        self._build_index()
+        assert self._providers is not None
+        assert self._receivers is not None
 
-            all_vars = set([])
-            all_vars = all_vars.union(set(inputs))
-            all_vars = all_vars.union(set(outputs))
+        all_vars = set(self._providers).union(self._receivers)
 
         return list(all_vars)
 
@@ -56,16 +63,10 @@ class Socket(Plugin):
 
         Maybe this should output the interface types as well?"""
 
-        providing_interfaces = []
+        self._build_index()
+        assert self._providers is not None
 
-        # Work through the interfaces
-        for cls_name, cls_attr in self._interface_classes.items():
-            outputs = cls_attr.get_outputs()
-
-            if variable_id in outputs:
-                providing_interfaces.append(cls_name)
-
-        return providing_interfaces
+        return list(self._providers.get(variable_id, []))
 
     def get_receiving_interfaces(self, variable_id):
         """Return a list of interfaces that use the given variable identifier
@@ -73,18 +74,10 @@ class Socket(Plugin):
 
         Maybe this should output the interface types as well?"""
 
-        receiving_interfaces = []
-
-        # Work through the interfaces
-        for cls_name, cls_attr in self._interface_classes.items():
-            inputs, _ = cls_attr.get_inputs(True)
-
-            for input_var in inputs:
-                if variable_id == input_var:
-                    receiving_interfaces.append(cls_name)
-                    break
+        self._build_index()
+        assert self._receivers is not None
 
-        return receiving_interfaces
+        return list(self._receivers.get(variable_id, []))
 
     def get_interface_object(self, interface_cls_name):
         """Return an instance of the interface class given by the interface
@@ -140,6 +133,36 @@ class Socket(Plugin):
 
         return cls_attr
 
+    def _clear_index(self):
+        self._providers = None
+        self._receivers = None
+
+    def _build_index(self):
+        """Build the maps from variable identifiers to the names of the
+        interfaces which provide or receive them, if not already built."""
+
+        if self._providers is not None:
+            return
+
+        self._providers = {}
+        self._receivers = {}
+
+        for cls_name, cls_attr in self._interface_classes.items():
+            self._index_interface(cls_name, cls_attr)
+
+    def _index_interface(self, cls_name, cls_attr):
+        assert self._providers is not None
+        assert self._receivers is not None
+
+        inputs, _ = cls_attr.get_inputs(True)
+        outputs = cls_attr.get_outputs()
+
+        for var_id in set(outputs):
+            self._providers.setdefault(var_id, []).append(cls_name)
+
+        for var_id in set(inputs):
+            self._receivers.setdefault(var_id, []).append(cls_name)
+
 
 class NamedSocket(Socket):
     """Class to aquire data from a named interface type."""
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from collections import OrderedDict
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from copy import deepcopy
 from typing import Any
 
@@ -61,6 +61,8 @@ class DataCatalog:
     entered data is validated against this catalog.
 
     The variable map links variable identifiers to metadata class objects.
+    MetaData objects are shared with callers of get_metadata and must not be
+    modified.
     """
 
     def __init__(self):
@@ -105,7 +107,7 @@ class DataCatalog:
             ).format(variable_id)
             raise KeyError(errStr)
 
-        return deepcopy(metadata)
+        return metadata
 
     def filter_by_meta(self, meta_attr, value):
         """Get the MetaData with a given attribute and value"""
@@ -141,13 +143,53 @@ class DataPool:
     serialising simulations or a group of simulations more straightfoward.
 
     The pool must track the number of links to each data object, so that
-    only necessary copies are created.
+    only necessary copies are created. Data objects are never modified in
+    place (changes are made using replace) so copies of the pool, and of
+    entries within it, share the stored objects by reference.
+
+    Entries can be marked as deferred using set_loader, in which case they
+    are converted by the loader when first retrieved.
+
+    The pool can also record where each entry was last saved (see
+    set_saved). The record is dropped when the entry is replaced or popped.
     """
 
     def __init__(self):
         self._data_indexes: set[str] = set()
         self._data: dict[str, Any] = {}
         self._links: dict[str, int] = {}
+        self._loader: Callable[[str, Any], Any] | None = None
+        self._deferred: set[str] = set()
+        self._saved: dict[str, Any] = {}
+
+    @property
+    def loader(self):
+        return self._loader
+
+    def set_loader(self, loader: Callable[[str, Any], Any], data_indexes):
+        """Defer loading of the data with the given indexes until it is
+        retrieved. The loader is called with the data index and the stored
+        value and should return the value to replace it."""
+
+        self._loader = loader
+        self._deferred = set(data_indexes)
+
+    def is_deferred(self, data_index):
+        return data_index in self._deferred
+
+    def load_deferred(self):
+        """Load all remaining deferred data"""
+
+        for data_index in list(self._deferred):
+            self._load(data_index)
+
+    def get_saved(self, data_index):
+        """Return the record of the last save of the given entry, or None if
+        it has not been saved since it was last changed"""
+        return self._saved.get(data_index)
+
+    def set_saved(self, data_index, record):
+        self._saved[data_index] = record
 
     def add(self, data, data_index=None, links=0):
         #        print "\nadd:", self._data.keys()
@@ -164,6 +206,9 @@ class DataPool:
     def get(self, data_index):
         #        print "\nget:", self._data.keys()
 
+        if data_index in self._deferred:
+            self._load(data_index)
+
         data = self._data[data_index]
 
         return data
@@ -171,9 +216,8 @@ class DataPool:
     def copy(self, data_index):
         #        print "\ncopy:", self._data.keys()
 
-        data = self._data[data_index]
-        copy_data = deepcopy(data)
-        copy_index = self.add(copy_data)
+        data = self.get(data_index)
+        copy_index = self.add(data)
 
         return copy_index
 
@@ -181,11 +225,15 @@ class DataPool:
         #        print "\nreplace:", self._data.keys()
 
         self._data[data_index] = data
+        self._deferred.discard(data_index)
+        self._saved.pop(data_index, None)
 
     def pop(self, data_index):
         #        print "\npop:", self._data.keys()
 
         self._data_indexes.remove(data_index)
+        self._deferred.discard(data_index)
+        self._saved.pop(data_index, None)
         data = self._data.pop(data_index)
         self._links.pop(data_index)
 
@@ -232,11 +280,15 @@ class DataPool:
         if not equals:
             return False
 
-        for index, value in self._data.items():
+        for index in list(self._data):
             if index not in other._data:
                 return False
-            if value != other._data[index]:
-                print(value, other._data[index])
+
+            value = self.get(index)
+            other_value = other.get(index)
+
+            if value != other_value:
+                print(value, other_value)
                 return False
 
         return True
@@ -247,6 +299,32 @@ class DataPool:
     def __iter__(self):
         return iter(self._data_indexes)
 
+    def __copy__(self):
+        # The stored data objects and the loader are shared
+        result = self.__class__()
+
+        result._data_indexes = set(self._data_indexes)
+        result._data = dict(self._data)
+        result._links = dict(self._links)
+        result._loader = self._loader
+        result._deferred = set(self._deferred)
+        result._saved = dict(self._saved)
+
+        return result
+
+    def __deepcopy__(self, memo):
+        # Stored objects are immutable, so a deep copy need not copy them
+        result = self.__copy__()
+        memo[id(self)] = result
+
+        return result
+
+    def _load(self, data_index):
+        assert self._loader is not None
+        data = self._loader(data_index, self._data[data_index])
+        self._data[data_index] = data
+        self._deferred.discard(data_index)
+
 
 class BaseState:
     """Base class for NameState and DataState"""
@@ -395,7 +473,8 @@ class DataState(BaseState):
 
 
 class Data:
-    """Holds a unit of data in various formats."""
+    """Holds a unit of data in various formats. Data objects may be shared
+    between pools and must not be modified once added to a pool."""
 
     def __init__(self, identifier, structure_name, data):
         self._id = identifier
@@ -5,6 +5,10 @@ Created on Tue Sep 25 15:11:50 2018
 @author: Mathew Topper
 """
 
+import json
+
+import pytest
+
 from mdo_engine.boundary.data import Structure
 
 
@@ -29,6 +33,39 @@ class ConcreteStructure(Structure):
             raise RuntimeError(f"Version {version} not recognised")
 
 
+class BinaryStructure(Structure):
+    binary_suffix = ".bin"
+
+    @property
+    def version(self):
+        return 1
+
+    def get_data(self, raw, meta_data):
+        return raw
+
+    def get_value(self, data):
+        return data
+
+    @staticmethod
+    def toText(data):
+        return json.dumps(data)
+
+    @staticmethod
+    def fromText(data, version):
+        return json.loads(data)
+
+    @staticmethod
+    def toBinary(value, file_path, version):
+        file_path.write_bytes(bytes([version]) + value.encode())
+
+    @staticmethod
+    def fromBinary(file_path):
+        data = file_path.read_bytes()
+        if data[0] != 1:
+            raise RuntimeError(f"Version {data[0]} not recognised")
+        return data[1:].decode()
+
+
 def test_structure_equals():
     test = ConcreteStructure()
     x = test.equals(1, 1)
@@ -41,3 +78,42 @@ def test_structure_not_equals():
     x = test.equals(1, 2)
 
     assert not x
+
+
+def test_structure_save_value_json(tmp_path):
+    test = ConcreteStructure()
+    file_path = test.save_value(None, tmp_path / "test")
+
+    assert file_path.suffix == ".json"
+    assert json.loads(file_path.read_text()) == {"version": 1, "data": ""}
+
+
+def test_structure_save_value_binary(tmp_path):
+    test = BinaryStructure()
+    file_path = test.save_value("test", tmp_path / "test", binary=True)
+
+    assert file_path.suffix == ".bin"
+    assert test.load_binary(file_path) == "test"
+
+
+def test_structure_save_value_binary_default_json(tmp_path):
+    test = BinaryStructure()
+    file_path = test.save_value("test", tmp_path / "test")
+
+    assert file_path.suffix == ".json"
+    assert test.load_data(file_path) == "test"
+
+
+def test_structure_save_value_binary_none(tmp_path):
+    test = BinaryStructure()
+    file_path = test.save_value(None, tmp_path / "test", binary=True)
+
+    assert file_path.suffix == ".json"
+    assert test.load_data(file_path) is None
+
+
+def test_structure_load_binary_bad_suffix(tmp_path):
+    test = ConcreteStructure()
+
+    with pytest.raises(ValueError, match="can not load binary file"):
+        test.load_binary(tmp_path / "test.bin")
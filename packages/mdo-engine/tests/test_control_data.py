@@ -11,7 +11,8 @@ import os
 
 # import sys
 import shutil
-from copy import deepcopy
+from copy import copy, deepcopy
+from pathlib import Path
 
 import pytest
 
@@ -416,6 +417,38 @@ def test_deserialise_data(tmpdir):
     assert new_data._data == "Tidal"
 
 
+def test_deserialise_data_binary(tmpdir, mocker):
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    data_store.discover_structures(data)
+
+    data_index = pool.add(
+        SerialBox(
+            "Technology:Common:DeviceType",
+            {
+                "file_path": str(tmpdir.join("test.bin")),
+                "structure_name": "Simple",
+            },
+        )
+    )
+    structure = data_store.get_structure("Simple")
+    load_binary = mocker.patch.object(
+        structure, "load_binary", return_value="Tidal"
+    )
+    load_data = mocker.spy(structure, "load_data")
+
+    data_store.deserialise_data(catalog, pool, [data_index])
+    new_data = pool.get(data_index)
+
+    assert load_binary.called
+    assert not load_data.called
+    assert isinstance(new_data, Data)
+    assert new_data._data == "Tidal"
+
+
 def test_serialise_data_root(tmpdir):
     catalog = DataCatalog()
     validation = DataValidation(meta_cls=data.MyMetaData)
@@ -502,6 +535,131 @@ def test_serialise_pool(tmpdir):
     assert result["data"][data_index]["load_dict"] == data_box.load_dict
 
 
+@pytest.mark.parametrize("binary", [False, True])
+def test_serialise_pool_binary(tmpdir, mocker, binary):
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    state = DataState("test")
+    data_store.discover_structures(data)
+
+    metadata = catalog.get_metadata("Technology:Common:DeviceType")
+    data_store.create_new_data(pool, state, catalog, "Tidal", metadata)
+
+    save_value = mocker.spy(data_store.get_structure("Simple"), "save_value")
+
+    if binary:
+        data_store.serialise_pool(pool, str(tmpdir), binary=True)
+    else:
+        data_store.serialise_pool(pool, str(tmpdir))
+
+    assert save_value.call_args.kwargs["binary"] is binary
+
+
+def test_serialise_pool_incremental(tmpdir, mocker):
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    state = DataState("test")
+    data_store.discover_structures(data)
+
+    metadata = catalog.get_metadata("Technology:Common:DeviceType")
+    data_store.create_new_data(pool, state, catalog, "Tidal", metadata)
+
+    data_index = state.get_index("Technology:Common:DeviceType")
+    data_obj = pool.get(data_index)
+
+    result = data_store.serialise_pool(
+        copy(pool),
+        str(tmpdir),
+        incremental=True,
+    )
+
+    assert pool.get_saved(data_index) is None
+
+    load_dict = result["data"][data_index]["load_dict"]
+    file_path = Path(load_dict["file_path"])
+    assert file_path.is_file()
+    assert file_path.stem != data_index
+
+    pool_copy = copy(pool)
+    data_store.set_saved_box(
+        pool_copy,
+        data_index,
+        SerialBox(data_obj.get_id(), load_dict),
+        str(tmpdir),
+    )
+    save_value = mocker.spy(data_store.get_structure("Simple"), "save_value")
+
+    result = data_store.serialise_pool(pool_copy, str(tmpdir), incremental=True)
+
+    assert not save_value.called
+    assert result["data"][data_index]["load_dict"] == load_dict
+
+    saved_box = data_store.get_saved_box(pool_copy, data_index, str(tmpdir))
+    assert saved_box.load_dict == load_dict
+    assert pool.get(data_index) is data_obj
+
+
+def test_serialise_pool_incremental_other_dir(tmpdir, mocker):
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    state = DataState("test")
+    data_store.discover_structures(data)
+
+    metadata = catalog.get_metadata("Technology:Common:DeviceType")
+    data_store.create_new_data(pool, state, catalog, "Tidal", metadata)
+
+    data_index = state.get_index("Technology:Common:DeviceType")
+
+    first_dir = tmpdir.mkdir("first")
+    second_dir = tmpdir.mkdir("second")
+
+    # Save relative to the root directories, so that the recorded file path
+    # exists under both roots
+    for root_dir in (first_dir, second_dir):
+        pool_copy = copy(pool)
+        data_store.serialise_pool(
+            pool_copy,
+            str(root_dir.mkdir("pool")),
+            root_dir=str(root_dir),
+            incremental=True,
+        )
+
+    data_box = data_store.get_saved_box(
+        pool_copy,
+        data_index,
+        str(second_dir.join("pool")),
+        str(second_dir),
+    )
+    assert first_dir.join(data_box.load_dict["file_path"]).isfile()
+
+    data_store.set_saved_box(
+        pool,
+        data_index,
+        data_box,
+        str(second_dir.join("pool")),
+        str(second_dir),
+    )
+    save_value = mocker.spy(data_store.get_structure("Simple"), "save_value")
+
+    data_store.serialise_pool(
+        copy(pool),
+        str(first_dir.join("pool")),
+        root_dir=str(first_dir),
+        incremental=True,
+    )
+
+    assert save_value.called
+
+
 def test_deserialise_pool(tmpdir):
     catalog = DataCatalog()
     validation = DataValidation(meta_cls=data.MyMetaData)
@@ -526,6 +684,41 @@ def test_deserialise_pool(tmpdir):
     assert new_data._data == "Tidal"
 
 
+def test_deserialise_pool_lazy(tmpdir, mocker):
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    state = DataState("test")
+    data_store.discover_structures(data)
+
+    metadata = catalog.get_metadata("Technology:Common:DeviceType")
+    data_store.create_new_data(pool, state, catalog, "Tidal", metadata)
+
+    data_index = state.get_index("Technology:Common:DeviceType")
+
+    serial_pool = data_store.serialise_pool(pool, str(tmpdir))
+    load_box = mocker.spy(data_store, "_load_box")
+
+    new_pool = data_store.deserialise_pool(serial_pool, catalog, lazy=True)
+
+    assert new_pool.is_deferred(data_index)
+    assert not load_box.called
+
+    copy_pool = deepcopy(new_pool)
+    new_data = new_pool.get(data_index)
+
+    assert load_box.call_count == 1
+    assert not new_pool.is_deferred(data_index)
+    assert isinstance(new_data, Data)
+    assert new_data._data == "Tidal"
+
+    assert copy_pool.is_deferred(data_index)
+    assert copy_pool.get(data_index)._data == "Tidal"
+    assert load_box.call_count == 2
+
+
 def test_deserialise_pool_warn_missing(tmpdir):
     catalog = DataCatalog()
     validation = DataValidation(meta_cls=data.MyMetaData)
@@ -799,7 +992,7 @@ def test_create_pool_subset():
     new_data_index = new_state.get_index("my:test:variable")
     new_data_obj = new_pool.get(new_data_index)
 
-    assert orig_data_obj._data is not new_data_obj._data
+    assert orig_data_obj is new_data_obj
 
     orig_data_value = data_store.get_data_value(
         pool, state2, "my:test:variable"
@@ -885,3 +1078,42 @@ def test_check_valid_datastate_error():
 
     with pytest.raises(ValueError):
         _check_valid_datastate(data_obj)
+
+
+def test_get_metadata_shared():
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+
+    metadata = catalog.get_metadata("my:test:variable")
+
+    assert catalog.get_metadata("my:test:variable") is metadata
+
+
+def test_pool_copy_shared():
+    catalog = DataCatalog()
+    validation = DataValidation(meta_cls=data.MyMetaData)
+    validation.update_data_catalog_from_definitions(catalog, data)
+    data_store = DataStorage(data)
+    pool = DataPool()
+    state = DataState("test")
+
+    metadata = catalog.get_metadata("my:test:variable")
+    data_store.create_new_data(pool, state, catalog, ["apples"], metadata)
+
+    data_index = state.get_index("my:test:variable")
+    data_obj = pool.get(data_index)
+
+    copy_index = pool.copy(data_index)
+    pool_copy = deepcopy(pool)
+
+    assert copy_index != data_index
+    assert pool.get(copy_index) is data_obj
+    assert pool_copy is not pool
+    assert pool_copy.get(data_index) is data_obj
+
+    new_data = Data("my:test:variable", data_obj.get_structure_name(), None)
+    pool_copy.replace(data_index, new_data)
+
+    assert pool.get(data_index) is data_obj
+    assert pool_copy.get(data_index) is new_data
@@ -9,7 +9,7 @@ import os
 import pytest
 
 import mdo_engine.test.interfaces as interfaces
-from mdo_engine.control.sockets import NamedSocket
+from mdo_engine.control.sockets import NamedSocket, Socket
 from mdo_engine.test.interfaces.sptfile import SPTInterface
 
 from . import interface_plugins as interface_plugins
@@ -45,6 +45,55 @@ def test_get_providing_interfaces():
     assert "SPTInterface" in providers
 
 
+def _make_interface_cls(cls_name, inputs, outputs):
+    def get_inputs(cls, drop_masks=False):
+        return inputs, []
+
+    def get_outputs(cls):
+        return outputs
+
+    return type(
+        cls_name,
+        (),
+        {
+            "get_inputs": classmethod(get_inputs),
+            "get_outputs": classmethod(get_outputs),
+        },
+    )
+
+
+def test_get_providing_interfaces_add_interface():
+    socket = Socket()
+    socket.add_interface(_make_interface_cls("First", ["a"], ["b"]))
+
+    assert socket.get_providing_interfaces("b") == ["First"]
+    assert socket.get_receiving_interfaces("a") == ["First"]
+
+    socket.add_interface(_make_interface_cls("Second", ["b", "b"], ["c"]))
+
+    assert socket.get_providing_interfaces("c") == ["Second"]
+    assert socket.get_receiving_interfaces("b") == ["Second"]
+    assert socket.get_providing_interfaces("a") == []
+    assert set(socket.get_all_variables()) == set(["a", "b", "c"])
+
+    # Replace an existing interface
+    socket.add_interface(_make_interface_cls("First", ["d"], ["b"]))
+
+    assert socket.get_receiving_interfaces("a") == []
+    assert socket.get_receiving_interfaces("d") == ["First"]
+    assert socket.get_providing_interfaces("b") == ["First"]
+
+
+def test_get_providing_interfaces_copy():
+    socket = Socket()
+    socket.add_interface(_make_interface_cls("First", ["a"], ["b"]))
+
+    providers = socket.get_providing_interfaces("b")
+    providers.append("Second")
+
+    assert socket.get_providing_interfaces("b") == ["First"]
+
+
 def test_get_interface_object():
     """Test whether an interface instance can be provided"""
 
@@ -1035,3 +1035,106 @@ def test_compact_none_states(controller):
 
     assert len(test) == 5
     assert all_levels == [None, "level1", None, "level2", None]
+
+
+def _get_naive_merge(simulation):
+    merged_map = {}
+
+    for state in simulation._active_states:
+        if state.ismasked():
+            continue
+
+        for var_id, data_index in state.mirror_map().items():
+            if data_index is None:
+                merged_map.pop(var_id, None)
+            else:
+                merged_map[var_id] = data_index
+
+    return merged_map
+
+
+def test_merge_active_states_incremental(controller):
+    new_sim = Simulation("Hello World!")
+
+    new_sim.add_state(DataState("level1", {"a": "1", "b": "2"}))
+    new_sim.add_state(DataState("level2", {"a": "3", "c": "4"}))
+    new_sim.add_state(DataState("level3", {"b": None, "d": "5"}))
+
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == _get_naive_merge(new_sim)
+    assert test.mirror_map() == {"a": "3", "c": "4", "d": "5"}
+
+    controller.mask_states(new_sim, search_str="level3")
+    test = new_sim.get_merged_state()
+    assert test.mirror_map() == _get_naive_merge(new_sim)
+    assert test.mirror_map() == {"a": "3", "b": "2", "c": "4"}
+
+    controller.mask_states(new_sim, search_str="level2")
+    test = new_sim.get_merged_state()
+    assert test.mirror_map() == {"a": "1", "b": "2"}
+
+    controller.unmask_states(new_sim, search_str="level3")
+    test = new_sim.get_merged_state()
+    assert test.mirror_map() == _get_naive_merge(new_sim)
+    assert test.mirror_map() == {"a": "1", "d": "5"}
+
+    new_sim.add_state(DataState("level4", {"c": "6"}))
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == {"a": "1", "c": "6", "d": "5"}
+
+    new_sim.pop_masked_states()
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == _get_naive_merge(new_sim)
+    assert test.mirror_map() == {"a": "1", "c": "6", "d": "5"}
+
+    new_sim.undo_state()
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == {"a": "1", "d": "5"}
+
+
+def test_merge_active_states_undo_new_state(controller):
+    pool = DataPool()
+    new_sim = Simulation("Hello World!")
+
+    for level, value in (("level1", 1), ("level2", 2)):
+        state = DataState(level)
+        data_obj = Data("a", "SeriesData", value)
+        controller._store.add_data_to_state(pool, state, "a", data_obj)
+        new_sim.add_state(state)
+
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == _get_naive_merge(new_sim)
+
+    new_sim.undo_state()
+    new_sim.undo_state()
+
+    assert controller._merge_active_states(new_sim) is None
+
+    # Adding a state clears the undone states
+    removed_states = new_sim.add_state(DataState("level3", {"b": "3"}))
+
+    for state in removed_states:
+        controller._store.remove_state(pool, state)
+
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == {"b": "3"}
+
+
+def test_merge_active_states_reordered(controller):
+    new_sim = Simulation("Hello World!")
+
+    new_sim.add_state(DataState("level1", {"a": "1"}))
+    new_sim.add_state(DataState("level2", {"a": "2"}))
+
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == {"a": "2"}
+
+    new_sim._active_states.reverse()
+
+    test = controller._merge_active_states(new_sim)
+    assert test.mirror_map() == {"a": "1"}
+
+
+def test_merge_active_states_none(controller):
+    new_sim = Simulation("Hello World!")
+    assert controller._merge_active_states(new_sim) is None